@@ -0,0 +1,164 @@
+"""
+Benchmark de las calidades de escalado sobre las imagenes reales del juego.
+Para cada clase de recurso (cartas de los mazos configurados y fondos de los formularios) mide, en cada calidad,
+cuanto tarda obtener las imagenes escaladas y cuanta memoria y disco necesitan, para elegir la calidad
+adecuada en equipos mas lentos. La calidad precalculada necesita haber corrido 'python -m modules.auxiliar bake'.
+
+Uso: python -m benchmarks.bench_calidad_escalado [repeticiones]
+"""
+
+import os
+import sys
+import time
+import statistics
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame as pg
+import modules.variables as var
+import modules.auxiliar as aux
+import modules.atlas as atlas
+import modules.recursos as recursos
+import modules.horneado as horneado
+
+CALIDADES = (var.CALIDAD_RAPIDA, var.CALIDAD_SUAVE, var.CALIDAD_PRECALCULADA)
+
+def listar_pedidos() -> dict:
+    """
+    Arma, por clase de recurso, la lista de imagenes y tamanios que usa el juego.
+
+    Args:
+        Ninguno
+
+    Returns:
+        dict: Diccionario clase -> lista de tuplas (ruta, etiqueta horneada, funcion que calcula el tamanio final)
+    """
+    pedidos = {'cartas': [], 'fondos': []}
+
+    for directorio_mazo in aux.listar_directorios_mazos():
+        for ruta in atlas.listar_imagenes_mazo(directorio_mazo):
+            for porcentaje in (var.CARTA_SIZE_NORMAL, var.CARTA_SIZE_HOVER):
+                pedidos['cartas'].append((
+                    ruta,
+                    horneado.etiqueta_porcentaje(porcentaje),
+                    lambda ancho, alto, porcentaje=porcentaje: recursos.calcular_tamanio_escalado(ancho, alto, porcentaje)
+                ))
+
+    for ruta in sorted(set(var.FONDOS_FORMULARIOS)):
+        if os.path.isfile(ruta):
+            pedidos['fondos'].append((ruta, horneado.etiqueta_tamanio(var.DIMENSION_PANTALLA), lambda ancho, alto: var.DIMENSION_PANTALLA))
+
+    return pedidos
+
+def decodificar_originales(pedidos: list) -> dict:
+    """
+    Decodifica una vez cada imagen original, como lo hace la precarga del juego.
+
+    Args:
+        pedidos: Lista de pedidos de una clase de recurso
+
+    Returns:
+        dict: Diccionario ruta -> superficie original convertida al formato de pantalla
+    """
+    originales = {}
+    for ruta, etiqueta, calcular_tamanio in pedidos:
+        if ruta not in originales:
+            originales[ruta] = pg.image.load(ruta).convert_alpha()
+    return originales
+
+def medir_calidad(pedidos: list, originales: dict, calidad: str) -> dict:
+    """
+    Obtiene todas las imagenes escaladas de una clase con una calidad y mide tiempo y memoria.
+    Las calidades rapida y suave escalan desde los originales ya decodificados; la precalculada lee
+    los archivos horneados y no necesita los originales.
+
+    Args:
+        pedidos: Lista de pedidos de una clase de recurso
+        originales: Superficies originales decodificadas
+        calidad: Calidad de escalado a medir
+
+    Returns:
+        dict: Tiempo total en ms, bytes de las imagenes escaladas, bytes de originales en memoria y bytes en disco,
+        o None si faltan imagenes horneadas
+    """
+    escaladas = []
+    bytes_disco = 0
+
+    inicio = time.perf_counter()
+    for ruta, etiqueta, calcular_tamanio in pedidos:
+        if calidad == var.CALIDAD_PRECALCULADA:
+            superficie = horneado.cargar_horneada(ruta, etiqueta)
+            if superficie is None:
+                return None
+        else:
+            original = originales[ruta]
+            superficie = recursos.escalar_con_calidad(original, calcular_tamanio(original.get_width(), original.get_height()), calidad)
+        escaladas.append(superficie)
+    tiempo_ms = (time.perf_counter() - inicio) * 1000
+
+    if calidad == var.CALIDAD_PRECALCULADA:
+        bytes_originales = 0
+        for ruta, etiqueta, calcular_tamanio in pedidos:
+            bytes_disco += os.path.getsize(horneado.get_ruta_horneada(ruta, etiqueta))
+    else:
+        bytes_originales = sum(recursos.calcular_bytes_superficie(original) for original in originales.values())
+
+    return {
+        'tiempo_ms': tiempo_ms,
+        'bytes_escaladas': sum(recursos.calcular_bytes_superficie(superficie) for superficie in escaladas),
+        'bytes_originales': bytes_originales,
+        'bytes_disco': bytes_disco
+    }
+
+def imprimir_resultado(clase: str, calidad: str, cantidad: int, mediciones: list[dict]):
+    """
+    Imprime la fila de una clase y calidad con la mediana de los tiempos medidos.
+
+    Args:
+        clase: Clase de recurso
+        calidad: Calidad de escalado
+        cantidad: Cantidad de imagenes escaladas
+        mediciones: Resultados de cada repeticion
+
+    Returns:
+        None
+    """
+    if not mediciones:
+        print(f'{clase:<8} {calidad:<13} sin hornear (python -m modules.auxiliar bake)')
+        return
+
+    tiempo_ms = statistics.median(medicion['tiempo_ms'] for medicion in mediciones)
+    medicion = mediciones[0]
+    print(
+        f'{clase:<8} {calidad:<13} {tiempo_ms:9.1f} ms {tiempo_ms / cantidad:8.3f} ms/img'
+        f' {medicion["bytes_escaladas"] / 2 ** 20:9.1f} MB {medicion["bytes_originales"] / 2 ** 20:10.1f} MB'
+        f' {medicion["bytes_disco"] / 2 ** 20:8.1f} MB'
+    )
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    pg.init()
+    pg.display.set_mode(var.DIMENSION_PANTALLA)
+
+    print(f'{"clase":<8} {"calidad":<13} {"total":>12} {"por imagen":>14} {"escaladas":>12} {"originales":>13} {"disco":>11}')
+    for clase, pedidos in listar_pedidos().items():
+        if not pedidos:
+            continue
+        originales = decodificar_originales(pedidos)
+        for calidad in CALIDADES:
+            mediciones = []
+            for _ in range(repeticiones):
+                medicion = medir_calidad(pedidos, originales, calidad)
+                if medicion is None:
+                    break
+                mediciones.append(medicion)
+            imprimir_resultado(clase, calidad, len(pedidos), mediciones)
+
+    print('escaladas: memoria de las imagenes listas para dibujar; originales: imagenes decodificadas que hay que')
+    print('mantener para escalar en el momento; disco: archivos horneados que se leen en su lugar')
+    pg.quit()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark del dibujo del formulario de stage.
+Compara el tiempo por frame del dibujo original (fondo y radares en cada frame)
+contra el dibujo con la capa estatica cacheada.
+
+Uso: python -m benchmarks.bench_capas_stage [cantidad_frames]
+"""
+
+import os
+import sys
+import time
+import statistics
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame as pg
+import modules.variables as var
+import modules.stage as stage_juego
+import modules.particip_juego as particip_juego
+import modules.forms.form_stage as form_stage
+
+def draw_sin_capa(form_dict_data: dict):
+    """
+    Dibuja el stage como lo hacia antes de la capa estatica: fondo y radares en cada frame.
+
+    Args:
+        form_dict_data: Diccionario con los datos del formulario
+
+    Returns:
+        None
+    """
+    form_dict_data['screen'].blit(form_dict_data.get('surface'), form_dict_data.get('rect'))
+    for widget in form_dict_data.get('widgets_list_estaticos') + form_dict_data.get('widgets_list'):
+        widget.draw()
+    stage_juego.draw_jugadores(form_dict_data.get('stage'))
+    form_stage.draw_bonus_widgets(form_dict_data)
+    form_stage.draw_critical_effect(form_dict_data)
+
+def medir_frames(funcion_draw, form_dict_data: dict, cantidad_frames: int) -> list[float]:
+    """
+    Mide el tiempo de dibujo de cada frame en milisegundos.
+
+    Args:
+        funcion_draw: Funcion de dibujo a medir
+        form_dict_data: Diccionario con los datos del formulario
+        cantidad_frames: Cantidad de frames a medir
+
+    Returns:
+        list: Tiempos por frame en milisegundos
+    """
+    for _ in range(10):
+        funcion_draw(form_dict_data)
+
+    tiempos = []
+    for _ in range(cantidad_frames):
+        inicio = time.perf_counter()
+        funcion_draw(form_dict_data)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return tiempos
+
+def resumir(nombre: str, tiempos: list[float]):
+    """
+    Imprime la media y los percentiles 50 y 95 de una serie de tiempos.
+
+    Args:
+        nombre: Nombre de la variante medida
+        tiempos: Tiempos por frame en milisegundos
+
+    Returns:
+        None
+    """
+    percentiles = statistics.quantiles(tiempos, n=100)
+    print(f'{nombre:<12} media: {statistics.mean(tiempos):6.3f} ms | p50: {percentiles[49]:6.3f} ms | p95: {percentiles[94]:6.3f} ms')
+
+def main():
+    cantidad_frames = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+    pg.init()
+    pantalla = pg.display.set_mode(var.DIMENSION_PANTALLA)
+
+    form = form_stage.crear_form_stage({
+        'name': var.FORM_NAMES['STAGE'],
+        'screen': pantalla,
+        'active': True,
+        'coord': (0, 0),
+        'music_path': var.MUSICA_STAGE,
+        'background': var.FONDO_STAGE,
+        'screen_dimensions': var.DIMENSION_PANTALLA,
+        'music_config': {},
+        'jugador': particip_juego.inicializar_participante(pantalla, nombre='PLAYER')
+    })
+    form_stage.iniciar_nueva_partida(form)
+    stage_juego.jugar_mano_stage(form.get('stage'))
+
+    tiempos_antes = medir_frames(draw_sin_capa, form, cantidad_frames)
+    tiempos_despues = medir_frames(form_stage.draw, form, cantidad_frames)
+
+    print(f'Dibujo del stage ({cantidad_frames} frames)')
+    resumir('sin capa', tiempos_antes)
+    resumir('con capa', tiempos_despues)
+    print(f'Mejora: x{statistics.mean(tiempos_antes) / statistics.mean(tiempos_despues):.2f}')
+
+    pg.quit()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,336 @@
+"""
+Benchmark del juego completo sin pantalla.
+Arranca el juego con los drivers de video y audio de SDL en modo dummy y recorre con un guion el menu,
+una partida completa en el stage, el formulario del nombre y el ranking. Todos los frames pasan por
+form_controller.update; de cada uno guarda el tiempo de update y de draw del formulario activo, imprime
+los percentiles 50, 95 y 99 por formulario y guarda los resultados en un JSON que sirve de linea de base
+para comparar cambios de dibujo en una maquina sin pantalla.
+
+El nombre se escribe con eventos de teclado, pero los clics (jugar, cada mano y confirmar el nombre) se hacen
+llamando directamente a la funcion on_click del boton. Los botones de utn_fra no leen eventos: consultan
+pg.mouse.get_pos y pg.mouse.get_pressed, y con el driver dummy ni los eventos MOUSEBUTTONDOWN/UP que se
+publican ni pg.mouse.set_pos cambian ese estado, asi que un clic guionado nunca llega al boton. Ademas cada
+clic real frena el frame con un pg.time.delay(300) del boton, que ensuciaria las mediciones.
+
+Uso: python -m benchmarks.bench_render [--frames N] [--dirty] [--guardar ruta.json] [--comparar ruta.json]
+"""
+
+import os
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame as pg
+import modules.variables as var
+import modules.juego as juego
+import modules.render as render
+import modules.overlay as overlay
+import modules.recursos as recursos
+import modules.particip_juego as particip_juego
+import modules.forms.base_form as base_form
+import modules.forms.form_controller as form_controller
+
+RUTA_LINEA_BASE = f'{var.RUTA_CACHE}/linea_base_render.json'
+PERCENTILES = (50, 95, 99)
+SEMILLA = 317
+NOMBRE_JUGADOR = 'BENCH'
+MAXIMO_MANOS = 200
+
+def crear_juego(pantalla: pg.Surface) -> dict:
+    """
+    Prepara el juego como lo hace dbz_tcg: precarga, cursor, jugador y controlador de formularios.
+
+    Args:
+        pantalla: Superficie principal del juego
+
+    Returns:
+        dict: Controlador de formularios listo para el primer frame
+    """
+    juego.precargar_recursos(pantalla, pg.time.Clock())
+    var.CURSOR_IMG = pg.transform.scale(recursos.cargar_imagen(var.CURSOR_PATH), (40, 65))
+    recursos.descartar_original(var.CURSOR_PATH)
+
+    datos_juego = {
+        'puntaje': 0,
+        'cantidad_vidas': var.CANTIDAD_VIDAS,
+        'player': particip_juego.inicializar_participante(pantalla=pantalla, nombre='PLAYER'),
+        'music_config': {
+            'volume': var.VOLUMEN_INICIAL,
+            'music_on': True
+        }
+    }
+    return form_controller.create_form_controller(pantalla, datos_juego)
+
+def correr_frame(controlador: dict, pantalla: pg.Surface, eventos: list, mediciones: dict):
+    """
+    Corre un frame del bucle principal con los eventos dados y guarda los tiempos del formulario activo.
+
+    Args:
+        controlador: Controlador de formularios
+        pantalla: Superficie principal del juego
+        eventos: Eventos guionados del frame
+        mediciones: Diccionario nombre del form -> {'update': [...], 'draw': [...]}
+
+    Returns:
+        None
+    """
+    render.procesar_eventos(eventos)
+    render.iniciar_update(pantalla)
+    form_controller.update(controlador, eventos)
+    render.presentar(pantalla)
+
+    nombre, tiempo_update, tiempo_draw = controlador.get('tiempos_ultimo_frame')
+    tiempos = mediciones.setdefault(nombre, {'update': [], 'draw': []})
+    tiempos['update'].append(tiempo_update)
+    tiempos['draw'].append(tiempo_draw)
+
+def correr_frames(controlador: dict, pantalla: pg.Surface, cantidad_frames: int, mediciones: dict):
+    """
+    Corre varios frames sin entrada.
+
+    Args:
+        controlador: Controlador de formularios
+        pantalla: Superficie principal del juego
+        cantidad_frames: Cantidad de frames a correr
+        mediciones: Tiempos por formulario
+
+    Returns:
+        None
+    """
+    for _ in range(cantidad_frames):
+        correr_frame(controlador, pantalla, [], mediciones)
+
+def crear_eventos_tecla(caracter: str) -> list:
+    """
+    Arma los eventos de apretar una tecla, como los entrega pygame al escribir.
+
+    Args:
+        caracter: Caracter de la tecla
+
+    Returns:
+        list: Eventos de la tecla
+    """
+    return [pg.event.Event(pg.KEYDOWN, key=pg.key.key_code(caracter.lower()), unicode=caracter, mod=0, scancode=0)]
+
+def pulsar_boton(nombre_form: str, nombre_boton: str):
+    """
+    Hace clic en un boton de un formulario llamando a su funcion on_click con su parametro, como lo hace el boton
+    al detectar el clic del mouse.
+
+    Args:
+        nombre_form: Nombre del formulario
+        nombre_boton: Clave del boton en el formulario
+
+    Returns:
+        None
+    """
+    boton = var.dict_forms_status[nombre_form][nombre_boton]
+    boton.on_click(boton.on_click_param)
+
+def jugar_partida(controlador: dict, pantalla: pg.Surface, frames_por_mano: int, mediciones: dict) -> int:
+    """
+    Juega una partida completa en el stage, una mano cada tantos frames, hasta que termina.
+
+    Args:
+        controlador: Controlador de formularios
+        pantalla: Superficie principal del juego
+        frames_por_mano: Frames que se dejan correr entre mano y mano para las animaciones
+        mediciones: Tiempos por formulario
+
+    Returns:
+        int: Cantidad de manos jugadas
+    """
+    form = var.dict_forms_status[var.FORM_NAMES['STAGE']]
+    manos = 0
+    while not form.get('stage').get('juego_finalizado') and manos < MAXIMO_MANOS:
+        pulsar_boton(var.FORM_NAMES['STAGE'], 'btn_play')
+        manos += 1
+        correr_frames(controlador, pantalla, frames_por_mano, mediciones)
+    return manos
+
+def correr_guion(controlador: dict, pantalla: pg.Surface, cantidad_frames: int) -> dict:
+    """
+    Recorre el juego con el guion: menu, partida completa, nombre del jugador y ranking.
+    Los clics se hacen llamando a la funcion on_click de cada boton (ver la descripcion del modulo).
+
+    Args:
+        controlador: Controlador de formularios
+        pantalla: Superficie principal del juego
+        cantidad_frames: Frames que se quedan en cada formulario sin entrada
+
+    Returns:
+        dict: Tiempos por formulario
+    """
+    mediciones = {}
+
+    correr_frames(controlador, pantalla, cantidad_frames, mediciones)
+
+    pulsar_boton(var.FORM_NAMES['MENU'], 'btn_play')
+    manos = jugar_partida(controlador, pantalla, max(1, cantidad_frames // 10), mediciones)
+    print(f'Partida terminada en {manos} manos')
+
+    # Al terminar la partida el stage deja activo el formulario del nombre
+    correr_frames(controlador, pantalla, cantidad_frames // 2, mediciones)
+    for caracter in NOMBRE_JUGADOR:
+        correr_frame(controlador, pantalla, crear_eventos_tecla(caracter), mediciones)
+    correr_frames(controlador, pantalla, cantidad_frames // 2, mediciones)
+    pulsar_boton(var.FORM_NAMES['NAME'], 'btn_submit')
+
+    correr_frames(controlador, pantalla, cantidad_frames, mediciones)
+    base_form.cambiar_pantalla(var.FORM_NAMES['MENU'])
+    correr_frames(controlador, pantalla, cantidad_frames // 2, mediciones)
+
+    return mediciones
+
+def resumir_tiempos(tiempos: list[float]) -> dict:
+    """
+    Calcula los percentiles de una serie de tiempos.
+
+    Args:
+        tiempos: Tiempos por frame en milisegundos
+
+    Returns:
+        dict: Diccionario 'p50', 'p95', 'p99' -> milisegundos
+    """
+    ordenados = sorted(tiempos)
+    return {f'p{percentil}': round(overlay.calcular_percentil(ordenados, percentil), 4) for percentil in PERCENTILES}
+
+def resumir_mediciones(mediciones: dict) -> dict:
+    """
+    Resume los tiempos de cada formulario en percentiles de update, draw y del frame completo.
+
+    Args:
+        mediciones: Tiempos por formulario
+
+    Returns:
+        dict: Diccionario nombre del form -> resumen
+    """
+    resumen = {}
+    for nombre, tiempos in mediciones.items():
+        resumen[nombre] = {
+            'frames': len(tiempos['update']),
+            'update': resumir_tiempos(tiempos['update']),
+            'draw': resumir_tiempos(tiempos['draw']),
+            'total': resumir_tiempos([update + draw for update, draw in zip(tiempos['update'], tiempos['draw'])])
+        }
+    return resumen
+
+def imprimir_resumen(resumen: dict, linea_base: dict = None):
+    """
+    Imprime una fila por formulario con los percentiles de cada tiempo y, si hay linea de base,
+    la variacion porcentual del p95 del frame completo.
+
+    Args:
+        resumen: Resumen por formulario
+        linea_base: Resumen guardado de una corrida anterior (opcional)
+
+    Returns:
+        None
+    """
+    columnas = ' '.join(f'{f"{medida} p{percentil}":>12}' for medida in ('update', 'draw', 'total') for percentil in PERCENTILES)
+    print(f'{"formulario":<14} {"frames":>6} {columnas}{"  vs base" if linea_base else ""}')
+
+    for nombre, datos in resumen.items():
+        valores = ' '.join(f'{datos[medida][f"p{percentil}"]:9.3f} ms' for medida in ('update', 'draw', 'total') for percentil in PERCENTILES)
+        comparacion = ''
+        if linea_base:
+            base = linea_base.get(nombre)
+            if base and base['total']['p95']:
+                variacion = (datos['total']['p95'] - base['total']['p95']) / base['total']['p95'] * 100
+                comparacion = f'  {variacion:+6.1f}%'
+            else:
+                comparacion = '  sin base'
+        print(f'{nombre:<14} {datos["frames"]:>6} {valores}{comparacion}')
+
+def guardar_linea_base(ruta: str, resumen: dict, opciones: argparse.Namespace):
+    """
+    Guarda el resumen en un archivo JSON junto con los datos de la corrida.
+
+    Args:
+        ruta: Ruta del archivo JSON
+        resumen: Resumen por formulario
+        opciones: Opciones con las que se corrio el benchmark
+
+    Returns:
+        None
+    """
+    directorio = os.path.dirname(ruta)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+
+    with open(ruta, 'w', encoding='utf-8') as file:
+        json.dump({
+            'fecha': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'maquina': platform.platform(),
+            'python': platform.python_version(),
+            'pygame': pg.version.ver,
+            'frames': opciones.frames,
+            'modo_dirty': opciones.dirty,
+            'forms': resumen
+        }, file, indent=4)
+    print(f'Linea de base guardada en {ruta}')
+
+def cargar_linea_base(ruta: str) -> dict:
+    """
+    Carga el resumen por formulario de una linea de base guardada.
+
+    Args:
+        ruta: Ruta del archivo JSON
+
+    Returns:
+        dict: Resumen por formulario, o None si no existe o no es valido
+    """
+    try:
+        with open(ruta, 'r', encoding='utf-8') as file:
+            return json.load(file).get('forms')
+    except (OSError, ValueError):
+        print(f'No se pudo leer la linea de base {ruta}')
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark del juego completo sin pantalla')
+    parser.add_argument('--frames', type=int, default=120, help='frames por formulario sin entrada')
+    parser.add_argument('--dirty', action='store_true', help='dibuja solo las zonas sucias')
+    parser.add_argument('--guardar', default=RUTA_LINEA_BASE, help='ruta del JSON donde se guardan los resultados')
+    parser.add_argument('--comparar', help='JSON de una corrida anterior para comparar')
+    opciones = parser.parse_args()
+
+    # Misma partida en cada corrida, para que las mediciones sean comparables
+    random.seed(SEMILLA)
+
+    # El nombre que se escribe no debe quedar en el ranking real
+    ranking_original = var.RANKING_CSV
+    directorio_temporal = tempfile.mkdtemp()
+    var.RANKING_CSV = os.path.join(directorio_temporal, os.path.basename(ranking_original))
+    if os.path.isfile(ranking_original):
+        shutil.copyfile(ranking_original, var.RANKING_CSV)
+
+    try:
+        pg.init()
+        pantalla = pg.display.set_mode(var.DIMENSION_PANTALLA)
+        render.set_modo_dirty(opciones.dirty)
+
+        controlador = crear_juego(pantalla)
+        mediciones = correr_guion(controlador, pantalla, opciones.frames)
+    finally:
+        var.RANKING_CSV = ranking_original
+        shutil.rmtree(directorio_temporal, ignore_errors=True)
+
+    resumen = resumir_mediciones(mediciones)
+    imprimir_resumen(resumen, cargar_linea_base(opciones.comparar) if opciones.comparar else None)
+    estadisticas_textos = recursos.get_estadisticas_cache_textos()
+    print(f'Cache de textos: {estadisticas_textos["tasa_acierto"] * 100:.1f}% de aciertos '
+          f'({estadisticas_textos["hits"]} aciertos, {estadisticas_textos["misses"]} fallos, {estadisticas_textos["entradas"]} textos)')
+    guardar_linea_base(opciones.guardar, resumen, opciones)
+
+    pg.quit()
+
+if __name__ == '__main__':
+    main()
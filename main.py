@@ -1,7 +1,13 @@
 """
 Punto de entrada principal del juego Dragon Ball Z TCG.
+Con --perfil-inicio (o DBZ_PERFIL_INICIO=1) se mide el arranque y se guarda un reporte en JSON.
 """
 
+import modules.perfilador as perfilador
+
+if perfilador.perfil_solicitado():
+    perfilador.activar() # Antes de importar el juego, para medir tambien sus importaciones
+
 from modules.juego import dbz_tcg
 
 if __name__ == "__main__":
@@ -0,0 +1,257 @@
+"""
+Modulo del almacen de cartas mapeado en memoria.
+Guarda los pixeles de todas las cartas de un mazo, ya escaladas a los tamanios normal y hover, en un unico archivo
+con un indice al principio. Al cargar el mazo el archivo se mapea en memoria y cada carta es una superficie creada
+directamente sobre el mapeo, sin decodificar ni copiar pixeles. Varios procesos del juego comparten esas paginas.
+"""
+
+import json
+import mmap
+import os
+import struct
+import pygame as pg
+import modules.variables as var
+import modules.recursos as recursos
+import modules.atlas as atlas
+
+FIRMA = b'DBZM'
+VERSION = 1
+# Mismo orden de bytes que las superficies convertidas al formato de pantalla, asi el blit no convierte pixeles
+FORMATO_PIXELES = 'BGRA'
+ALINEACION = 64
+# firma, version, largo del indice JSON en bytes
+CABECERA = struct.Struct('<4sHI')
+
+almacenes = {}
+
+def get_ruta_almacen(nombre_mazo: str) -> str:
+    """
+    Obtiene la ruta del archivo del almacen de un mazo.
+
+    Args:
+        nombre_mazo: Nombre del directorio del mazo
+
+    Returns:
+        str: Ruta del archivo del almacen
+    """
+    return f'{var.RUTA_ALMACEN_CARTAS}/{nombre_mazo}.bin'
+
+def alinear(posicion: int) -> int:
+    """
+    Redondea una posicion del archivo hacia arriba al multiplo de la alineacion.
+
+    Args:
+        posicion: Posicion en bytes
+
+    Returns:
+        int: Posicion alineada
+    """
+    return (posicion + ALINEACION - 1) // ALINEACION * ALINEACION
+
+def generar_almacen_mazo(ruta_directorio_mazo: str, nombre_mazo: str) -> str:
+    """
+    Escala todas las imagenes de un mazo a los tamanios de carta y las guarda en el archivo del almacen.
+    Usa las imagenes horneadas si existen.
+
+    Args:
+        ruta_directorio_mazo: Ruta del directorio del mazo
+        nombre_mazo: Nombre del mazo
+
+    Returns:
+        str: Ruta del archivo generado
+    """
+    rutas_imagenes = atlas.listar_imagenes_mazo(ruta_directorio_mazo)
+
+    bloques = []
+    regiones = {}
+    posicion = 0
+    for ruta in rutas_imagenes:
+        for porcentaje in (var.CARTA_SIZE_NORMAL, var.CARTA_SIZE_HOVER):
+            imagen = recursos.escalar_imagen(ruta, porcentaje)
+            pixeles = pg.image.tobytes(imagen, FORMATO_PIXELES)
+            regiones.setdefault(ruta, {})[str(porcentaje)] = [posicion, imagen.get_width(), imagen.get_height()]
+            bloques.append((posicion, pixeles))
+            posicion = alinear(posicion + len(pixeles))
+        recursos.descartar_original(ruta)
+
+    indice = json.dumps({
+        'mazo': nombre_mazo,
+        'mtime_fuentes': atlas.calcular_mtime_mazo(rutas_imagenes),
+        'cantidad_imagenes': len(rutas_imagenes),
+        'calidad': recursos.get_calidad_escalado('cartas'),
+        'regiones': regiones
+    }).encode('utf-8')
+    inicio_pixeles = alinear(CABECERA.size + len(indice))
+
+    ruta_almacen = get_ruta_almacen(nombre_mazo)
+    os.makedirs(var.RUTA_ALMACEN_CARTAS, exist_ok=True)
+    # Se escribe a un temporal y se reemplaza, porque otro proceso puede tener mapeada la version anterior
+    ruta_temporal = f'{ruta_almacen}.tmp'
+    with open(ruta_temporal, 'wb') as file:
+        file.write(CABECERA.pack(FIRMA, VERSION, len(indice)))
+        file.write(indice)
+        for posicion_bloque, pixeles in bloques:
+            file.write(b'\0' * (inicio_pixeles + posicion_bloque - file.tell()))
+            file.write(pixeles)
+    os.replace(ruta_temporal, ruta_almacen)
+
+    print(f'Almacen de cartas generado para {nombre_mazo}: {len(bloques)} imagenes, {posicion // 1024} KB')
+    return ruta_almacen
+
+def cargar_indice_almacen(nombre_mazo: str) -> dict:
+    """
+    Lee solo el indice del almacen de un mazo, sin mapear el archivo.
+
+    Args:
+        nombre_mazo: Nombre del mazo
+
+    Returns:
+        dict: Indice del almacen o None si no existe o no es valido
+    """
+    try:
+        with open(get_ruta_almacen(nombre_mazo), 'rb') as file:
+            firma, version, largo_indice = CABECERA.unpack(file.read(CABECERA.size))
+            if firma != FIRMA or version != VERSION:
+                return None
+            return json.loads(file.read(largo_indice))
+    except (OSError, struct.error, ValueError):
+        return None
+
+def abrir_almacen(nombre_mazo: str) -> dict:
+    """
+    Mapea en memoria el archivo del almacen de un mazo y lee su indice.
+
+    Args:
+        nombre_mazo: Nombre del mazo
+
+    Returns:
+        dict: Almacen con el mapeo, el indice y el inicio de los pixeles, o None si no existe o no es valido
+    """
+    try:
+        with open(get_ruta_almacen(nombre_mazo), 'rb') as file:
+            # ACCESS_COPY comparte las paginas con otros procesos y, si algo escribiera en una carta,
+            # la copia quedaria en este proceso sin tocar el archivo
+            mapeo = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        firma, version, largo_indice = CABECERA.unpack_from(mapeo)
+        if firma != FIRMA or version != VERSION:
+            mapeo.close()
+            return None
+        indice = json.loads(mapeo[CABECERA.size:CABECERA.size + largo_indice])
+    except (struct.error, ValueError):
+        mapeo.close()
+        return None
+
+    return {
+        'mapeo': mapeo,
+        'indice': indice,
+        'inicio_pixeles': alinear(CABECERA.size + largo_indice),
+        'superficies': {}
+    }
+
+def almacen_vigente(almacen: dict, ruta_directorio_mazo: str) -> bool:
+    """
+    Verifica si un almacen sigue correspondiendo a las imagenes actuales del mazo y a la calidad de escalado.
+
+    Args:
+        almacen: Almacen abierto con abrir_almacen
+        ruta_directorio_mazo: Ruta del directorio del mazo
+
+    Returns:
+        bool: True si el almacen esta actualizado
+    """
+    return almacen is not None and atlas.atlas_vigente(almacen.get('indice'), ruta_directorio_mazo)
+
+def cerrar_almacen(almacen: dict):
+    """
+    Cierra el mapeo de un almacen. Solo puede cerrarse si ninguna superficie sigue usando sus pixeles.
+
+    Args:
+        almacen: Almacen abierto con abrir_almacen
+
+    Returns:
+        None
+    """
+    almacen['superficies'].clear()
+    try:
+        almacen['mapeo'].close()
+    except BufferError:
+        # Alguna superficie sigue viva; el mapeo se libera cuando se descarte
+        pass
+
+def crear_superficies(almacen: dict):
+    """
+    Crea una superficie por cada carta y tamanio apuntando directamente a sus pixeles dentro del mapeo,
+    y las registra como regiones en la cache de recursos.
+
+    Args:
+        almacen: Almacen abierto con abrir_almacen
+
+    Returns:
+        None
+    """
+    pixeles = memoryview(almacen['mapeo'])
+    inicio_pixeles = almacen['inicio_pixeles']
+
+    for ruta, regiones in almacen['indice'].get('regiones').items():
+        for porcentaje, (posicion, ancho, alto) in regiones.items():
+            inicio = inicio_pixeles + posicion
+            superficie = pg.image.frombuffer(pixeles[inicio:inicio + ancho * alto * 4], (ancho, alto), FORMATO_PIXELES)
+            almacen['superficies'][(ruta, int(porcentaje))] = superficie
+            recursos.registrar_region(ruta, int(porcentaje), superficie)
+
+def preparar_almacen_mazo(ruta_mazo: str, nombre_mazo: str):
+    """
+    Carga un mazo desde su almacen mapeado, generandolo antes si no existe o quedo desactualizado.
+    Si el mazo ya estaba mapeado en este proceso solo se vuelven a registrar sus superficies.
+
+    Args:
+        ruta_mazo: Ruta del directorio que contiene los mazos
+        nombre_mazo: Nombre del mazo
+
+    Returns:
+        None
+    """
+    ruta_directorio_mazo = f'{ruta_mazo}/{nombre_mazo}'
+    if not nombre_mazo or not os.path.isdir(ruta_directorio_mazo):
+        return
+
+    almacen = almacenes.get(nombre_mazo)
+    if almacen is not None and almacen_vigente(almacen, ruta_directorio_mazo):
+        for (ruta, porcentaje), superficie in almacen['superficies'].items():
+            recursos.registrar_region(ruta, porcentaje, superficie)
+        return
+
+    if almacen is not None:
+        cerrar_almacen(almacenes.pop(nombre_mazo))
+
+    almacen = abrir_almacen(nombre_mazo)
+    if not almacen_vigente(almacen, ruta_directorio_mazo):
+        if almacen is not None:
+            cerrar_almacen(almacen)
+        try:
+            generar_almacen_mazo(ruta_directorio_mazo, nombre_mazo)
+        except OSError as error:
+            # Por ejemplo si otro proceso tiene mapeado el archivo anterior y el sistema no deja reemplazarlo
+            print(f'No se pudo generar el almacen de {nombre_mazo} ({error}), se usa el atlas')
+            atlas.preparar_atlas_mazo(ruta_mazo, nombre_mazo)
+            return
+        almacen = abrir_almacen(nombre_mazo)
+
+    crear_superficies(almacen)
+    almacenes[nombre_mazo] = almacen
+
+def get_memoria_almacenes() -> dict:
+    """
+    Obtiene cuantos bytes ocupa el mapeo de cada mazo cargado.
+
+    Args:
+        Ninguno
+
+    Returns:
+        dict: Diccionario nombre del mazo -> bytes mapeados
+    """
+    return {nombre_mazo: len(almacen['mapeo']) for nombre_mazo, almacen in almacenes.items()}
@@ -0,0 +1,211 @@
+"""
+Modulo para generacion y carga de atlas de texturas de los mazos.
+Empaqueta el frente y reverso de todas las cartas de un mazo, en los tamanios normal y hover,
+en una unica imagen con un indice JSON de regiones, para cargar el mazo con una sola decodificacion.
+"""
+
+import json
+import os
+import pygame as pg
+import modules.variables as var
+import modules.recursos as recursos
+
+def get_rutas_atlas(nombre_mazo: str) -> tuple[str, str]:
+    """
+    Obtiene las rutas de la imagen y del indice del atlas de un mazo.
+
+    Args:
+        nombre_mazo: Nombre del directorio del mazo
+
+    Returns:
+        tuple: Ruta de la imagen del atlas y ruta del indice JSON
+    """
+    ruta_imagen = os.path.join(var.RUTA_ATLAS, f'{nombre_mazo}.png').replace('\\', '/')
+    ruta_indice = os.path.join(var.RUTA_ATLAS, f'{nombre_mazo}.json').replace('\\', '/')
+    return ruta_imagen, ruta_indice
+
+def listar_imagenes_mazo(ruta_directorio_mazo: str) -> list[str]:
+    """
+    Lista las rutas de todas las imagenes (frentes y reverso) de un mazo, ordenadas por nombre.
+
+    Args:
+        ruta_directorio_mazo: Ruta del directorio del mazo
+
+    Returns:
+        list: Rutas de las imagenes con separador '/'
+    """
+    rutas = []
+    for archivo in sorted(os.listdir(ruta_directorio_mazo)):
+        if archivo.endswith('.png'):
+            rutas.append(os.path.join(ruta_directorio_mazo, archivo).replace('\\', '/'))
+    return rutas
+
+def calcular_mtime_mazo(rutas_imagenes: list[str]) -> float:
+    """
+    Obtiene la fecha de modificacion mas reciente entre las imagenes de un mazo.
+
+    Args:
+        rutas_imagenes: Rutas de las imagenes del mazo
+
+    Returns:
+        float: Marca de tiempo de la ultima modificacion
+    """
+    mtime = 0
+    for ruta in rutas_imagenes:
+        mtime = max(mtime, os.path.getmtime(ruta))
+    return mtime
+
+def empaquetar_regiones(tamanios: list[tuple], ancho_max: int) -> tuple[list[list[int]], tuple[int, int]]:
+    """
+    Ubica rectangulos en filas (estanterias) de izquierda a derecha, abriendo una fila nueva cuando no entran.
+
+    Args:
+        tamanios: Lista de tamanios (ancho, alto) a ubicar
+        ancho_max: Ancho maximo del atlas
+
+    Returns:
+        tuple: Lista de regiones [x, y, ancho, alto] en el mismo orden recibido y tamanio total del atlas
+    """
+    orden = sorted(range(len(tamanios)), key=lambda indice: tamanios[indice][1], reverse=True)
+    regiones = [None] * len(tamanios)
+
+    x = 0
+    y = 0
+    alto_fila = 0
+    ancho_total = 0
+
+    for indice in orden:
+        ancho, alto = tamanios[indice]
+        if x + ancho > ancho_max:
+            x = 0
+            y += alto_fila
+            alto_fila = 0
+        regiones[indice] = [x, y, ancho, alto]
+        x += ancho
+        alto_fila = max(alto_fila, alto)
+        ancho_total = max(ancho_total, x)
+
+    return regiones, (ancho_total, y + alto_fila)
+
+def generar_atlas_mazo(ruta_directorio_mazo: str, nombre_mazo: str) -> dict:
+    """
+    Genera el atlas de un mazo y lo guarda en disco junto a su indice de regiones.
+
+    Args:
+        ruta_directorio_mazo: Ruta del directorio del mazo
+        nombre_mazo: Nombre del mazo
+
+    Returns:
+        dict: Indice del atlas generado
+    """
+    rutas_imagenes = listar_imagenes_mazo(ruta_directorio_mazo)
+    tamanios_carta = [var.CARTA_SIZE_NORMAL, var.CARTA_SIZE_HOVER]
+
+    entradas = []
+    for ruta in rutas_imagenes:
+        image_raw = recursos.cargar_imagen(ruta)
+        for porcentaje in tamanios_carta:
+            tamanio = recursos.calcular_tamanio_escalado(image_raw.get_width(), image_raw.get_height(), porcentaje)
+            entradas.append((ruta, porcentaje, recursos.escalar_superficie(image_raw, tamanio, 'cartas')))
+        recursos.descartar_original(ruta)
+
+    regiones, tamanio_atlas = empaquetar_regiones([entrada[2].get_size() for entrada in entradas], var.ATLAS_ANCHO_MAX)
+
+    superficie_atlas = pg.Surface(tamanio_atlas, pg.SRCALPHA)
+    indice = {
+        'mazo': nombre_mazo,
+        'imagen': get_rutas_atlas(nombre_mazo)[0],
+        'mtime_fuentes': calcular_mtime_mazo(rutas_imagenes),
+        'cantidad_imagenes': len(rutas_imagenes),
+        'calidad': recursos.get_calidad_escalado('cartas'),
+        'regiones': {}
+    }
+
+    for indice_entrada in range(len(entradas)):
+        ruta, porcentaje, imagen = entradas[indice_entrada]
+        region = regiones[indice_entrada]
+        superficie_atlas.blit(imagen, (region[0], region[1]))
+        indice['regiones'].setdefault(ruta, {})[str(porcentaje)] = region
+
+    os.makedirs(var.RUTA_ATLAS, exist_ok=True)
+    ruta_imagen, ruta_indice = get_rutas_atlas(nombre_mazo)
+    pg.image.save(superficie_atlas, ruta_imagen)
+    with open(ruta_indice, 'w', encoding='utf-8') as file:
+        json.dump(indice, file)
+
+    print(f'Atlas generado para {nombre_mazo}: {len(entradas)} regiones en {tamanio_atlas[0]}x{tamanio_atlas[1]}')
+    return indice
+
+def cargar_indice_atlas(nombre_mazo: str) -> dict:
+    """
+    Carga el indice de regiones del atlas de un mazo si existe.
+
+    Args:
+        nombre_mazo: Nombre del mazo
+
+    Returns:
+        dict: Indice del atlas o None si no fue generado
+    """
+    ruta_imagen, ruta_indice = get_rutas_atlas(nombre_mazo)
+    if not os.path.isfile(ruta_indice) or not os.path.isfile(ruta_imagen):
+        return None
+    with open(ruta_indice, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+def atlas_vigente(indice: dict, ruta_directorio_mazo: str) -> bool:
+    """
+    Verifica si un atlas sigue correspondiendo a las imagenes actuales del mazo y a la calidad de escalado de las cartas.
+
+    Args:
+        indice: Indice del atlas cargado
+        ruta_directorio_mazo: Ruta del directorio del mazo
+
+    Returns:
+        bool: True si el atlas esta actualizado, False si hay que regenerarlo
+    """
+    if not indice:
+        return False
+    rutas_imagenes = listar_imagenes_mazo(ruta_directorio_mazo)
+    return (
+        indice.get('calidad') == recursos.get_calidad_escalado('cartas') and
+        indice.get('cantidad_imagenes') == len(rutas_imagenes) and
+        indice.get('mtime_fuentes') >= calcular_mtime_mazo(rutas_imagenes)
+    )
+
+def cargar_atlas_mazo(indice: dict):
+    """
+    Carga la imagen del atlas y registra cada region como superficie escalada en la cache de recursos.
+
+    Args:
+        indice: Indice del atlas del mazo
+
+    Returns:
+        None
+    """
+    superficie_atlas = recursos.cargar_imagen(indice.get('imagen'))
+
+    for ruta, regiones in indice.get('regiones').items():
+        for porcentaje, region in regiones.items():
+            recursos.registrar_region(ruta, int(porcentaje), superficie_atlas.subsurface(pg.Rect(region)))
+    # Las regiones mantienen viva la imagen del atlas; la cache de originales no necesita guardarla
+    recursos.descartar_original(indice.get('imagen'))
+
+def preparar_atlas_mazo(ruta_mazo: str, nombre_mazo: str):
+    """
+    Carga el atlas de un mazo, generandolo antes si no existe o quedo desactualizado.
+
+    Args:
+        ruta_mazo: Ruta del directorio que contiene los mazos
+        nombre_mazo: Nombre del mazo
+
+    Returns:
+        None
+    """
+    ruta_directorio_mazo = os.path.join(ruta_mazo, nombre_mazo).replace('\\', '/')
+    if not nombre_mazo or not os.path.isdir(ruta_directorio_mazo):
+        return
+
+    indice = cargar_indice_atlas(nombre_mazo)
+    if not atlas_vigente(indice, ruta_directorio_mazo):
+        indice = generar_atlas_mazo(ruta_directorio_mazo, nombre_mazo)
+    cargar_atlas_mazo(indice)
@@ -4,9 +4,23 @@ Incluye funciones para parseo de datos, carga de rankings, generacion de base de
 """
 
 import modules.variables as var
+import modules.recursos as recursos
+import modules.atlas as atlas
+import modules.almacen_cartas as almacen_cartas
+import modules.horneado as horneado
+import modules.bd_cartas as bd_cartas
+import pygame as pg
 import json
 import os
-import pygame as pg
+import sys
+import time
+import struct
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+FIRMA_PNG = b'\x89PNG\r\n\x1a\n'
+# firma, largo y tipo del primer chunk (IHDR), ancho, alto
+CABECERA_PNG = struct.Struct('>8sI4sII')
 
 def parsear_entero(valor: str) -> int:
     """
@@ -156,43 +170,161 @@ def parsear_datos_carta(filename: str) -> dict:
         'estrellas': estrellas
     }
 
-def generar_bd_cartas(path_mazo: str) -> dict:
+def leer_tamanio_png(ruta_img: str) -> tuple[int, int]:
+    """
+    Lee el ancho y alto de una imagen PNG desde su cabecera, sin decodificarla.
+    
+    Args:
+        ruta_img: Ruta de la imagen
+        
+    Returns:
+        tuple: Tamanio (ancho, alto), o None si el archivo no empieza con una cabecera PNG valida
+    """
+    with open(ruta_img, 'rb') as file:
+        cabecera = file.read(CABECERA_PNG.size)
+    if len(cabecera) < CABECERA_PNG.size:
+        return None
+
+    firma, largo_chunk, tipo_chunk, ancho, alto = CABECERA_PNG.unpack(cabecera)
+    if firma != FIRMA_PNG or tipo_chunk != b'IHDR':
+        return None
+    return ancho, alto
+
+def analizar_archivo_carta(ruta_archivo: str, decodificar: bool = False) -> dict:
+    """
+    Parsea los datos de una carta desde el nombre de su archivo y valida la imagen. Se ejecuta en los procesos
+    del escaner, por eso no toca ningun estado del juego.
+    
+    Args:
+        ruta_archivo: Ruta del archivo de la carta con separador '/'
+        decodificar: True para verificar ademas que la imagen se pueda decodificar completa
+        
+    Returns:
+        dict: Resultado con la ruta, si es reverso, los datos de la carta, el tamanio de la imagen y el error si lo hubo
+    """
+    nombre_archivo = os.path.basename(ruta_archivo)
+    resultado = {'ruta': ruta_archivo, 'reverso': 'reverse' in nombre_archivo, 'datos': None, 'tamanio': None, 'error': None}
+
+    if not nombre_archivo.endswith('.png'):
+        resultado['error'] = 'no es una imagen PNG'
+        return resultado
+
+    if not resultado['reverso']:
+        partes = nombre_archivo.replace('.png', '').split('_')
+        if not all(clave in partes for clave in ('HP', 'ATK', 'DEF')):
+            resultado['error'] = 'el nombre no tiene HP, ATK y DEF'
+            return resultado
+        try:
+            resultado['datos'] = parsear_datos_carta(nombre_archivo)
+        except ValueError:
+            resultado['error'] = 'el nombre tiene estadisticas que no son numeros'
+            return resultado
+
+    try:
+        resultado['tamanio'] = leer_tamanio_png(ruta_archivo)
+        if resultado['tamanio'] is None:
+            resultado['error'] = 'cabecera PNG invalida'
+        elif decodificar and pg.image.load(ruta_archivo).get_size() != resultado['tamanio']:
+            resultado['error'] = 'la imagen decodificada no coincide con su cabecera'
+    except (OSError, pg.error) as error:
+        resultado['error'] = f'no se pudo leer la imagen ({error})'
+
+    return resultado
+
+def listar_archivos_mazos(path_mazo: str) -> dict:
+    """
+    Lista, con os.scandir, los archivos de cada directorio de mazo a partir de una ruta, que puede ser la carpeta
+    de todos los mazos o la de un solo mazo. Los directorios sin archivos no se cuentan como mazo.
+    
+    Args:
+        path_mazo: Ruta desde la que se buscan los mazos
+        
+    Returns:
+        dict: Diccionario nombre del mazo -> rutas de sus archivos ordenadas por nombre
+    """
+    archivos_por_mazo = {}
+    pendientes = [path_mazo.replace('\\', '/').rstrip('/')]
+
+    while pendientes:
+        ruta_directorio = pendientes.pop(0)
+        archivos = []
+        for entrada in sorted(os.scandir(ruta_directorio), key=lambda entrada: entrada.name):
+            if entrada.is_dir():
+                pendientes.append(f'{ruta_directorio}/{entrada.name}')
+            elif entrada.is_file():
+                archivos.append(f'{ruta_directorio}/{entrada.name}')
+        if archivos:
+            archivos_por_mazo[ruta_directorio.split('/')[-1]] = archivos
+
+    return archivos_por_mazo
+
+def armar_mazo(nombre_mazo: str, resultados: list[dict], errores: list[str]) -> list[dict]:
+    """
+    Arma las cartas de un mazo con los resultados del analisis de sus archivos. Las cartas con errores o cuyo tamanio
+    no coincide con el del resto del mazo se dejan afuera y se agregan a los errores.
+    
+    Args:
+        nombre_mazo: Nombre del mazo
+        resultados: Resultados de analizar_archivo_carta, en el orden de los archivos
+        errores: Lista donde se agregan los errores encontrados
+        
+    Returns:
+        list: Datos de las cartas del mazo
+    """
+    tamanios = Counter(resultado['tamanio'] for resultado in resultados if resultado['tamanio'] and not resultado['error'])
+    tamanio_mazo = tamanios.most_common(1)[0][0] if tamanios else None
+
+    reverse_path = ''
+    deck_cards = []
+    for resultado in resultados:
+        if not resultado['error'] and resultado['tamanio'] != tamanio_mazo:
+            resultado['error'] = f'mide {resultado["tamanio"][0]}x{resultado["tamanio"][1]} y el mazo {tamanio_mazo[0]}x{tamanio_mazo[1]}'
+        if resultado['error']:
+            errores.append(f'{nombre_mazo}: {resultado["ruta"]}: {resultado["error"]}')
+        elif resultado['reverso']:
+            reverse_path = resultado['ruta']
+        else:
+            datos_card = resultado['datos']
+            datos_card['ruta_frente'] = resultado['ruta']
+            deck_cards.append(datos_card)
+
+    for datos_card in deck_cards:
+        datos_card['ruta_reverso'] = reverse_path
+    return deck_cards
+
+def generar_bd_cartas(path_mazo: str, paralelo: bool = False) -> dict:
     """
     Genera una base de datos de cartas escaneando los directorios de mazos y parseando los nombres de archivo.
+    En modo paralelo el parseo y la validacion de las imagenes, que ademas se decodifican completas, se reparten
+    en un pool de procesos; los resultados se juntan en el orden de los archivos, asi el resultado no depende
+    del orden en que terminan los procesos.
     
     Args:
         path_mazo: Ruta del directorio que contiene los mazos de cartas
+        paralelo: True para validar las imagenes en un pool de procesos
         
     Returns:
-        dict: Diccionario con todas las cartas organizadas por mazo
+        dict: Diccionario con todas las cartas organizadas por mazo y la lista de archivos con errores
     """
     cartas_dict = {
-        "cartas": {}
+        "cartas": {},
+        "errores": []
     }
 
-    for root, dir, files in os.walk(path_mazo):
-        reverse_path = ''
-        deck_cards = []
-        deck_name = root.replace('\\', '/').split('/')[-1]
-        for carta in files:
-            card_path = os.path.join(root, carta)
-            print(f'DECK NAME: {deck_name}')
+    archivos_por_mazo = listar_archivos_mazos(path_mazo)
+    rutas = [ruta for archivos in archivos_por_mazo.values() for ruta in archivos]
 
-            if 'reverse' in card_path:
-                reverse_path = card_path.replace('\\', '/')
-            else:
-                card_path = card_path.replace('\\', '/')
-                
-                datos_card = parsear_datos_carta(carta)
-                datos_card['ruta_frente'] = card_path
-                datos_card['ruta_reverso'] = ''
-                
-                deck_cards.append(datos_card)
-        for index_carta in range(len(deck_cards)):
-            deck_cards[index_carta]['ruta_reverso'] = reverse_path
-        
-        if deck_name:
-            cartas_dict['cartas'][deck_name] = deck_cards
+    if paralelo and rutas:
+        with ProcessPoolExecutor(max_workers=var.ESCANER_PROCESOS) as executor:
+            resultados = list(executor.map(analizar_archivo_carta, rutas, [True] * len(rutas), chunksize=16))
+    else:
+        resultados = [analizar_archivo_carta(ruta) for ruta in rutas]
+
+    inicio = 0
+    for deck_name, archivos in archivos_por_mazo.items():
+        resultados_mazo = resultados[inicio:inicio + len(archivos)]
+        inicio += len(archivos)
+        cartas_dict['cartas'][deck_name] = armar_mazo(deck_name, resultados_mazo, cartas_dict['errores'])
     
     return cartas_dict
 
@@ -210,6 +342,160 @@ def guardar_info_cartas(ruta_archivo: str, dict_cards: dict):
     with open(ruta_archivo, 'w', encoding='utf-8') as file:
         json.dump(dict_cards, file, indent=4)
 
+def construir_bd_cartas() -> dict:
+    """
+    Arma la base de datos de cartas fragmentada desde info_cartas.json. Si el archivo no existe se arma vacia
+    y los mazos se agregan desde sus directorios a medida que hacen falta.
+    
+    Args:
+        Ninguno
+        
+    Returns:
+        dict: Indice de la base de datos generada
+    """
+    if os.path.isfile(var.JSON_INFO_CARDS):
+        print('+++++ Fragmentando base de datos de cartas desde archivo... +++++')
+        cartas = cargar_configs(var.JSON_INFO_CARDS)
+        return bd_cartas.fragmentar_bd(cartas.get('cartas'), var.JSON_INFO_CARDS)
+
+    return bd_cartas.fragmentar_bd({})
+
+def regenerar_mazo_bd(indice: dict, ruta_directorio_mazo: str, manifiesto: dict = None, paralelo: bool = False) -> tuple[list[dict], list[str]]:
+    """
+    Vuelve a parsear las cartas de un unico directorio de mazo y guarda su fragmento con el manifiesto del directorio.
+    
+    Args:
+        indice: Indice de la base de datos
+        ruta_directorio_mazo: Ruta del directorio del mazo
+        manifiesto: Manifiesto ya calculado del directorio (opcional)
+        paralelo: True para validar las imagenes en un pool de procesos
+        
+    Returns:
+        tuple: Datos de las cartas del mazo y errores de los archivos que quedaron afuera
+    """
+    nombre_mazo = os.path.basename(ruta_directorio_mazo)
+    cartas = generar_bd_cartas(ruta_directorio_mazo, paralelo)
+    cartas_mazo = cartas.get('cartas').get(nombre_mazo, [])
+    bd_cartas.guardar_fragmento(indice, nombre_mazo, cartas_mazo, manifiesto or bd_cartas.calcular_manifiesto(ruta_directorio_mazo))
+    return cartas_mazo, cartas.get('errores')
+
+def actualizar_bd_cartas(paralelo: bool = False) -> dict:
+    """
+    Pone al dia la base de datos de cartas con los directorios de mazos. Un mazo cuyo directorio no cambio de fecha
+    no se vuelve a leer; si cambio, se comparan los hashes de sus archivos y solo se vuelve a parsear si difieren.
+    Los mazos que vienen de info_cartas.json se leen una vez para guardar su manifiesto y solo cuentan como
+    modificados si sus cartas no coinciden con las del archivo. Los mazos cuyo directorio se borro se quitan
+    de la base de datos.
+    
+    Args:
+        paralelo: True para validar las imagenes de los mazos que cambiaron en un pool de procesos
+        
+    Returns:
+        dict: Resumen con los mazos nuevos, modificados, eliminados, la cantidad sin cambios, los archivos con errores
+        y el tiempo en segundos
+    """
+    inicio = time.perf_counter()
+    resumen = {'nuevos': [], 'modificados': [], 'eliminados': [], 'sin_cambios': 0, 'errores': []}
+
+    indice = bd_cartas.cargar_indice()
+    if not bd_cartas.indice_vigente(indice, var.JSON_INFO_CARDS):
+        indice = construir_bd_cartas()
+    indice_modificado = False
+
+    nombres_en_disco = set()
+    for ruta_directorio_mazo in listar_directorios_mazos():
+        nombre_mazo = os.path.basename(ruta_directorio_mazo)
+        nombres_en_disco.add(nombre_mazo)
+
+        datos_mazo = indice.get('mazos').get(nombre_mazo)
+        manifiesto_previo = datos_mazo.get('manifiesto') if datos_mazo else None
+        # Agregar, quitar o renombrar una carta cambia la fecha del directorio; si no cambio no se lee nada mas
+        if manifiesto_previo and manifiesto_previo.get('mtime_directorio') == os.stat(ruta_directorio_mazo).st_mtime_ns:
+            resumen['sin_cambios'] += 1
+            continue
+
+        manifiesto = bd_cartas.calcular_manifiesto(ruta_directorio_mazo, manifiesto_previo)
+        indice_modificado = True
+        if bd_cartas.manifiestos_iguales(manifiesto, manifiesto_previo):
+            datos_mazo['manifiesto'] = manifiesto
+            resumen['sin_cambios'] += 1
+            continue
+
+        # Un mazo que vino de info_cartas.json todavia no tiene manifiesto: se compara por sus cartas
+        cartas_previas = bd_cartas.cargar_fragmento(indice, nombre_mazo) if datos_mazo and not manifiesto_previo else None
+        cartas_mazo, errores = regenerar_mazo_bd(indice, ruta_directorio_mazo, manifiesto, paralelo)
+        resumen['errores'].extend(errores)
+        if not datos_mazo:
+            resumen['nuevos'].append(nombre_mazo)
+        elif cartas_previas is not None and cartas_previas == cartas_mazo:
+            resumen['sin_cambios'] += 1
+        else:
+            resumen['modificados'].append(nombre_mazo)
+
+    # Solo se quitan los mazos que se generaron desde un directorio; los que vienen de info_cartas.json no tienen manifiesto
+    for nombre_mazo, datos_mazo in list(indice.get('mazos').items()):
+        if datos_mazo.get('manifiesto') and nombre_mazo not in nombres_en_disco:
+            bd_cartas.eliminar_fragmento(indice, nombre_mazo)
+            resumen['eliminados'].append(nombre_mazo)
+            indice_modificado = True
+
+    if indice_modificado:
+        bd_cartas.guardar_indice(indice)
+
+    resumen['segundos'] = time.perf_counter() - inicio
+    return resumen
+
+def imprimir_resumen_bd_cartas(resumen: dict):
+    """
+    Imprime que mazos cambiaron en la ultima actualizacion de la base de datos de cartas y cuanto tardo.
+    
+    Args:
+        resumen: Resumen retornado por actualizar_bd_cartas
+        
+    Returns:
+        None
+    """
+    print(
+        f'Base de datos de cartas: {len(resumen["nuevos"])} mazos nuevos, {len(resumen["modificados"])} modificados, '
+        f'{len(resumen["eliminados"])} eliminados, {resumen["sin_cambios"]} sin cambios ({resumen["segundos"] * 1000:.1f} ms)'
+    )
+    for clave in ('nuevos', 'modificados', 'eliminados'):
+        for nombre_mazo in resumen[clave]:
+            print(f'  {clave[:-1]}: {nombre_mazo}')
+    for error in resumen['errores']:
+        print(f'  Error: {error}')
+
+def cargar_cartas_mazos(ruta_mazo: str, nombres_mazo: list[str]) -> dict:
+    """
+    Carga de la base de datos fragmentada solo las cartas de los mazos pedidos. Si un mazo existe en disco
+    pero no en la base de datos, se escanea solo su directorio y se agrega su fragmento.
+    
+    Args:
+        ruta_mazo: Ruta del directorio que contiene los mazos de cartas
+        nombres_mazo: Nombres de los mazos a cargar
+        
+    Returns:
+        dict: Diccionario nombre del mazo -> datos de sus cartas
+    """
+    indice = bd_cartas.cargar_indice()
+    if not bd_cartas.indice_vigente(indice, var.JSON_INFO_CARDS):
+        indice = construir_bd_cartas()
+
+    cartas_por_mazo = {}
+    for nombre_mazo in nombres_mazo:
+        if not nombre_mazo:
+            continue
+        cartas_mazo = bd_cartas.cargar_fragmento(indice, nombre_mazo)
+        if cartas_mazo is None and os.path.isdir(f'{ruta_mazo}/{nombre_mazo}'):
+            print(f'====== Agregando {nombre_mazo} a la base de datos de cartas... ======')
+            cartas_mazo, errores = regenerar_mazo_bd(indice, f'{ruta_mazo}/{nombre_mazo}')
+            for error in errores:
+                print(f'  Error: {error}')
+            bd_cartas.guardar_indice(indice)
+        cartas_por_mazo[nombre_mazo] = cartas_mazo or []
+
+    return cartas_por_mazo
+
 def cargar_y_preparar_mazos(stage_data: dict):
     """
     Carga los mazos del jugador y enemigo y los inicializa en el mazo completo del stage.
@@ -222,17 +508,14 @@ def cargar_y_preparar_mazos(stage_data: dict):
     """
     """Carga los mazos de jugador y enemigo directamente en mazo_completo"""
     if not stage_data.get('juego_finalizado'):
-        if os.path.exists(var.JSON_INFO_CARDS) and os.path.isfile(var.JSON_INFO_CARDS):
-            print('+++++ Cargando base de datos de cartas desde archivo... +++++')
-            cartas = cargar_configs(var.JSON_INFO_CARDS)
-        else:
-            print('====== Generando base de datos de cartas desde directorio... ======')
-            cartas = generar_bd_cartas(stage_data.get('ruta_mazo'))
-            guardar_info_cartas(var.JSON_INFO_CARDS, cartas)
+        cartas = cargar_cartas_mazos(
+            stage_data.get('ruta_mazo'),
+            [stage_data.get('nombre_mazo_jugador'), stage_data.get('nombre_mazo_enemigo')]
+        )
         
         # Obtener cartas de ambos mazos
-        cartas_enemigo = cartas.get('cartas').get(stage_data.get('nombre_mazo_enemigo'), [])
-        cartas_jugador = cartas.get('cartas').get(stage_data.get('nombre_mazo_jugador'), [])
+        cartas_enemigo = cartas.get(stage_data.get('nombre_mazo_enemigo'), [])
+        cartas_jugador = cartas.get(stage_data.get('nombre_mazo_jugador'), [])
         
         # Inicializar y agregar todas las cartas al mazo completo
         from modules.carta import inicializar_carta
@@ -244,41 +527,125 @@ def cargar_y_preparar_mazos(stage_data: dict):
             carta_init = inicializar_carta(carta_data, (0, 0))
             stage_data['mazo_completo'].append(carta_init)
 
+        # Cargar cada mazo desde su almacen mapeado o su atlas y fijar en cache los reversos compartidos
+        for nombre_mazo in (stage_data.get('nombre_mazo_jugador'), stage_data.get('nombre_mazo_enemigo')):
+            if var.ALMACEN_CARTAS == 'mmap':
+                almacen_cartas.preparar_almacen_mazo(stage_data.get('ruta_mazo'), nombre_mazo)
+            else:
+                atlas.preparar_atlas_mazo(stage_data.get('ruta_mazo'), nombre_mazo)
+        for cartas_mazo in (cartas_jugador, cartas_enemigo):
+            if cartas_mazo:
+                recursos.precargar_reverso(cartas_mazo[0].get('ruta_reverso'))
+
 def redimesionar_imagen(ruta_img: str, porcentaje_a_ajustar: int):
     """
-    Redimensiona una imagen aplicando un porcentaje de escala.
+    Redimensiona una imagen aplicando un porcentaje de escala, reutilizando la version cacheada si existe.
     
     Args:
         ruta_img: Ruta de la imagen a redimensionar
         porcentaje_a_ajustar: Porcentaje de escala a aplicar (50 significa 50%)
         
     Returns:
-        Surface: Imagen redimensionada de Pygame
+        Surface: Imagen redimensionada de Pygame (compartida, no debe modificarse)
+    """
+    return recursos.obtener_superficie(ruta_img, porcentaje_a_ajustar)
+
+def listar_directorios_mazos() -> list[str]:
+    """
+    Lista los directorios de todos los mazos que se encuentran en las rutas de mazo de los niveles configurados.
+    
+    Args:
+        Ninguno
+        
+    Returns:
+        list: Rutas de los directorios de mazos con separador '/'
     """
-    image_raw = pg.image.load(ruta_img)
-    ancho = image_raw.get_width()
-    alto = image_raw.get_height()
+    rutas_mazo = []
+    for configs_nivel in cargar_configs(var.JSON_CONFIGS).values():
+        ruta_mazo = configs_nivel.get('ruta_mazo')
+        if ruta_mazo and ruta_mazo not in rutas_mazo and os.path.isdir(ruta_mazo):
+            rutas_mazo.append(ruta_mazo)
 
-    nuevo_alto = int(alto * float(f'0.{porcentaje_a_ajustar}'))
-    nuevo_ancho = int(ancho * float(f'0.{porcentaje_a_ajustar}'))
+    directorios = []
+    for ruta_mazo in rutas_mazo:
+        for entrada in sorted(os.scandir(ruta_mazo), key=lambda entrada: entrada.name):
+            if entrada.is_dir():
+                directorios.append(f'{ruta_mazo}/{entrada.name}')
+    return directorios
 
-    imagen_final = pg.transform.scale(image_raw, (nuevo_ancho, nuevo_alto))
-    return imagen_final
+def hornear_imagen(ruta_img: str, tamanios: dict, resumen: dict, forzar: bool = False):
+    """
+    Hornea una imagen en cada uno de los tamanios pedidos, salteando los que ya estan vigentes.
+    La imagen fuente se decodifica una sola vez y solo si algun tamanio hace falta.
+    
+    Args:
+        ruta_img: Ruta de la imagen fuente
+        tamanios: Diccionario etiqueta -> funcion que recibe (ancho, alto) originales y retorna el tamanio final
+        resumen: Diccionario donde se cuentan las imagenes horneadas, vigentes y con error
+        forzar: True para volver a hornear aunque el archivo este vigente
+        
+    Returns:
+        None: Modifica el resumen
+    """
+    image_raw = None
+    for etiqueta, calcular_tamanio in tamanios.items():
+        if not forzar and horneado.horneado_vigente(ruta_img, etiqueta):
+            resumen['vigentes'] += 1
+            continue
 
+        try:
+            if image_raw is None:
+                image_raw = pg.image.load(ruta_img)
+            tamanio = calcular_tamanio(image_raw.get_width(), image_raw.get_height())
+            horneado.hornear_superficie(ruta_img, etiqueta, recursos.escalar_con_calidad(image_raw, tamanio, var.CALIDAD_SUAVE))
+            resumen['horneadas'] += 1
+        except (OSError, pg.error) as error:
+            resumen['errores'].append(f'{ruta_img}: {error}')
+            return
 
-def reducir(callback, iterable: list):
+def hornear_recursos(forzar: bool = False) -> dict:
     """
-    Aplica una funcion callback recursivamente a todos los elementos de una lista y suma los resultados.
+    Hornea con calidad suave las cartas de todos los mazos en los tamanios normal y hover, y los fondos
+    de los formularios al tamanio de pantalla.
     
     Args:
-        callback: Funcion que se aplicara a cada elemento
-        iterable: Lista de elementos a procesar
+        forzar: True para volver a hornear todas las imagenes
         
     Returns:
-        int: Suma total de los valores retornados por el callback
+        dict: Resumen con la cantidad de imagenes horneadas, vigentes, errores y el tiempo total en segundos
     """
-    if not iterable:  # Caso base: lista vacia
-        return 0
-    # Caso recursivo: primer elemento + reducir el resto
-    return callback(iterable[0]) + reducir(callback, iterable[1:])
+    inicio = time.perf_counter()
+    resumen = {'horneadas': 0, 'vigentes': 0, 'errores': []}
+
+    tamanios_carta = {}
+    for porcentaje in (var.CARTA_SIZE_NORMAL, var.CARTA_SIZE_HOVER):
+        tamanios_carta[horneado.etiqueta_porcentaje(porcentaje)] = (
+            lambda ancho, alto, porcentaje=porcentaje: recursos.calcular_tamanio_escalado(ancho, alto, porcentaje)
+        )
+    tamanios_fondo = {horneado.etiqueta_tamanio(var.DIMENSION_PANTALLA): lambda ancho, alto: var.DIMENSION_PANTALLA}
+
+    for directorio_mazo in listar_directorios_mazos():
+        for ruta_carta in atlas.listar_imagenes_mazo(directorio_mazo):
+            hornear_imagen(ruta_carta, tamanios_carta, resumen, forzar)
+
+    for ruta_fondo in sorted(set(var.FONDOS_FORMULARIOS)):
+        if os.path.isfile(ruta_fondo):
+            hornear_imagen(ruta_fondo, tamanios_fondo, resumen, forzar)
+
+    resumen['segundos'] = time.perf_counter() - inicio
+    return resumen
+
+if __name__ == '__main__':
+    # Uso: python -m modules.auxiliar bake [--forzar] | python -m modules.auxiliar bd [--paralelo]
+    if len(sys.argv) >= 2 and sys.argv[1] == 'bd':
+        imprimir_resumen_bd_cartas(actualizar_bd_cartas(paralelo='--paralelo' in sys.argv))
+        sys.exit(0)
+
+    if len(sys.argv) < 2 or sys.argv[1] != 'bake':
+        print('Uso: python -m modules.auxiliar bake [--forzar] | python -m modules.auxiliar bd [--paralelo]')
+        sys.exit(1)
 
+    resumen_horneado = hornear_recursos(forzar='--forzar' in sys.argv)
+    print(f'Imagenes horneadas: {resumen_horneado["horneadas"]}, ya vigentes: {resumen_horneado["vigentes"]} ({resumen_horneado["segundos"]:.2f} s) en {var.RUTA_HORNEADO}')
+    for error in resumen_horneado['errores']:
+        print(f'  Error: {error}')
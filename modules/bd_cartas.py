@@ -0,0 +1,253 @@
+"""
+Modulo de la base de datos de cartas fragmentada.
+Cada mazo se guarda en su propio archivo JSON (fragmento) y un indice chico lista los mazos, su archivo y su
+cantidad de cartas. Al iniciar un stage se lee el indice y solo los fragmentos de los mazos que se juegan,
+asi el tiempo de carga no crece al agregar expansiones.
+Cada mazo generado desde su directorio guarda ademas un manifiesto con la fecha de modificacion del directorio
+y el hash de cada archivo, para regenerar solo los mazos que cambiaron.
+"""
+
+import json
+import os
+import modules.variables as var
+import modules.horneado as horneado
+
+VERSION = 1
+NOMBRE_INDICE = 'indice.json'
+
+def get_ruta_indice() -> str:
+    """
+    Obtiene la ruta del indice de la base de datos de cartas.
+
+    Args:
+        Ninguno
+
+    Returns:
+        str: Ruta del indice
+    """
+    return f'{var.RUTA_BD_CARTAS}/{NOMBRE_INDICE}'
+
+def get_ruta_fragmento(archivo: str) -> str:
+    """
+    Obtiene la ruta de un fragmento de la base de datos.
+
+    Args:
+        archivo: Nombre del archivo del fragmento, como figura en el indice
+
+    Returns:
+        str: Ruta del fragmento
+    """
+    return f'{var.RUTA_BD_CARTAS}/{archivo}'
+
+def get_mtime_origen(ruta_origen: str) -> int:
+    """
+    Obtiene la fecha de modificacion del archivo desde el que se armo la base de datos.
+
+    Args:
+        ruta_origen: Ruta del archivo de origen
+
+    Returns:
+        int: Fecha de modificacion en ns, o None si el archivo no existe
+    """
+    try:
+        return os.stat(ruta_origen).st_mtime_ns
+    except OSError:
+        return None
+
+def guardar_json(ruta_archivo: str, datos):
+    """
+    Guarda datos en un archivo JSON escribiendo primero un temporal, para no dejar nunca un archivo a medio escribir.
+
+    Args:
+        ruta_archivo: Ruta del archivo
+        datos: Datos a guardar
+
+    Returns:
+        None
+    """
+    os.makedirs(os.path.dirname(ruta_archivo), exist_ok=True)
+    ruta_temporal = f'{ruta_archivo}.tmp'
+    with open(ruta_temporal, 'w', encoding='utf-8') as file:
+        json.dump(datos, file)
+    os.replace(ruta_temporal, ruta_archivo)
+
+def guardar_fragmento(indice: dict, nombre_mazo: str, cartas_mazo: list[dict], manifiesto: dict = None):
+    """
+    Guarda las cartas de un mazo en su fragmento y lo agrega al indice. No guarda el indice.
+
+    Args:
+        indice: Indice de la base de datos
+        nombre_mazo: Nombre del mazo
+        cartas_mazo: Datos de las cartas del mazo
+        manifiesto: Manifiesto del directorio del que salieron las cartas (opcional)
+
+    Returns:
+        None: Modifica el indice
+    """
+    archivo = f'{nombre_mazo}.json'
+    guardar_json(get_ruta_fragmento(archivo), cartas_mazo)
+    indice['mazos'][nombre_mazo] = {'archivo': archivo, 'cantidad': len(cartas_mazo)}
+    if manifiesto:
+        indice['mazos'][nombre_mazo]['manifiesto'] = manifiesto
+
+def eliminar_fragmento(indice: dict, nombre_mazo: str):
+    """
+    Quita un mazo del indice y borra su fragmento. No guarda el indice.
+
+    Args:
+        indice: Indice de la base de datos
+        nombre_mazo: Nombre del mazo
+
+    Returns:
+        None: Modifica el indice
+    """
+    datos_mazo = indice['mazos'].pop(nombre_mazo)
+    try:
+        os.remove(get_ruta_fragmento(datos_mazo.get('archivo')))
+    except OSError:
+        pass
+
+def calcular_manifiesto(ruta_directorio_mazo: str, manifiesto_previo: dict = None) -> dict:
+    """
+    Arma el manifiesto de un directorio de mazo: su fecha de modificacion y, por archivo, fecha, tamanio y hash.
+    El hash solo se recalcula para los archivos cuya fecha o tamanio no coinciden con el manifiesto previo.
+
+    Args:
+        ruta_directorio_mazo: Ruta del directorio del mazo
+        manifiesto_previo: Manifiesto guardado del mismo directorio (opcional)
+
+    Returns:
+        dict: Manifiesto del directorio
+    """
+    archivos_previos = manifiesto_previo.get('archivos') if manifiesto_previo else {}
+    archivos = {}
+
+    for entrada in sorted(os.scandir(ruta_directorio_mazo), key=lambda entrada: entrada.name):
+        if not entrada.is_file():
+            continue
+        estado = entrada.stat()
+        previo = archivos_previos.get(entrada.name)
+        if previo and previo[0] == estado.st_mtime_ns and previo[1] == estado.st_size:
+            hash_archivo = previo[2]
+        else:
+            hash_archivo = horneado.calcular_hash_archivo(entrada.path).hex()
+        archivos[entrada.name] = [estado.st_mtime_ns, estado.st_size, hash_archivo]
+
+    return {'mtime_directorio': os.stat(ruta_directorio_mazo).st_mtime_ns, 'archivos': archivos}
+
+def manifiestos_iguales(manifiesto: dict, manifiesto_previo: dict) -> bool:
+    """
+    Compara dos manifiestos por nombre y hash de sus archivos, sin tener en cuenta las fechas.
+    Asi un mazo cuyos archivos solo cambiaron de fecha (por ejemplo al clonar el repositorio) no se regenera.
+
+    Args:
+        manifiesto: Manifiesto actual
+        manifiesto_previo: Manifiesto guardado
+
+    Returns:
+        bool: True si el directorio tiene los mismos archivos con el mismo contenido
+    """
+    if not manifiesto_previo:
+        return False
+    hashes = {nombre: datos[2] for nombre, datos in manifiesto.get('archivos').items()}
+    hashes_previos = {nombre: datos[2] for nombre, datos in manifiesto_previo.get('archivos').items()}
+    return hashes == hashes_previos
+
+def guardar_indice(indice: dict):
+    """
+    Guarda el indice de la base de datos.
+
+    Args:
+        indice: Indice de la base de datos
+
+    Returns:
+        None
+    """
+    guardar_json(get_ruta_indice(), indice)
+
+def fragmentar_bd(cartas_por_mazo: dict, ruta_origen: str = None) -> dict:
+    """
+    Arma la base de datos fragmentada a partir de las cartas de todos los mazos. Los mazos sin cartas no se guardan
+    y se borran los fragmentos de mazos que ya no estan.
+
+    Args:
+        cartas_por_mazo: Diccionario nombre del mazo -> datos de sus cartas
+        ruta_origen: Archivo del que salieron las cartas, o None si se generaron desde los directorios
+
+    Returns:
+        dict: Indice de la base de datos generada
+    """
+    indice = {
+        'version': VERSION,
+        'origen': ruta_origen,
+        'mtime_origen': get_mtime_origen(ruta_origen) if ruta_origen else None,
+        'mazos': {}
+    }
+
+    os.makedirs(var.RUTA_BD_CARTAS, exist_ok=True)
+    for nombre_mazo, cartas_mazo in cartas_por_mazo.items():
+        if cartas_mazo:
+            guardar_fragmento(indice, nombre_mazo, cartas_mazo)
+
+    archivos_vigentes = {datos_mazo['archivo'] for datos_mazo in indice['mazos'].values()}
+    for entrada in os.scandir(var.RUTA_BD_CARTAS):
+        if entrada.name.endswith('.json') and entrada.name != NOMBRE_INDICE and entrada.name not in archivos_vigentes:
+            os.remove(entrada.path)
+
+    guardar_indice(indice)
+    return indice
+
+def cargar_indice() -> dict:
+    """
+    Carga el indice de la base de datos de cartas.
+
+    Args:
+        Ninguno
+
+    Returns:
+        dict: Indice, o None si no existe o es de otra version
+    """
+    try:
+        with open(get_ruta_indice(), 'r', encoding='utf-8') as file:
+            indice = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if indice.get('version') != VERSION:
+        return None
+    return indice
+
+def indice_vigente(indice: dict, ruta_origen: str) -> bool:
+    """
+    Verifica si el indice corresponde al archivo de origen actual. Un indice generado desde los directorios
+    sigue vigente mientras no aparezca un archivo de origen.
+
+    Args:
+        indice: Indice de la base de datos
+        ruta_origen: Ruta del archivo de origen
+
+    Returns:
+        bool: True si la base de datos esta actualizada
+    """
+    return indice is not None and indice.get('mtime_origen') == get_mtime_origen(ruta_origen)
+
+def cargar_fragmento(indice: dict, nombre_mazo: str) -> list[dict]:
+    """
+    Carga las cartas de un mazo desde su fragmento.
+
+    Args:
+        indice: Indice de la base de datos
+        nombre_mazo: Nombre del mazo
+
+    Returns:
+        list: Datos de las cartas del mazo, o None si el mazo no esta en la base de datos
+    """
+    datos_mazo = indice.get('mazos').get(nombre_mazo)
+    if not datos_mazo:
+        return None
+
+    try:
+        with open(get_ruta_fragmento(datos_mazo.get('archivo')), 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
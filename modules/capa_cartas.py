@@ -0,0 +1,141 @@
+"""
+Modulo de la capa de cartas en pantalla.
+Cada carta que se ve en la mesa es un sprite dentro de un grupo por capas: los mazos abajo, las cartas jugadas encima
+y la carta con zoom por sobre todas. El grupo solo vuelve a blittear las cartas que cambiaron y las que quedan dentro
+de la zona que se redibujo en el frame, asi el costo no crece con la cantidad de cartas visibles.
+"""
+
+import pygame as pg
+import modules.variables as var
+import modules.carta as carta
+import modules.render as render
+
+CAPA_MAZO = 0
+CAPA_JUGADA = 1
+CAPA_ZOOM = 2
+
+class SpriteCarta(pg.sprite.DirtySprite):
+    '''
+    Sprite que muestra una carta del juego. La imagen y el rect salen de la carta,
+    que sigue siendo el que guarda su estado
+    '''
+    def __init__(self, card: carta.Carta):
+        super().__init__()
+        self.carta = card
+        self.con_hover = False
+        self.image = None
+        self.rect = None
+        self.estado_previo = None
+
+    def actualizar(self, mouse_pos=None):
+        """
+        Avanza la animacion de la carta y marca el sprite como sucio si cambio su imagen o su posicion.
+        Una carta quieta, sin hover ni zoom, que no cambio de cara ni de lugar no se recalcula.
+
+        Args:
+            mouse_pos: Posicion del mouse, solo se usa si la carta responde al hover
+
+        Returns:
+            None
+        """
+        estado = (self.carta.visible, self.carta.coordenadas)
+        if not self.con_hover and not self.carta.frame_zoom and estado == self.estado_previo:
+            return
+        self.estado_previo = estado
+
+        carta.actualizar_carta(self.carta, mouse_pos if self.con_hover else None)
+        if self.carta.imagen is not self.image or self.carta.rect != self.rect:
+            self.image = self.carta.imagen
+            self.rect = self.carta.rect
+            self.dirty = 1
+
+def crear_capa() -> dict:
+    """
+    Crea una capa de cartas vacia.
+
+    Args:
+        Ninguno
+
+    Returns:
+        dict: Capa con el grupo de sprites y los sprites de cada carta
+    """
+    grupo = pg.sprite.LayeredDirty()
+    grupo.set_clip(pg.Rect((0, 0), var.DIMENSION_PANTALLA))
+
+    capa = {}
+    capa['grupo'] = grupo
+    capa['sprites'] = {}
+    return capa
+
+def calcular_capa_sprite(sprite: SpriteCarta, es_jugada: bool) -> int:
+    """
+    Calcula en que capa va una carta: la que tiene zoom queda por encima de todas.
+
+    Args:
+        sprite: Sprite de la carta
+        es_jugada: True si la carta esta en la pila de jugadas
+
+    Returns:
+        int: Capa del sprite
+    """
+    if carta.zoom_en_animacion(sprite.carta) or sprite.carta.frame_zoom:
+        return CAPA_ZOOM
+    if es_jugada:
+        return CAPA_JUGADA
+    return CAPA_MAZO
+
+def sincronizar_capa(capa: dict, cartas_en_mesa: list[tuple[carta.Carta, bool]], mouse_pos=None):
+    """
+    Deja en la capa un sprite por cada carta en mesa: crea los que faltan, quita los de las cartas que ya no se ven
+    y actualiza la animacion y la capa de cada uno.
+
+    Args:
+        capa: Capa de cartas
+        cartas_en_mesa: Tuplas (carta, es_jugada) de las cartas que deben verse
+        mouse_pos: Posicion del mouse para el hover de las cartas jugadas
+
+    Returns:
+        None
+    """
+    grupo = capa['grupo']
+    sprites = capa['sprites']
+    ids_en_mesa = set()
+
+    for card, es_jugada in cartas_en_mesa:
+        id_carta = id(card)
+        ids_en_mesa.add(id_carta)
+
+        sprite = sprites.get(id_carta)
+        if sprite is None:
+            sprite = SpriteCarta(card)
+            sprites[id_carta] = sprite
+            grupo.add(sprite, layer=CAPA_JUGADA if es_jugada else CAPA_MAZO)
+
+        sprite.con_hover = es_jugada
+        sprite.actualizar(mouse_pos)
+
+        nueva_capa = calcular_capa_sprite(sprite, es_jugada)
+        if grupo.get_layer_of_sprite(sprite) != nueva_capa:
+            grupo.change_layer(sprite, nueva_capa)
+            sprite.dirty = 1
+
+    for id_carta in [id_carta for id_carta in sprites if id_carta not in ids_en_mesa]:
+        sprite = sprites.pop(id_carta)
+        render.marcar_rect(sprite.rect)
+        grupo.remove(sprite)
+
+def draw_capa(capa: dict, screen: pg.Surface):
+    """
+    Dibuja las cartas de la capa. Ademas de las cartas que cambiaron, se redibujan las partes de las demas
+    que quedan dentro de la zona de la pantalla que se repinto en este frame.
+
+    Args:
+        capa: Capa de cartas
+        screen: Superficie donde se dibujan las cartas
+
+    Returns:
+        None
+    """
+    grupo = capa['grupo']
+    grupo.repaint_rect(screen.get_clip())
+    grupo.draw(screen)
@@ -5,168 +5,274 @@ Provee funciones para inicializar, visualizar y obtener estadisticas de las cart
 
 import modules.auxiliar as aux
 import modules.variables as var
+import modules.render as render
+import modules.recursos as recursos
+import modules.ritmo as ritmo
 import pygame as pg
 
-def inicializar_carta(dict_card: dict, coords: list[int]) -> dict:
+class Carta:
+    '''
+    Carta del juego. Guarda los datos de la carta, sus estadisticas con el bonus de estrellas ya aplicado
+    y su estado en pantalla. Con __slots__ cada carta ocupa mucha menos memoria que un diccionario
+    '''
+    __slots__ = (
+        'id', 'hp', 'atk', 'defensa', 'estrellas', 'hp_efectivo', 'atk_efectivo', 'def_efectivo',
+        'ruta_frente', 'ruta_reverso', 'visible', 'coordenadas', 'imagen', 'rect', 'frame_zoom', 'frame_zoom_objetivo'
+    )
+
+    def __init__(self, datos_carta: dict, coords: list[int]):
+        self.id = datos_carta.get('id')
+        self.hp = datos_carta.get('hp')
+        self.atk = datos_carta.get('atk')
+        self.defensa = datos_carta.get('def')
+        self.estrellas = datos_carta.get('estrellas', 0)
+        self.ruta_frente = datos_carta.get('ruta_frente')
+        self.ruta_reverso = datos_carta.get('ruta_reverso')
+
+        # El bonus de estrellas se calcula una sola vez, no en cada comparacion del combate
+        self.hp_efectivo = calcular_bonus_estrellas(self, self.hp)
+        self.atk_efectivo = calcular_bonus_estrellas(self, self.atk)
+        self.def_efectivo = calcular_bonus_estrellas(self, self.defensa)
+
+        self.visible = False
+        self.coordenadas = coords
+        self.imagen = None
+        self.rect = None
+        self.frame_zoom = 0
+        self.frame_zoom_objetivo = 0
+
+def inicializar_carta(dict_card: dict, coords: list[int]) -> Carta:
     """
-    Inicializa una carta con sus propiedades visuales y de estado.
+    Crea una carta del juego a partir de sus datos, con sus propiedades visuales y de estado.
     
     Args:
         dict_card: Diccionario con los datos base de la carta
         coords: Coordenadas iniciales (x, y) de la carta en pantalla
         
     Returns:
-        dict: Carta inicializada con todas sus propiedades
+        Carta: Carta inicializada con todas sus propiedades
     """
-    card = dict_card
-    card['visible'] = False
-    card['coordenadas'] = coords
-
-    card['imagen'] = None
-    card['rect'] = None
-
-    return card
+    return Carta(dict_card, coords)
 
-def esta_visible(dict_card: dict) -> bool:
+def esta_visible(card: Carta) -> bool:
     """
     Verifica si una carta esta visible mostrando su frente.
     
     Args:
-        dict_card: Diccionario con los datos de la carta
+        card: Carta del juego
         
     Returns:
         bool: True si la carta esta visible, False si esta oculta
     """
-    return dict_card.get('visible', False)
+    return card.visible
 
-def cambiar_visibilidad(dict_card: dict):
+def cambiar_visibilidad(card: Carta):
     """
     Alterna el estado de visibilidad de una carta entre visible y oculta.
     
     Args:
-        dict_card: Diccionario con los datos de la carta
+        card: Carta del juego
         
     Returns:
         None: Modifica el estado de visibilidad de la carta directamente
     """
-    dict_card['visible'] = not dict_card.get('visible')
+    card.visible = not card.visible
 
-def get_hp_carta(dict_card: dict) -> int:
+def get_hp_carta(card: Carta) -> int:
     """
     Obtiene los puntos de vida de una carta.
     
     Args:
-        dict_card: Diccionario con los datos de la carta
+        card: Carta del juego
         
     Returns:
         int: Puntos de vida de la carta
     """
-    return dict_card.get('hp')
+    return card.hp
 
 
-def get_def_carta(dict_card: dict) -> int:
+def get_def_carta(card: Carta) -> int:
     """
     Obtiene los puntos de defensa de una carta.
     
     Args:
-        dict_card: Diccionario con los datos de la carta
+        card: Carta del juego
         
     Returns:
         int: Puntos de defensa de la carta
     """
-    return dict_card.get('def')
-def get_atk_carta(dict_card: dict) -> int:
+    return card.defensa
+def get_atk_carta(card: Carta) -> int:
     """
     Obtiene los puntos de ataque de una carta.
     
     Args:
-        dict_card: Diccionario con los datos de la carta
+        card: Carta del juego
         
     Returns:
         int: Puntos de ataque de la carta
     """
-    return dict_card.get('atk')
-def get_estrellas_carta(dict_card: dict) -> int:
+    return card.atk
+def get_estrellas_carta(card: Carta) -> int:
     """
     Obtiene la cantidad de estrellas de una carta.
     
     Args:
-        dict_card: Diccionario con los datos de la carta
+        card: Carta del juego
         
     Returns:
         int: Numero de estrellas de la carta
     """
-    return dict_card.get('estrellas', 0)
+    return card.estrellas
+
+def get_hp_efectivo_carta(card: Carta) -> int:
+    """
+    Obtiene los puntos de vida de una carta con el bonus de estrellas aplicado.
+    
+    Args:
+        card: Carta del juego
+        
+    Returns:
+        int: Puntos de vida con bonus
+    """
+    return card.hp_efectivo
+
+def get_atk_efectivo_carta(card: Carta) -> int:
+    """
+    Obtiene los puntos de ataque de una carta con el bonus de estrellas aplicado.
+    
+    Args:
+        card: Carta del juego
+        
+    Returns:
+        int: Puntos de ataque con bonus
+    """
+    return card.atk_efectivo
+
+def get_def_efectivo_carta(card: Carta) -> int:
+    """
+    Obtiene los puntos de defensa de una carta con el bonus de estrellas aplicado.
+    
+    Args:
+        card: Carta del juego
+        
+    Returns:
+        int: Puntos de defensa con bonus
+    """
+    return card.def_efectivo
 
-def calcular_bonus_estrellas(dict_card: dict, stat_base: int) -> int:
+def calcular_bonus_estrellas(card: Carta, stat_base: int) -> int:
     """
     Calcula el bonus de estrellas aplicado a una estadistica base donde cada estrella suma 1% adicional.
+    Se usa al crear la carta; durante el juego se leen los valores ya calculados.
     
     Args:
-        dict_card: Diccionario con los datos de la carta
+        card: Carta del juego
         stat_base: Valor base de la estadistica a potenciar
         
     Returns:
         int: Valor de la estadistica con el bonus aplicado
     """
-    estrellas = get_estrellas_carta(dict_card)
+    estrellas = card.estrellas
     bonus_porcentaje = estrellas / 100
     stat_con_bonus = int(stat_base * (1 + bonus_porcentaje))
     return stat_con_bonus
 
 
-def asignar_coordenadas_carta(dict_card: dict, coordenadas: tuple[int]):
+def asignar_coordenadas_carta(card: Carta, coordenadas: tuple[int]):
     """
     Asigna nuevas coordenadas a una carta en pantalla.
     
     Args:
-        dict_card: Diccionario con los datos de la carta
+        card: Carta del juego
         coordenadas: Tupla con las nuevas coordenadas (x, y)
         
     Returns:
         None: Modifica las coordenadas de la carta directamente
     """
-    dict_card['coordenadas'] = coordenadas
+    card.coordenadas = coordenadas
     
 
 
-def draw_carta(dict_card: dict, screen: pg.Surface, mouse_pos=None):
+def zoom_en_animacion(card: Carta) -> bool:
+    """
+    Verifica si la carta todavia no llego al tamanio de zoom que le corresponde.
+
+    Args:
+        card: Carta del juego
+
+    Returns:
+        bool: True si quedan frames de la animacion de zoom por dibujar
+    """
+    return card.frame_zoom != card.frame_zoom_objetivo
+
+def actualizar_carta(card: Carta, mouse_pos=None):
     """
-    Dibuja una carta en pantalla con efecto de zoom al pasar el mouse.
+    Avanza la animacion de zoom de una carta y actualiza su imagen y su rect, marcando las zonas que cambiaron.
     
     Args:
-        dict_card: Diccionario con los datos de la carta
-        screen: Superficie de Pygame donde se dibujara la carta
+        card: Carta del juego
         mouse_pos: Posicion del mouse para detectar hover (opcional)
         
     Returns:
-        None: Dibuja la carta en la pantalla
+        None: Modifica la imagen y el rect de la carta directamente
     """
     # Determinar si hay hover (colision con mouse)
     is_hovering = False
-    if mouse_pos and dict_card.get('rect'):
-        is_hovering = dict_card['rect'].collidepoint(mouse_pos)
+    if mouse_pos and card.rect:
+        is_hovering = card.rect.collidepoint(mouse_pos)
     
-    # Tamanio base con zoom al pasar mouse
-    if is_hovering:
-        carta_size = var.CARTA_SIZE_HOVER
-    else:
-        carta_size = var.CARTA_SIZE_NORMAL
+    # El zoom avanza un frame por dibujo hacia el tamanio hover o hacia el normal
+    card.frame_zoom_objetivo = var.CARTA_ZOOM_FRAMES if is_hovering else 0
+    frame_zoom = card.frame_zoom
+    if frame_zoom < card.frame_zoom_objetivo:
+        frame_zoom += 1
+    elif frame_zoom > card.frame_zoom_objetivo:
+        frame_zoom -= 1
+    card.frame_zoom = frame_zoom
+    if zoom_en_animacion(card):
+        ritmo.marcar_animacion()
     
-    if dict_card.get('visible'):
-        dict_card['imagen'] = aux.redimesionar_imagen(dict_card.get('ruta_frente'), carta_size)
+    imagen_previa = card.imagen
+    rect_previo = card.rect
+
+    # Los frames del zoom salen de la cache de recursos, sin escalar ni leer el disco en cada frame
+    if card.visible:
+        ruta_img = card.ruta_frente
     else:
-        dict_card['imagen'] = aux.redimesionar_imagen(dict_card.get('ruta_reverso'), carta_size)
+        ruta_img = card.ruta_reverso
+    card.imagen = recursos.obtener_frame_zoom(ruta_img, frame_zoom)
 
-    dict_card['rect'] = dict_card['imagen'].get_rect()
+    card.rect = card.imagen.get_rect()
     
-    # Mantener el centro al hacer zoom para que no salte
-    if is_hovering and dict_card.get('coordenadas'):
-        dict_card['rect'].center = (
-            dict_card.get('coordenadas')[0] + 100,
-            dict_card.get('coordenadas')[1] + 150
+    # El centro se desplaza de a poco hacia el centro del zoom para que no salte
+    if frame_zoom and card.coordenadas:
+        x, y = card.coordenadas
+        imagen_normal = recursos.obtener_frame_zoom(ruta_img, 0)
+        progreso = frame_zoom / var.CARTA_ZOOM_FRAMES
+        centro_normal = (x + imagen_normal.get_width() / 2, y + imagen_normal.get_height() / 2)
+        centro_hover = (x + 100, y + 150)
+        card.rect.center = (
+            round(centro_normal[0] + (centro_hover[0] - centro_normal[0]) * progreso),
+            round(centro_normal[1] + (centro_hover[1] - centro_normal[1]) * progreso)
         )
     else:
-        dict_card['rect'].topleft = dict_card.get('coordenadas')
+        card.rect.topleft = card.coordenadas
+
+    if card.imagen is not imagen_previa or card.rect != rect_previo:
+        render.marcar_cambio(rect_previo, card.rect)
 
-    screen.blit(dict_card['imagen'], dict_card['rect'])
\ No newline at end of file
+def draw_carta(card: Carta, screen: pg.Surface, mouse_pos=None):
+    """
+    Dibuja una carta en pantalla con una animacion de zoom al pasar el mouse.
+    
+    Args:
+        card: Carta del juego
+        screen: Superficie de Pygame donde se dibujara la carta
+        mouse_pos: Posicion del mouse para detectar hover (opcional)
+        
+    Returns:
+        None: Dibuja la carta en la pantalla
+    """
+    actualizar_carta(card, mouse_pos)
+    screen.blit(card.imagen, card.rect)
@@ -0,0 +1,159 @@
+"""
+Modulo de efectos visuales del juego.
+Un efecto guarda sus frames de animacion ya escalados y con su transparencia aplicada, y el sonido que lo acompania,
+de modo que reproducirlo no lee el disco ni escala imagenes.
+"""
+
+import pygame as pg
+import modules.recursos as recursos
+import modules.sonido as sonido
+import modules.render as render
+import modules.ritmo as ritmo
+
+def calcular_escala_frame(progreso: float, escala_inicial: float) -> float:
+    """
+    Calcula la escala de un frame: el efecto crece rapido hasta su tamanio final durante el primer tercio.
+
+    Args:
+        progreso: Avance de la animacion entre 0 y 1
+        escala_inicial: Escala con la que aparece el efecto, entre 0 y 1
+
+    Returns:
+        float: Escala del frame entre escala_inicial y 1
+    """
+    avance = min(1, progreso * 3)
+    avance = 1 - (1 - avance) ** 2
+    return escala_inicial + (1 - escala_inicial) * avance
+
+def calcular_alpha_frame(progreso: float) -> int:
+    """
+    Calcula la transparencia de un frame: el efecto se desvanece durante el ultimo 40% de la animacion.
+
+    Args:
+        progreso: Avance de la animacion entre 0 y 1
+
+    Returns:
+        int: Alpha del frame entre 0 y 255
+    """
+    if progreso < 0.6:
+        return 255
+    return int(255 * (1 - progreso) / 0.4)
+
+def generar_frames(imagen: pg.Surface, tamanio: int, cantidad_frames: int, escala_inicial: float) -> list[pg.Surface]:
+    """
+    Genera los frames de la animacion de un efecto a partir de su imagen.
+
+    Args:
+        imagen: Imagen original del efecto
+        tamanio: Tamanio final en pixeles del lado del efecto
+        cantidad_frames: Cantidad de frames a generar
+        escala_inicial: Escala con la que aparece el efecto, entre 0 y 1
+
+    Returns:
+        list: Superficies de cada frame
+    """
+    imagen_final = pg.transform.smoothscale(imagen, (tamanio, tamanio))
+    frames = []
+
+    for indice in range(cantidad_frames):
+        progreso = indice / max(1, cantidad_frames - 1)
+        lado = max(1, round(tamanio * calcular_escala_frame(progreso, escala_inicial)))
+
+        if lado == tamanio:
+            frame = imagen_final.copy()
+        else:
+            frame = pg.transform.smoothscale(imagen_final, (lado, lado))
+        frame.set_alpha(calcular_alpha_frame(progreso))
+        frames.append(frame)
+
+    return frames
+
+def crear_efecto(ruta_imagen: str, tamanio: int, duracion: int, cantidad_frames: int, escala_inicial: int, ruta_sonido: str = None) -> dict:
+    """
+    Crea un efecto con sus frames y su sonido precargados.
+
+    Args:
+        ruta_imagen: Ruta de la imagen del efecto
+        tamanio: Tamanio final en pixeles del lado del efecto
+        duracion: Duracion del efecto en milisegundos
+        cantidad_frames: Cantidad de frames de la animacion
+        escala_inicial: Porcentaje del tamanio con el que aparece el efecto
+        ruta_sonido: Ruta del sonido que acompania al efecto (opcional)
+
+    Returns:
+        dict: Efecto listo para reproducirse
+    """
+    efecto = {}
+    efecto['duracion'] = duracion
+    efecto['frames'] = generar_frames(recursos.cargar_imagen(ruta_imagen), tamanio, cantidad_frames, escala_inicial / 100)
+    recursos.descartar_original(ruta_imagen)
+    efecto['ruta_sonido'] = ruta_sonido
+    efecto['frame_actual'] = None
+    efecto['rect'] = None
+
+    if ruta_sonido:
+        sonido.cargar_efecto_sonido(ruta_sonido)
+
+    return efecto
+
+def reproducir_sonido(efecto: dict):
+    """
+    Reproduce el sonido del efecto en el canal reservado para efectos.
+
+    Args:
+        efecto: Diccionario del efecto
+
+    Returns:
+        None
+    """
+    if efecto.get('ruta_sonido'):
+        sonido.play_efecto_sonido(efecto.get('ruta_sonido'))
+
+def obtener_indice_frame(efecto: dict, tiempo_transcurrido: int) -> int:
+    """
+    Obtiene el frame que corresponde mostrar segun el tiempo transcurrido desde que empezo el efecto.
+
+    Args:
+        efecto: Diccionario del efecto
+        tiempo_transcurrido: Milisegundos desde el inicio del efecto
+
+    Returns:
+        int: Indice del frame, o None si el efecto no esta en curso
+    """
+    if tiempo_transcurrido < 0 or tiempo_transcurrido >= efecto.get('duracion'):
+        return None
+    return tiempo_transcurrido * len(efecto.get('frames')) // efecto.get('duracion')
+
+def draw_efecto(efecto: dict, screen: pg.Surface, centro: tuple[int, int], tiempo_transcurrido: int):
+    """
+    Dibuja el frame del efecto que corresponde al tiempo transcurrido, marcando las zonas que cambian.
+    Al terminar el efecto se marca la zona que ocupaba para que se redibuje.
+
+    Args:
+        efecto: Diccionario del efecto
+        screen: Superficie donde se dibuja el efecto
+        centro: Centro del efecto en pantalla
+        tiempo_transcurrido: Milisegundos desde el inicio del efecto
+
+    Returns:
+        None
+    """
+    indice = obtener_indice_frame(efecto, tiempo_transcurrido)
+    rect_previo = efecto.get('rect')
+
+    if indice is None:
+        if rect_previo:
+            render.marcar_rect(rect_previo)
+        efecto['frame_actual'] = None
+        efecto['rect'] = None
+        return
+
+    ritmo.marcar_animacion()
+    frame = efecto['frames'][indice]
+    rect = frame.get_rect(center=centro)
+    if indice != efecto.get('frame_actual'):
+        render.marcar_cambio(rect_previo, rect)
+        efecto['frame_actual'] = indice
+        efecto['rect'] = rect
+
+    screen.blit(frame, rect)
@@ -0,0 +1,118 @@
+"""
+Modulo de estadisticas de un mazo guardadas por columnas.
+Los HP, ATK, DEF y estrellas de las cartas de un mazo se guardan en un arreglo por estadistica, en el mismo orden
+que las cartas. Los totales, el desglose por estrellas y las estadisticas de las cartas que quedan en el mazo
+salen de reducciones sobre esos arreglos, sin recorrer las cartas una por una. Usa NumPy si esta instalado y
+si no el modulo array de la biblioteca estandar.
+"""
+
+from array import array
+import modules.carta as carta
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Columna -> funcion que obtiene ese valor de una carta
+COLUMNAS = {
+    'hp': carta.get_hp_carta,
+    'atk': carta.get_atk_carta,
+    'def': carta.get_def_carta,
+    'estrellas': carta.get_estrellas_carta
+}
+COLUMNAS_STATS = ('hp', 'atk', 'def')
+
+def crear_columna(valores: list[int]):
+    """
+    Crea el arreglo de una columna con enteros de 64 bits, para que sumar mazos muy grandes no desborde.
+
+    Args:
+        valores: Valores de la columna
+
+    Returns:
+        ndarray o array: Arreglo con los valores
+    """
+    if np is not None:
+        return np.array(valores, dtype=np.int64)
+    return array('q', valores)
+
+def sumar_columna(columna, cantidad: int = None) -> int:
+    """
+    Suma los valores de una columna, o solo los de las primeras cartas.
+
+    Args:
+        columna: Arreglo de la columna
+        cantidad: Cantidad de cartas desde el principio a sumar (opcional, por defecto todas)
+
+    Returns:
+        int: Suma de los valores
+    """
+    valores = columna if cantidad is None else columna[:cantidad]
+    if np is not None:
+        return int(valores.sum())
+    return sum(valores)
+
+def crear_estadisticas_mazo(cartas: list) -> dict:
+    """
+    Arma las columnas de estadisticas de un mazo.
+
+    Args:
+        cartas: Cartas del mazo, en el orden en que se guardan en el participante
+
+    Returns:
+        dict: Estadisticas con la cantidad de cartas y un arreglo por columna
+    """
+    estadisticas = {}
+    estadisticas['cantidad'] = len(cartas)
+    estadisticas['columnas'] = {}
+    for nombre_columna, get_valor in COLUMNAS.items():
+        estadisticas['columnas'][nombre_columna] = crear_columna([get_valor(card) for card in cartas])
+    return estadisticas
+
+def calcular_totales(estadisticas: dict, cantidad: int = None) -> dict:
+    """
+    Suma HP, ATK y DEF de todo el mazo o de sus primeras cartas.
+
+    Args:
+        estadisticas: Estadisticas del mazo
+        cantidad: Cantidad de cartas desde el principio a sumar (opcional, por defecto todas)
+
+    Returns:
+        dict: Diccionario 'hp', 'atk', 'def' -> total
+    """
+    columnas = estadisticas.get('columnas')
+    return {nombre_columna: sumar_columna(columnas[nombre_columna], cantidad) for nombre_columna in COLUMNAS_STATS}
+
+def calcular_desglose_estrellas(estadisticas: dict) -> dict:
+    """
+    Agrupa las cartas del mazo por cantidad de estrellas y suma HP, ATK y DEF de cada grupo.
+
+    Args:
+        estadisticas: Estadisticas del mazo
+
+    Returns:
+        dict: Diccionario estrellas -> {'cantidad', 'hp', 'atk', 'def'}, ordenado por estrellas
+    """
+    columnas = estadisticas.get('columnas')
+    desglose = {}
+
+    if np is not None:
+        valores_estrellas, grupos = np.unique(columnas['estrellas'], return_inverse=True)
+        cantidades = np.bincount(grupos, minlength=len(valores_estrellas))
+        sumas = {}
+        for nombre_columna in COLUMNAS_STATS:
+            sumas[nombre_columna] = np.zeros(len(valores_estrellas), dtype=np.int64)
+            np.add.at(sumas[nombre_columna], grupos, columnas[nombre_columna])
+        for indice, estrellas in enumerate(valores_estrellas.tolist()):
+            desglose[estrellas] = {'cantidad': int(cantidades[indice])}
+            for nombre_columna in COLUMNAS_STATS:
+                desglose[estrellas][nombre_columna] = int(sumas[nombre_columna][indice])
+        return desglose
+
+    for indice, estrellas in enumerate(columnas['estrellas']):
+        grupo = desglose.setdefault(estrellas, {'cantidad': 0, 'hp': 0, 'atk': 0, 'def': 0})
+        grupo['cantidad'] += 1
+        for nombre_columna in COLUMNAS_STATS:
+            grupo[nombre_columna] += columnas[nombre_columna][indice]
+    return dict(sorted(desglose.items()))
@@ -6,6 +6,18 @@ Provee funciones comunes para crear, actualizar, dibujar y gestionar transicione
 import pygame as pg
 import modules.variables as var
 import modules.sonido as sonido
+import modules.recursos as recursos
+import modules.render as render
+import modules.perfilador as perfilador
+
+LISTAS_WIDGETS = ('widgets_list', 'widgets_list_bonus', 'lista_ranking_GUI')
+
+registro_forms = {}
+
+navegacion = {
+    "form_activo": None,
+    "pila": []
+}
 
 def create_base_form(dict_form_data: dict) -> dict:
     """
@@ -24,16 +36,167 @@ def create_base_form(dict_form_data: dict) -> dict:
     form['screen'] = dict_form_data.get('screen')
     form['active'] = dict_form_data.get('active')
     form['music_path'] = dict_form_data.get('music_path')
-    form['surface'] = pg.image.load(dict_form_data.get('background')).convert_alpha()
-    form['surface'] = pg.transform.scale(form.get('surface'), dict_form_data.get('screen_dimensions'))
+    form['background'] = dict_form_data.get('background')
+    form['screen_dimensions'] = dict_form_data.get('screen_dimensions')
+    form['surface'] = recursos.adquirir_superficie(form.get('background'), form.get('screen_dimensions'), form.get('name'))
 
     form['rect'] = form.get('surface').get_rect()
     form['rect'].x = dict_form_data.get('coord')[0]
     form['rect'].y = dict_form_data.get('coord')[1]
     form['music_config'] = dict_form_data.get('music_config')
+    form['redibujo_por_cambio'] = dict_form_data.get('redibujo_por_cambio', False)
+    form['estado_dibujo'] = None
     
     return form
 
+def registrar_form(form_name: str, fabrica, dict_form_data: dict, funcion_update, funcion_draw):
+    """
+    Registra como crear, actualizar y dibujar un formulario sin construirlo. Se construye la primera vez que se lo pide.
+    
+    Args:
+        form_name: Nombre del formulario
+        fabrica: Funcion que crea el formulario a partir de sus datos de configuracion
+        dict_form_data: Diccionario con los datos de configuracion del formulario
+        funcion_update: Funcion que actualiza el formulario, recibe el formulario y los eventos
+        funcion_draw: Funcion que dibuja el formulario
+        
+    Returns:
+        None
+    """
+    registro_forms[form_name] = {
+        'fabrica': fabrica,
+        'datos': dict_form_data,
+        'update': funcion_update,
+        'draw': funcion_draw,
+        'fondo_precargado': False
+    }
+
+def get_registro_form(form_name: str) -> dict:
+    """
+    Obtiene el registro de un formulario, con sus funciones de update y draw.
+    
+    Args:
+        form_name: Nombre del formulario
+        
+    Returns:
+        dict: Registro del formulario, o None si no esta registrado
+    """
+    return registro_forms.get(form_name)
+
+def get_form_activo() -> dict:
+    """
+    Obtiene el formulario activo.
+    
+    Args:
+        Ninguno
+        
+    Returns:
+        dict: Formulario activo, o None si todavia no se activo ninguno
+    """
+    return navegacion['form_activo']
+
+def form_creado(form_name: str) -> bool:
+    """
+    Verifica si un formulario ya fue construido.
+    
+    Args:
+        form_name: Nombre del formulario
+        
+    Returns:
+        bool: True si el formulario ya existe
+    """
+    return form_name in var.dict_forms_status
+
+def obtener_form(form_name: str) -> dict:
+    """
+    Obtiene un formulario, construyendolo con su fabrica registrada si todavia no existe.
+    
+    Args:
+        form_name: Nombre del formulario
+        
+    Returns:
+        dict: Formulario pedido, o None si no esta creado ni registrado
+    """
+    if not form_creado(form_name) and form_name in registro_forms:
+        registro = registro_forms[form_name]
+        with perfilador.fase(registro['fabrica'].__name__):
+            registro['fabrica'](registro['datos'])
+        if registro['fondo_precargado']:
+            # El formulario ya tiene su propia referencia al fondo, se suelta la de la precarga
+            datos = registro['datos']
+            recursos.liberar_superficie(datos.get('background'), datos.get('screen_dimensions'), f'precarga_{form_name}')
+            registro['fondo_precargado'] = False
+    return var.dict_forms_status.get(form_name)
+
+def precargar_fondo_pendiente() -> bool:
+    """
+    Prepara el fondo escalado de un formulario todavia no construido, para que construirlo despues sea mas rapido.
+    Precarga un solo fondo por llamada para no demorar el frame.
+    
+    Args:
+        Ninguno
+        
+    Returns:
+        bool: True si se precargo un fondo, False si no quedaba ninguno pendiente
+    """
+    for form_name, registro in registro_forms.items():
+        if form_creado(form_name) or registro['fondo_precargado']:
+            continue
+        datos = registro['datos']
+        recursos.adquirir_superficie(datos.get('background'), datos.get('screen_dimensions'), f'precarga_{form_name}')
+        registro['fondo_precargado'] = True
+        return True
+    return False
+
+def cambiar_fondo(form_data: dict, background: str):
+    """
+    Reemplaza el fondo del formulario por otra imagen compartida, liberando la referencia al fondo anterior.
+    
+    Args:
+        form_data: Diccionario con los datos del formulario
+        background: Ruta de la nueva imagen de fondo
+        
+    Returns:
+        None
+    """
+    if background == form_data.get('background'):
+        return
+    nuevo_fondo = recursos.adquirir_superficie(background, form_data.get('screen_dimensions'), form_data.get('name'))
+    recursos.liberar_superficie(form_data.get('background'), form_data.get('screen_dimensions'), form_data.get('name'))
+    form_data['background'] = background
+    form_data['surface'] = nuevo_fondo
+    render.marcar_pantalla_completa()
+
+def get_memoria_form(form_data: dict) -> dict:
+    """
+    Calcula la memoria de superficies de un formulario: las compartidas que adquirio
+    y las propias guardadas en el formulario (como capas precompuestas).
+    
+    Args:
+        form_data: Diccionario con los datos del formulario
+        
+    Returns:
+        dict: Bytes compartidos, propios y totales del formulario
+    """
+    compartida = recursos.get_memoria_propietarios().get(form_data.get('name'), 0)
+    propia = 0
+    for valor in form_data.values():
+        if isinstance(valor, pg.Surface) and valor is not form_data.get('surface') and valor is not form_data.get('screen'):
+            propia += recursos.calcular_bytes_superficie(valor)
+    return {'compartida': compartida, 'propia': propia, 'total': compartida + propia}
+
+def get_memoria_formularios() -> dict:
+    """
+    Calcula la memoria de superficies de cada formulario creado.
+    
+    Args:
+        Ninguno
+        
+    Returns:
+        dict: Memoria de cada formulario por nombre
+    """
+    return {nombre: get_memoria_form(form) for nombre, form in var.dict_forms_status.items()}
+
 def draw_widgets(form_data: dict):
     """
     Dibuja todos los widgets contenidos en la lista de widgets del formulario.
@@ -66,7 +229,7 @@ def update_widgets(form_data: dict):
 
 def set_active(form_name: str):
     """
-    Activa un formulario especifico y desactiva todos los demas.
+    Activa un formulario especifico y desactiva el que estaba activo.
     
     Args:
         form_name: Nombre del formulario a activar
@@ -74,10 +237,62 @@ def set_active(form_name: str):
     Returns:
         None: Modifica el estado de los formularios
     """
-    for form in var.dict_forms_status.values():
-        form['active'] = False
-    var.dict_forms_status[form_name]['active'] = True
+    form_destino = obtener_form(form_name)
+    form_anterior = navegacion['form_activo']
+    if form_anterior is not None:
+        form_anterior['active'] = False
+    form_destino['active'] = True
+    navegacion['form_activo'] = form_destino
+    render.marcar_pantalla_completa()
+
+def apilar_form(form_name: str):
+    """
+    Cambia a un formulario recordando el actual, para volver a el con desapilar_form (por ejemplo pausa o deseos).
+    
+    Args:
+        form_name: Nombre del formulario a mostrar encima del actual
+        
+    Returns:
+        None
+    """
+    form_actual = navegacion['form_activo']
+    if form_actual is not None:
+        navegacion['pila'].append(form_actual.get('name'))
+    cambiar_pantalla(form_name)
 
+def desapilar_form() -> bool:
+    """
+    Vuelve al formulario que estaba activo antes del ultimo apilar_form.
+    
+    Args:
+        Ninguno
+        
+    Returns:
+        bool: True si habia un formulario al que volver
+    """
+    if not navegacion['pila']:
+        return False
+    cambiar_pantalla(navegacion['pila'].pop())
+    return True
+
+def volver_a_form(form_name: str):
+    """
+    Vuelve a un formulario de la pila descartando los que estaban encima. Si el formulario no esta en la pila,
+    la pila se vacia y se cambia a el directamente.
+    
+    Args:
+        form_name: Nombre del formulario destino
+        
+    Returns:
+        None
+    """
+    pila = navegacion['pila']
+    if form_name in pila:
+        del pila[pila.index(form_name) + 1:]
+        desapilar_form()
+    else:
+        pila.clear()
+        cambiar_pantalla(form_name)
 
 
 def cambiar_pantalla(form_name: str):
@@ -97,7 +312,7 @@ def cambiar_pantalla(form_name: str):
     set_active(form_name)
 
     # Reproducir musica del nuevo formulario activo
-    form_activo = var.dict_forms_status.get(form_name)
+    form_activo = obtener_form(form_name)
     if form_activo:
         music_on(form_activo)
 
@@ -112,10 +327,10 @@ def pausar_juego():
     Returns:
         None
     """
-    form_pause = var.dict_forms_status.get(var.FORM_NAMES['PAUSE'])
+    form_pause = obtener_form(var.FORM_NAMES['PAUSE'])
     form_pause['previous_volume'] = pg.mixer.music.get_volume()
     pg.mixer.music.set_volume(var.PAUSE_VOLUME)
-    cambiar_pantalla(var.FORM_NAMES['PAUSE'])
+    apilar_form(var.FORM_NAMES['PAUSE'])
 
 def despausar_juego(param=None):
     """
@@ -127,10 +342,10 @@ def despausar_juego(param=None):
     Returns:
         None
     """
-    form_pause = var.dict_forms_status.get(var.FORM_NAMES['PAUSE'])
+    form_pause = obtener_form(var.FORM_NAMES['PAUSE'])
     if form_pause.get('previous_volume') is not None:
         pg.mixer.music.set_volume(form_pause['previous_volume'])
-    cambiar_pantalla(var.FORM_NAMES['STAGE'])
+    volver_a_form(var.FORM_NAMES['STAGE'])
 
 def salir_de_pause(destino: str):
     """
@@ -142,10 +357,10 @@ def salir_de_pause(destino: str):
     Returns:
         None
     """
-    form_pause = var.dict_forms_status.get(var.FORM_NAMES['PAUSE'])
+    form_pause = obtener_form(var.FORM_NAMES['PAUSE'])
     if form_pause.get('previous_volume') is not None:
         pg.mixer.music.set_volume(form_pause['previous_volume'])
-    cambiar_pantalla(destino)
+    volver_a_form(destino)
 
 def music_on(form_data: dict):
     """
@@ -195,14 +410,65 @@ def update(form_data: dict):
     """
     update_widgets(form_data)
 
-def draw(form_data: dict):
+def get_widgets_form(form_data: dict) -> list:
+    """
+    Obtiene todos los widgets del formulario, incluyendo las listas de widgets opcionales.
+    
+    Args:
+        form_data: Diccionario con los datos del formulario
+        
+    Returns:
+        list: Widgets del formulario
+    """
+    widgets = []
+    for lista in LISTAS_WIDGETS:
+        widgets.extend(form_data.get(lista, []))
+    return widgets
+
+def calcular_estado_dibujo(form_data: dict) -> tuple:
+    """
+    Resume lo que define como se ve el formulario: la imagen y posicion de cada widget y la posicion del cursor.
+    
+    Args:
+        form_data: Diccionario con los datos del formulario
+        
+    Returns:
+        tuple: Estado comparable con el de otro frame
+    """
+    estado_widgets = tuple((id(widget.image), tuple(widget.rect)) for widget in get_widgets_form(form_data))
+    return (pg.mouse.get_pos(), estado_widgets)
+
+def necesita_redibujo(form_data: dict) -> bool:
+    """
+    Verifica si el formulario tiene que dibujarse en este frame: porque se pidio un redibujo completo
+    (al activarse el formulario o por un click o tecla), o porque cambio algun widget o la posicion del cursor.
+    
+    Args:
+        form_data: Diccionario con los datos del formulario
+        
+    Returns:
+        bool: True si el formulario cambio desde el ultimo frame dibujado
+    """
+    estado = calcular_estado_dibujo(form_data)
+    if render.redibujo_completo_pendiente() or estado != form_data.get('estado_dibujo'):
+        form_data['estado_dibujo'] = estado
+        return True
+    return False
+
+def draw(form_data: dict, fondo: pg.Surface = None):
     """
     Dibuja el fondo del formulario en la pantalla.
+    En modo de rectangulos sucios, primero limita el dibujo a las zonas que cambiaron.
     
     Args:
         form_data: Diccionario con los datos del formulario
+        fondo: Superficie de pantalla completa a usar en lugar del fondo del formulario (opcional)
         
     Returns:
         None
     """
-    form_data['screen'].blit(form_data.get('surface'), form_data.get('rect'))
\ No newline at end of file
+    render.iniciar_frame(form_data['screen'], get_widgets_form(form_data))
+    if fondo is not None:
+        form_data['screen'].blit(fondo, (0, 0))
+    else:
+        form_data['screen'].blit(form_data.get('surface'), form_data.get('rect'))
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Formulario de carga mostrado al iniciar el juego.
+Muestra una barra con el progreso real de la precarga de imagenes.
+"""
+
+import pygame as pg
+from modules.forms.widgets import (
+    Label
+)
+import modules.variables as var
+import modules.precarga as precarga
+
+def create_form_carga(dict_form_data: dict) -> dict:
+    """
+    Crea el formulario de carga. No usa fondo porque las imagenes todavia no estan cargadas.
+
+    Args:
+        dict_form_data: Diccionario con los datos de configuracion del formulario
+
+    Returns:
+        dict: Formulario de carga inicializado con sus widgets
+    """
+    form = {}
+    form['name'] = dict_form_data.get('name')
+    form['screen'] = dict_form_data.get('screen')
+    form['precarga'] = dict_form_data.get('precarga')
+    form['progreso'] = 0
+
+    form['rect_barra'] = pg.Rect(0, 0, 800, 40)
+    form['rect_barra'].center = (var.DIMENSION_PANTALLA[0] // 2, var.DIMENSION_PANTALLA[1] // 2 + 60)
+
+    form['lbl_titulo'] = Label(
+        x=var.DIMENSION_PANTALLA[0] // 2, y=var.DIMENSION_PANTALLA[1] // 2 - 40,
+        text='CARGANDO...', screen=form.get('screen'),
+        font_path=var.FONT_AKSARAKOMIK, font_size=70, color=var.colores['naranja']
+    )
+
+    form['lbl_progreso'] = Label(
+        x=var.DIMENSION_PANTALLA[0] // 2, y=var.DIMENSION_PANTALLA[1] // 2 + 130,
+        text='0%', screen=form.get('screen'),
+        font_path=var.FONT_AKSARAKOMIK, font_size=40, color=var.colores['blanco']
+    )
+
+    form['widgets_list'] = [
+        form.get('lbl_titulo'),
+        form.get('lbl_progreso')
+    ]
+
+    return form
+
+def update(form_dict_data: dict, eventos: list):
+    """
+    Procesa las imagenes ya decodificadas y actualiza el porcentaje mostrado.
+
+    Args:
+        form_dict_data: Diccionario con los datos del formulario
+        eventos: Lista de eventos de Pygame
+
+    Returns:
+        None
+    """
+    precarga.procesar_precarga(form_dict_data.get('precarga'))
+    progreso = precarga.get_progreso_precarga(form_dict_data.get('precarga'))
+
+    if progreso != form_dict_data.get('progreso'):
+        form_dict_data['progreso'] = progreso
+        form_dict_data['lbl_progreso'].update_text(f'{int(progreso * 100)}%', var.colores['blanco'])
+
+def draw(form_dict_data: dict):
+    """
+    Dibuja el titulo, la barra de progreso y el porcentaje de carga.
+
+    Args:
+        form_dict_data: Diccionario con los datos del formulario
+
+    Returns:
+        None
+    """
+    screen = form_dict_data.get('screen')
+    screen.fill(var.colores['negro'])
+
+    rect_barra = form_dict_data.get('rect_barra')
+    rect_progreso = rect_barra.copy()
+    rect_progreso.width = int(rect_barra.width * form_dict_data.get('progreso'))
+
+    pg.draw.rect(screen, var.colores['naranja'], rect_progreso)
+    pg.draw.rect(screen, var.colores['blanco'], rect_barra, 3)
+
+    for widget in form_dict_data.get('widgets_list'):
+        widget.draw()
+
+def esta_finalizado(form_dict_data: dict) -> bool:
+    """
+    Verifica si la precarga mostrada por el formulario termino.
+
+    Args:
+        form_dict_data: Diccionario con los datos del formulario
+
+    Returns:
+        bool: True si ya se procesaron todas las imagenes
+    """
+    return precarga.precarga_finalizada(form_dict_data.get('precarga'))
@@ -2,6 +2,7 @@
 Modulo controlador de formularios, gestiona la creacion, actualizacion y transicion entre formularios.
 """
 
+import time
 import pygame as pg
 import modules.forms.menu_form as menu_form
 import modules.forms.ranking_form as ranking_form
@@ -12,6 +13,9 @@ import modules.forms.form_pause as pause_form
 import modules.forms.form_stage as stage_form
 import modules.forms.form_name as form_name
 import modules.forms.form_wish as wish_form
+import modules.perfilador as perfilador
+import modules.overlay as overlay
+import modules.render as render
 
 def create_form_controller(screen: pg.Surface, datos_juego: dict):
     """
@@ -22,7 +26,7 @@ def create_form_controller(screen: pg.Surface, datos_juego: dict):
         datos_juego: Diccionario con los datos iniciales del juego
         
     Returns:
-        dict: Controlador de formularios inicializado con todos los formularios del juego
+        dict: Controlador de formularios con los formularios del juego registrados y el menu construido
     """
 
     controller = {} # Diccionario para almacenar el estado del controlador de formularios
@@ -37,93 +41,93 @@ def create_form_controller(screen: pg.Surface, datos_juego: dict):
     })
 
 
-    controller['forms_list'] = [
-        menu_form.create_form_menu({
-            'name': var.FORM_NAMES['MENU'],
-            'screen': controller.get('main_screen'),
-            'active': True,
-            'coord': (0, 0),
-            'music_path': var.MUSICA_MENU,
-            'background': var.FONDO_MENU,
-            'screen_dimensions': var.DIMENSION_PANTALLA,
-            'music_config': controller.get('music_config') 
-        }),
-        ranking_form.create_form_ranking({
-            'name': var.FORM_NAMES['RANKING'],
-            'screen': controller.get('main_screen'),
-            'active': False,
-            'coord': (0, 0),
-            'music_path': var.MUSICA_RANKING,
-            'background': var.FONDO_RANKING,
-            'screen_dimensions': var.DIMENSION_PANTALLA,
-            'music_config': controller.get('music_config')
-        }),
-        options_form.create_form_options(
-        {
-            "name": var.FORM_NAMES['OPTIONS'],
-            "screen": controller.get('main_screen'),
-            "active": False,
-            "coord": (0, 0),
-            "music_path": var.MUSICA_OPTIONS,
-            "background": var.FONDO_OPTIONS,
-            "screen_dimensions": var.DIMENSION_PANTALLA,
-            "music_config": controller.get('music_config')
-        }),
-
-        pause_form.create_form_pause({    
-            "name": var.FORM_NAMES['PAUSE'],
-            "screen": controller.get('main_screen'),
-            "active": False,
-            "coord": (0, 0),
-            "music_path": var.MUSICA_PAUSE,
-            "background": var.FONDO_PAUSE,
-            "screen_dimensions": var.DIMENSION_PANTALLA,
-            "music_config": controller.get('music_config')
-        }),
-
-        stage_form.crear_form_stage({
-            "name": var.FORM_NAMES['STAGE'],
-            "screen": controller.get('main_screen'),
-            "active": False,
-            "coord": (0, 0),
-            "music_path": var.MUSICA_STAGE,
-            "background": var.FONDO_STAGE,
-            "screen_dimensions": var.DIMENSION_PANTALLA,
-            "music_config": controller.get('music_config'),
-            "jugador": controller.get('player')
-        }),
-        form_name.create_form_name({
-            "name": var.FORM_NAMES['NAME'],
-            "screen": controller.get('main_screen'),
-            "active": False,
-            "coord": (0, 0),
-            "music_path": var.MUSICA_RANKING,
-            "background": var.FONDO_NAME,
-            "screen_dimensions": var.DIMENSION_PANTALLA,
-            "music_config": controller.get('music_config'),
-            "jugador": controller.get('player')
-        }),
-
-        wish_form.create_form_wish({
-            "name": var.FORM_NAMES['WISH'],
-            "screen": controller.get('main_screen'),
-            "active": False,
-            "coord": (0, 0),
-            "music_path": var.MUSICA_RANKING,
-            "background": var.FONDO_WISH,
-            "screen_dimensions": var.DIMENSION_PANTALLA,
-            "music_config": controller.get('music_config'),
-            "jugador": controller.get('player')
-        })
-
-    ]
+    # Los formularios se registran con su fabrica, su update y su draw, y se construyen la primera vez que se activan
+    base_form.registrar_form(var.FORM_NAMES['MENU'], menu_form.create_form_menu, {
+        'name': var.FORM_NAMES['MENU'],
+        'screen': controller.get('main_screen'),
+        'active': False,
+        'coord': (0, 0),
+        'music_path': var.MUSICA_MENU,
+        'background': var.FONDO_MENU,
+        'screen_dimensions': var.DIMENSION_PANTALLA,
+        'redibujo_por_cambio': True,
+        'music_config': controller.get('music_config') 
+    }, menu_form.update, menu_form.draw)
+    base_form.registrar_form(var.FORM_NAMES['RANKING'], ranking_form.create_form_ranking, {
+        'name': var.FORM_NAMES['RANKING'],
+        'screen': controller.get('main_screen'),
+        'active': False,
+        'coord': (0, 0),
+        'music_path': var.MUSICA_RANKING,
+        'background': var.FONDO_RANKING,
+        'screen_dimensions': var.DIMENSION_PANTALLA,
+        'redibujo_por_cambio': True,
+        'music_config': controller.get('music_config')
+    }, ranking_form.update, ranking_form.draw)
+    base_form.registrar_form(var.FORM_NAMES['OPTIONS'], options_form.create_form_options, {
+        "name": var.FORM_NAMES['OPTIONS'],
+        "screen": controller.get('main_screen'),
+        "active": False,
+        "coord": (0, 0),
+        "music_path": var.MUSICA_OPTIONS,
+        "background": var.FONDO_OPTIONS,
+        "screen_dimensions": var.DIMENSION_PANTALLA,
+        "redibujo_por_cambio": True,
+        "music_config": controller.get('music_config')
+    }, options_form.update, options_form.draw)
+    base_form.registrar_form(var.FORM_NAMES['PAUSE'], pause_form.create_form_pause, {
+        "name": var.FORM_NAMES['PAUSE'],
+        "screen": controller.get('main_screen'),
+        "active": False,
+        "coord": (0, 0),
+        "music_path": var.MUSICA_PAUSE,
+        "background": var.FONDO_PAUSE,
+        "screen_dimensions": var.DIMENSION_PANTALLA,
+        "redibujo_por_cambio": True,
+        "music_config": controller.get('music_config')
+    }, pause_form.update, pause_form.draw)
+    base_form.registrar_form(var.FORM_NAMES['STAGE'], stage_form.crear_form_stage, {
+        "name": var.FORM_NAMES['STAGE'],
+        "screen": controller.get('main_screen'),
+        "active": False,
+        "coord": (0, 0),
+        "music_path": var.MUSICA_STAGE,
+        "background": var.FONDO_STAGE,
+        "screen_dimensions": var.DIMENSION_PANTALLA,
+        "music_config": controller.get('music_config'),
+        "jugador": controller.get('player')
+    }, stage_form.update, stage_form.draw)
+    base_form.registrar_form(var.FORM_NAMES['NAME'], form_name.create_form_name, {
+        "name": var.FORM_NAMES['NAME'],
+        "screen": controller.get('main_screen'),
+        "active": False,
+        "coord": (0, 0),
+        "music_path": var.MUSICA_RANKING,
+        "background": var.FONDO_NAME,
+        "screen_dimensions": var.DIMENSION_PANTALLA,
+        "music_config": controller.get('music_config'),
+        "jugador": controller.get('player')
+    }, form_name.update, form_name.draw)
+    base_form.registrar_form(var.FORM_NAMES['WISH'], wish_form.create_form_wish, {
+        "name": var.FORM_NAMES['WISH'],
+        "screen": controller.get('main_screen'),
+        "active": False,
+        "coord": (0, 0),
+        "music_path": var.MUSICA_RANKING,
+        "background": var.FONDO_WISH,
+        "screen_dimensions": var.DIMENSION_PANTALLA,
+        "redibujo_por_cambio": True,
+        "music_config": controller.get('music_config'),
+        "jugador": controller.get('player')
+    }, wish_form.update, wish_form.draw)
+
+    # Solo el menu se construye al iniciar, el resto espera a ser usado
+    form_menu = base_form.obtener_form(var.FORM_NAMES['MENU'])
+    base_form.set_active(var.FORM_NAMES['MENU'])
 
     # INICIAR MUSICA AUTOMATICAMENTE del formulario activo
-    for form in controller['forms_list']:
-        if form.get('active'):
-            base_form.music_on(form)
-            break
-
+    with perfilador.fase('music_on'):
+        base_form.music_on(form_menu)
 
     return controller
 
@@ -139,40 +143,28 @@ def forms_update(form_controller: dict, eventos: list):
         None: Actualiza y dibuja el formulario activo
     """
 
-    lista_formularios = form_controller.get('forms_list')
-    for form in lista_formularios:
-        if form.get('active'):
-            if form.get('name') == var.FORM_NAMES['MENU']:
-                form_menu = lista_formularios[0]
-                menu_form.update(form_menu, eventos)
-                menu_form.draw(form_menu)
-            elif form.get('name') == var.FORM_NAMES['RANKING']:
-                form_ranking = lista_formularios[1]
-                ranking_form.update(form_ranking, eventos)
-                ranking_form.draw(form_ranking)
-            elif form.get('name') == var.FORM_NAMES['OPTIONS']:
-                form_options = lista_formularios[2] 
-                options_form.update(form_options, eventos)
-                options_form.draw(form_options)
-            elif form.get('name') == var.FORM_NAMES['PAUSE']:
-                form_pause = lista_formularios[3]
-                pause_form.update(form_pause, eventos)
-                pause_form.draw(form_pause)
-            elif form.get('name') == var.FORM_NAMES['STAGE']:
-                form_stage = lista_formularios[4]
-                stage_form.update(form_stage, eventos)
-                stage_form.draw(form_stage)
-            elif form.get('name') == var.FORM_NAMES['NAME']:
-                name_form = lista_formularios[5]
-                form_name.update(name_form, eventos)
-                form_name.draw(name_form)
-            elif form.get('name') == var.FORM_NAMES['WISH']:
-                form_wish = lista_formularios[6]
-                wish_form.update(form_wish, eventos)
-                wish_form.draw(form_wish)
-            
-            # Dibujar cursor al final, encima de todo
-            base_form.draw_cursor(form.get('screen'))
+    form = base_form.get_form_activo()
+    if form is None:
+        return
+    registro = base_form.get_registro_form(form.get('name'))
+
+    inicio = time.perf_counter()
+    registro['update'](form, eventos)
+    fin_update = time.perf_counter()
+
+    # Los formularios estaticos solo se dibujan si algo cambio; con el panel de rendimiento visible se dibuja siempre
+    if not form.get('redibujo_por_cambio') or base_form.necesita_redibujo(form) or overlay.esta_visible():
+        registro['draw'](form)
+        # Dibujar cursor al final, encima de todo
+        base_form.draw_cursor(form.get('screen'))
+    else:
+        render.omitir_frame()
+
+    tiempo_update = (fin_update - inicio) * 1000
+    tiempo_draw = (time.perf_counter() - fin_update) * 1000
+    # Queda guardado para quien quiera medir frame a frame, como los benchmarks
+    form_controller['tiempos_ultimo_frame'] = (form.get('name'), tiempo_update, tiempo_draw)
+    overlay.registrar_tiempos_form(form.get('name'), tiempo_update, tiempo_draw)
 
 def update(form_controller: dict, eventos: list):
     """
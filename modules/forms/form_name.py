@@ -6,13 +6,18 @@ Muestra el puntaje obtenido y permite guardar el resultado en el ranking.
 import pygame as pg
 import modules.forms.base_form as base_form
 from utn_fra.pygame_widgets import (
-    Label, Button, TextBox
+    TextBox
+)
+from modules.forms.widgets import (
+    Label, Button
 )
 import modules.variables as var
 import modules.forms.form_stage as form_stage
 import modules.particip_juego as particip_juego
 import modules.auxiliar as aux
 import modules.sonido as sonido
+import modules.recursos as recursos
+import modules.render as render
 
 def create_form_name(dict_form_data: dict) -> dict:
     """
@@ -29,6 +34,12 @@ def create_form_name(dict_form_data: dict) -> dict:
     form['info_submitida'] = False
     form['limit_char'] = var.MAX_NAME_LENGTH
 
+    # Los dos fondos de resultado quedan adquiridos mientras exista el formulario, asi cambiar
+    # entre victoria y derrota no libera uno y vuelve a cargar y escalar el otro en cada fin de partida
+    form['fondos_resultado'] = {}
+    for fondo in (var.FONDO_VICTORY, var.FONDO_DEFEAT):
+        form['fondos_resultado'][fondo] = recursos.adquirir_superficie(fondo, form.get('screen_dimensions'), form.get('name'))
+
     form['lbl_subtitulo'] = Label(
         x=var.DIMENSION_PANTALLA[0] // 2, y=350,
         text='', screen=form.get('screen'),
@@ -93,6 +104,23 @@ def clear_text(form_data: dict):
     """
     form_data.get('text_box').writing = ''
 
+def mostrar_fondo_resultado(form_dict_data: dict, background: str):
+    """
+    Muestra uno de los fondos de resultado ya adquiridos, sin liberar el otro.
+    
+    Args:
+        form_dict_data: Diccionario con los datos del formulario
+        background: Ruta del fondo de victoria o de derrota
+        
+    Returns:
+        None
+    """
+    if background == form_dict_data.get('background'):
+        return
+    form_dict_data['background'] = background
+    form_dict_data['surface'] = form_dict_data.get('fondos_resultado').get(background)
+    render.marcar_pantalla_completa()
+
 def update_texto_victoria(form_dict_data: dict, win_status: bool):
     """
     Actualiza el formulario segun si el jugador gano o perdio cambiando fondo y musica.
@@ -106,15 +134,13 @@ def update_texto_victoria(form_dict_data: dict, win_status: bool):
     """
     if win_status:
         form_dict_data.get('lbl_subtitulo').update_text(text='HAS GANADO!! ERES EL CAMPEON', color=pg.Color('orange'))
-        form_dict_data['surface'] = pg.image.load(var.FONDO_VICTORY).convert_alpha()
-        form_dict_data['surface'] = pg.transform.scale(form_dict_data['surface'], var.DIMENSION_PANTALLA)
+        mostrar_fondo_resultado(form_dict_data, var.FONDO_VICTORY)
         form_dict_data['music_path'] = var.MUSICA_VICTORY
         form_dict_data['music_config'] = {'loops': 0}  
         base_form.music_on(form_dict_data)
     else:
         form_dict_data.get('lbl_subtitulo').update_text(text='HAS PERDIDO. INTENTA DE NUEVO.', color=pg.Color('orange'))
-        form_dict_data['surface'] = pg.image.load(var.FONDO_DEFEAT).convert_alpha()
-        form_dict_data['surface'] = pg.transform.scale(form_dict_data['surface'], var.DIMENSION_PANTALLA)
+        mostrar_fondo_resultado(form_dict_data, var.FONDO_DEFEAT)
         form_dict_data['music_path'] = var.MUSICA_DEFEAT
         form_dict_data['music_config'] = {'loops': 0}  
         base_form.music_on(form_dict_data)
@@ -6,7 +6,7 @@ Permite activar o desactivar musica y ajustar el volumen.
 import pygame as pg
 import sys
 import modules.forms.base_form as base_form
-from utn_fra.pygame_widgets import (
+from modules.forms.widgets import (
     Label, Button
 )
 import modules.variables as var
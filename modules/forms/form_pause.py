@@ -7,7 +7,10 @@ import pygame as pg
 import sys
 import modules.forms.base_form as base_form
 from utn_fra.pygame_widgets import (
-    Label, Button, ButtonImage, ImageLabel
+    ButtonImage, ImageLabel
+)
+from modules.forms.widgets import (
+    Label, Button
 )
 import modules.variables as var
 import modules.forms.form_stage as form_stage
@@ -66,7 +69,7 @@ def restart_stage(params: dict):
     Returns:
         None
     """
-    stage_form = var.dict_forms_status.get(params.get('form_name'))
+    stage_form = base_form.obtener_form(params.get('form_name'))
     base_form.salir_de_pause(params.get('form_name'))
     form_stage.iniciar_nueva_partida(stage_form)
 
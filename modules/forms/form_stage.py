@@ -6,7 +6,7 @@ Maneja la interfaz de batalla, estadisticas de jugadores, cartas en juego y boto
 import pygame as pg
 import sys
 import modules.forms.base_form as base_form
-from utn_fra.pygame_widgets import (
+from modules.forms.widgets import (
     Label, Button, ButtonImage, ImageLabel
 )
 import modules.forms.form_name as form_name
@@ -15,6 +15,9 @@ import modules.stage as stage_juego
 import modules.carta as carta_jugador
 import modules.particip_juego as particip_juego
 import modules.forms.form_wish as form_wish
+import modules.render as render
+import modules.efectos as efectos
+import modules.ritmo as ritmo
 
 def crear_form_stage(dict_form_data: dict) -> dict:
     """
@@ -34,6 +37,12 @@ def crear_form_stage(dict_form_data: dict) -> dict:
 
     form['stage'] = stage_juego.inicializar_stage(jugador=form.get('jugador'), pantalla=form.get('screen'), nro_stage=form.get('actual_level'))
 
+    form['efecto_critico'] = efectos.crear_efecto(
+        ruta_imagen=var.CRITICAL_HIT, tamanio=var.CRITICAL_EFFECT_SIZE,
+        duracion=var.CRITICAL_HIT_DURATION, cantidad_frames=var.CRITICAL_EFFECT_FRAMES,
+        escala_inicial=var.CRITICAL_EFFECT_ESCALA_INICIAL, ruta_sonido=var.SOUND_CRITICAL_HIT
+    )
+
     form['lbl_timer'] = Label(
         x=var.DIMENSION_PANTALLA[0] - 150, y=50,
         text=f'Time: {stage_juego.obtener_tiempo(form.get("stage"))}',
@@ -157,8 +166,6 @@ def crear_form_stage(dict_form_data: dict) -> dict:
         form.get('btn_play'),
         form.get('lbl_carta_e'),
         form.get('lbl_carta_p'),
-        form.get('img_radar_azul'),
-        form.get('img_radar_naranja'),
         form.get('lbl_enemigo_hp'),
         form.get('lbl_enemigo_atk'),
         form.get('lbl_enemigo_def'),
@@ -174,6 +181,15 @@ def crear_form_stage(dict_form_data: dict) -> dict:
         form.get('btn_shield')
     ]
 
+    # Widgets que no cambian: se componen junto al fondo en la capa estatica
+    form['widgets_list_estaticos'] = [
+        form.get('img_radar_azul'),
+        form.get('img_radar_naranja')
+    ]
+    form['capa_estatica'] = None
+    form['capa_estatica_fondo'] = None
+    form['capa_estatica_valida'] = False
+
 
     var.dict_forms_status[form.get('name')] = form
 
@@ -198,8 +214,7 @@ def jugar_mano(form_dict_data: dict):
         # Guardar timestamp si hubo critico
         if critical:
             stage['critical_hit_time'] = pg.time.get_ticks()
-            sound_critical = pg.mixer.Sound(var.SOUND_CRITICAL_HIT)
-            sound_critical.play()
+            efectos.reproducir_sonido(form_dict_data.get('efecto_critico'))
             
     elif not stage_juego.hay_jugadores_con_cartas(stage) and stage_juego.esta_finalizado(stage):
         ganador = stage_juego.obtener_ganador(stage)
@@ -210,7 +225,7 @@ def jugar_mano(form_dict_data: dict):
         else:
             win_status = True
 
-        name_form = var.dict_forms_status.get('form_name')
+        name_form = base_form.obtener_form('form_name')
         form_name.update_texto_victoria(name_form, win_status)
 
         base_form.set_active('form_name')
@@ -234,7 +249,7 @@ def verificar_terminado(form_dict_data: dict):
             win_status = False
         else:
             win_status = True
-        name_form = var.dict_forms_status.get('form_name')
+        name_form = base_form.obtener_form('form_name')
         form_name.update_texto_victoria(name_form, win_status)
         base_form.set_active('form_name')
 
@@ -252,9 +267,9 @@ def call_wish_form(params: dict):
     form_dict_data = params.get('form')
     wish_type = params.get('wish')
 
-    wish_form = var.dict_forms_status.get('form_wish')
+    wish_form = base_form.obtener_form('form_wish')
     form_wish.update_wish_type(wish_form, wish_type)
-    base_form.cambiar_pantalla('form_wish')
+    base_form.apilar_form('form_wish')
 
 
 def iniciar_nueva_partida(form_dict_data: dict):
@@ -275,6 +290,7 @@ def iniciar_nueva_partida(form_dict_data: dict):
     # Limpiar las etiquetas de cartas
     form_dict_data['lbl_carta_e'].update_text('', var.colores['blanco'])
     form_dict_data['lbl_carta_p'].update_text('', var.colores['blanco'])
+    invalidar_capa_estatica(form_dict_data)
 
 
 def update_lbls_participante(form_dict_data: dict, tipo_participante: str):
@@ -325,7 +341,7 @@ def draw_bonus_widgets(form_dict_data: dict):
 
 def draw_critical_effect(form_dict_data: dict):
     """
-    Dibuja el efecto visual de golpe critico en el centro de la pantalla durante un segundo.
+    Dibuja la animacion del golpe critico en el centro de la pantalla mientras dura el efecto.
     
     Args:
         form_dict_data: Diccionario con los datos del formulario
@@ -337,16 +353,12 @@ def draw_critical_effect(form_dict_data: dict):
     if not stage:
         return
     
-    tiempo_actual = pg.time.get_ticks()
-    tiempo_critico = stage.get('critical_hit_time', 0)
-    duracion = stage.get('critical_hit_duration', 1000)
-    
-    # Si paso menos de 1 segundo desde el critico, mostrar imagen
-    if tiempo_actual - tiempo_critico < duracion:
-        imagen = pg.image.load(var.CRITICAL_HIT).convert_alpha()
-        imagen = pg.transform.scale(imagen, (var.CRITICAL_EFFECT_SIZE, var.CRITICAL_EFFECT_SIZE))
-        rect = imagen.get_rect(center=(var.DIMENSION_PANTALLA[0] // 2, var.DIMENSION_PANTALLA[1] // 2 - 150))
-        form_dict_data['screen'].blit(imagen, rect)
+    # Los frames ya estan escalados y con su transparencia, dibujar el efecto es solo un blit
+    tiempo_transcurrido = pg.time.get_ticks() - stage.get('critical_hit_time', 0)
+    if not stage.get('critical_hit_time'):
+        tiempo_transcurrido = -1
+    centro = (var.DIMENSION_PANTALLA[0] // 2, var.DIMENSION_PANTALLA[1] // 2 - 150)
+    efectos.draw_efecto(form_dict_data.get('efecto_critico'), form_dict_data['screen'], centro, tiempo_transcurrido)
 
 def update_bonus_widgets(form_dict_data: dict):
     """
@@ -366,9 +378,46 @@ def update_bonus_widgets(form_dict_data: dict):
     if stage.get('shield_available'):
         widgets_bonus[1].update()
 
+def invalidar_capa_estatica(form_dict_data: dict):
+    """
+    Indica que la capa estatica debe recomponerse antes del proximo dibujo (por ejemplo si cambia el fondo o un radar).
+    
+    Args:
+        form_dict_data: Diccionario con los datos del formulario
+        
+    Returns:
+        None
+    """
+    form_dict_data['capa_estatica_valida'] = False
+
+def actualizar_capa_estatica(form_dict_data: dict):
+    """
+    Compone en una unica superficie el fondo y los widgets estaticos, solo si la capa fue invalidada
+    o si el fondo del formulario cambio (por ejemplo con base_form.cambiar_fondo).
+    
+    Args:
+        form_dict_data: Diccionario con los datos del formulario
+        
+    Returns:
+        None
+    """
+    if form_dict_data.get('capa_estatica_valida') and form_dict_data.get('capa_estatica_fondo') is form_dict_data.get('surface'):
+        return
+
+    capa = pg.Surface(form_dict_data.get('screen').get_size()).convert()
+    capa.blit(form_dict_data.get('surface'), form_dict_data.get('rect'))
+    for widget in form_dict_data.get('widgets_list_estaticos'):
+        capa.blit(widget.image, widget.rect)
+
+    form_dict_data['capa_estatica'] = capa
+    form_dict_data['capa_estatica_fondo'] = form_dict_data.get('surface')
+    form_dict_data['capa_estatica_valida'] = True
+    render.marcar_pantalla_completa()
+
 def draw(form_dict_data: dict):
     """
-    Dibuja el formulario de stage con fondo, jugadores, widgets y efectos visuales.
+    Dibuja el formulario de stage: la capa estatica cacheada y encima la capa dinamica
+    con widgets, jugadores, bonus y efectos visuales.
     
     Args:
         form_dict_data: Diccionario con los datos del formulario
@@ -376,7 +425,8 @@ def draw(form_dict_data: dict):
     Returns:
         None
     """
-    base_form.draw(form_dict_data)
+    actualizar_capa_estatica(form_dict_data)
+    base_form.draw(form_dict_data, form_dict_data.get('capa_estatica'))
     stage = form_dict_data.get('stage')
     base_form.draw_widgets(form_dict_data)
     if stage:
@@ -436,9 +486,14 @@ def update(form_dict_data: dict, eventos: list):
     Returns:
         None
     """
-    form_dict_data['lbl_timer'].update_text(f'Time: {stage_juego.obtener_tiempo(form_dict_data.get("stage"))}', var.colores['blanco'])
     base_form.update(form_dict_data)
     stage_juego.update(form_dict_data.get("stage"))
+    form_dict_data['lbl_timer'].update_text(f'Time: {stage_juego.obtener_tiempo(form_dict_data.get("stage"))}', var.colores['blanco'])
+
+    # El timer baja cuando pasan mas de 1000 ms, el bucle tiene que despertar en ese momento aunque este en reposo
+    stage = form_dict_data.get("stage")
+    if stage_juego.obtener_tiempo(stage) > 0:
+        ritmo.programar_despertar(stage.get('last_timer') + 1001)
     update_lbls_card_info(form_dict_data)
     update_lbls_participante(form_dict_data, tipo_participante='jugador')
     update_lbls_participante(form_dict_data, tipo_participante='enemigo')
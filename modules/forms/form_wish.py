@@ -7,7 +7,10 @@ import pygame as pg
 import sys
 import modules.forms.base_form as base_form
 from utn_fra.pygame_widgets import (
-    Label, Button, ButtonImage, ImageLabel
+    ButtonImage, ImageLabel
+)
+from modules.forms.widgets import (
+    Label, Button
 )
 import modules.variables as var
 import modules.forms.form_stage as form_stage
@@ -85,7 +88,7 @@ def click_resume(form_name: str):
     Returns:
         None
     """
-    base_form.cambiar_pantalla(form_name)
+    base_form.volver_a_form(form_name)
 
 def init_wish(form_dict_data: dict):
     """
@@ -100,7 +103,7 @@ def init_wish(form_dict_data: dict):
     wish_type = form_dict_data.get('wish_type')
     jugador = form_dict_data.get('jugador')
 
-    stage_form = var.dict_forms_status.get('form_stage')
+    stage_form = base_form.obtener_form('form_stage')
     stage = stage_form.get('stage')
 
     if wish_type == 'HEAL':
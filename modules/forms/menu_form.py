@@ -6,7 +6,7 @@ Ofrece opciones para iniciar partida, ver ranking, configurar opciones o salir d
 import pygame as pg
 import sys
 import modules.forms.base_form as base_form
-from utn_fra.pygame_widgets import (
+from modules.forms.widgets import (
     Label, Button, ButtonImage, ImageLabel
 )
 import modules.variables as var
@@ -93,7 +93,7 @@ def iniciar_stage(form_name: str,):
         None
     """
     base_form.cambiar_pantalla(form_name)
-    stage_form = var.dict_forms_status.get(form_name)
+    stage_form = base_form.obtener_form(form_name)
     form_stage.iniciar_nueva_partida(stage_form)
 
 
@@ -147,3 +147,7 @@ def update(dict_form_data: dict, eventos: list):
     # events_handler()
     base_form.update(dict_form_data)
 
+    # Con el menu inactivo se aprovecha el frame para preparar el fondo de otro formulario
+    if not eventos and var.PRECARGAR_FONDOS_MENU:
+        base_form.precargar_fondo_pendiente()
+
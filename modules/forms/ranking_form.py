@@ -9,7 +9,7 @@ import modules.forms.base_form as base_form
 import modules.auxiliar as aux
 
 
-from utn_fra.pygame_widgets import (
+from modules.forms.widgets import (
     Label, Button
 )
 import modules.variables as var
@@ -0,0 +1,139 @@
+"""
+Widgets usados por los formularios.
+Envuelven los Label y Button de utn_fra.pygame_widgets para renderizar sus textos desde la cache compartida
+de recursos e ignorar las actualizaciones que no cambian el texto ni el color.
+Al actualizarse no se dibujan: cada formulario los dibuja en su draw, solo cuando hace falta redibujar.
+Los ButtonImage e ImageLabel toman su imagen de la precarga de recursos en lugar de decodificar el PNG
+al crearse.
+"""
+
+import pygame as pg
+from utn_fra.pygame_widgets import (
+    Label as LabelBase, Button as ButtonBase, ButtonImage as ButtonImageBase, ImageLabel as ImageLabelBase
+)
+from utn_fra.pygame_widgets.widget import Widget
+import modules.recursos as recursos
+
+def alinear_rect(widget):
+    """
+    Ubica el rect de un widget segun su alineacion, igual que los widgets originales.
+
+    Args:
+        widget: Widget con los atributos x, y, align y rect
+
+    Returns:
+        None
+    """
+    if widget.align == 'topleft':
+        widget.rect.topleft = (widget.x, widget.y)
+    else:
+        widget.rect.center = (widget.x, widget.y)
+
+def cargar_imagen_widget(image_path: str, width: int, height: int) -> pg.Surface:
+    """
+    Obtiene la imagen de un widget al tamanio pedido desde la precarga. Ya escalada, el original se libera.
+
+    Args:
+        image_path: Ruta de la imagen
+        width: Ancho del widget
+        height: Alto del widget
+
+    Returns:
+        Surface: Imagen escalada del widget
+    """
+    imagen = pg.transform.scale(recursos.cargar_imagen(image_path), (width, height))
+    recursos.descartar_original(image_path)
+    return imagen
+
+def aplicar_texto(widget, text: str, color: tuple):
+    """
+    Asigna un texto renderizado desde la cache a un widget y recalcula su rect.
+
+    Args:
+        widget: Widget de texto a actualizar
+        text: Texto a mostrar
+        color: Color del texto
+
+    Returns:
+        None
+    """
+    widget.text = text
+    widget.color = tuple(color)
+    widget.image = recursos.renderizar_texto(widget.font_path, widget.font_size, text, color)
+    widget.rect = widget.image.get_rect()
+    alinear_rect(widget)
+
+class Label(LabelBase):
+    '''
+    Label cuyo texto se renderiza desde la cache compartida y que ignora actualizaciones sin cambios
+    '''
+    def __init__(self, x: int, y: int, text: str, screen: object, font_path: str, align: str = 'center', font_size: int = 50, color: tuple = (255, 0, 0)) -> None:
+        Widget.__init__(self, x, y, text, screen, font_size)
+        self.align = align
+        self.font_path = font_path
+        self.font = recursos.obtener_fuente(font_path, font_size)
+        aplicar_texto(self, text, color)
+
+    def update_text(self, text: str, color: tuple[int, int, int]) -> None:
+        if text == self.text and tuple(color) == self.color:
+            return
+        aplicar_texto(self, text, color)
+
+    def update(self) -> None:
+        pass
+
+class Button(ButtonBase):
+    '''
+    Button cuyo texto se renderiza desde la cache compartida y que ignora actualizaciones sin cambios
+    '''
+    def __init__(self, x, y, text, screen, font_path: str, align: str = 'center', color: tuple = (255, 0, 0), font_size = 25, on_click = None, on_click_param = None) -> None:
+        Widget.__init__(self, x, y, text, screen, font_size)
+        self.align = align
+        self.font_path = font_path
+        self.font = recursos.obtener_fuente(font_path, font_size)
+        aplicar_texto(self, text, color)
+
+        self.on_click = on_click
+        self.on_click_param = on_click_param
+
+    def update_text(self, text: str, color: tuple[int, int, int]) -> None:
+        if text == self.text and tuple(color) == self.color:
+            return
+        aplicar_texto(self, text, color)
+
+    def update(self) -> None:
+        self.button_pressed()
+
+class ButtonImage(ButtonImageBase):
+    '''
+    ButtonImage cuya imagen sale de la precarga de recursos
+    '''
+    def __init__(self, x: int, y: int, width: int, height: int, text: str, screen, image_path: str, align: str = 'center', font_size = 25, on_click = None, on_click_param = None) -> None:
+        Widget.__init__(self, x, y, text, screen, font_size)
+        self.align = align
+        self.image = cargar_imagen_widget(image_path, width, height)
+        self.rect = self.image.get_rect()
+        alinear_rect(self)
+
+        self.on_click = on_click
+        self.on_click_param = on_click_param
+
+class ImageLabel(ImageLabelBase):
+    '''
+    ImageLabel cuya imagen sale de la precarga de recursos y cuya fuente sale de la cache compartida
+    '''
+    def __init__(self, x: int, y: int, text: str, screen, image_path: str, width: int, height: int, font_path: str, font_size: int, color: tuple = (255, 0, 0)) -> None:
+        Widget.__init__(self, x, y, text, screen, font_size)
+        self.font = recursos.obtener_fuente(font_path, font_size)
+        self.font_color = color
+        self.width = width
+        self.height = height
+        if image_path:
+            self.image = cargar_imagen_widget(image_path, width, height)
+        else:
+            self.image = pg.Surface((width, height), masks=(0, 0, 0))
+        self.img_original = self.image.copy()
+        self.rect = self.image.get_rect()
+        self.rect.x = self.x
+        self.rect.y = self.y
+        self.render()
@@ -0,0 +1,187 @@
+"""
+Modulo de imagenes horneadas.
+Guarda imagenes ya escaladas con la calidad suave como pixeles RGBA crudos con una cabecera, para cargarlas
+sin decodificar el PNG ni volver a escalarlas. Cada archivo recuerda la fecha de modificacion, el tamanio y el hash de su imagen fuente;
+si la fuente cambio, el archivo horneado se ignora y se vuelve a la imagen original.
+"""
+
+import hashlib
+import os
+import struct
+import pygame as pg
+import modules.variables as var
+
+FIRMA = b'DBZH'
+VERSION = 2
+FORMATO_PIXELES = 'RGBA'
+# firma, version, ancho, alto, mtime de la fuente en ns, tamanio de la fuente en bytes, sha1 de la fuente
+CABECERA = struct.Struct('<4sHIIQQ20s')
+
+def etiqueta_porcentaje(porcentaje_a_ajustar: int) -> str:
+    """
+    Arma la etiqueta con la que se guarda una imagen escalada por porcentaje.
+
+    Args:
+        porcentaje_a_ajustar: Porcentaje de escala (50 significa 50%)
+
+    Returns:
+        str: Etiqueta del tamanio, por ejemplo 'p50'
+    """
+    return f'p{porcentaje_a_ajustar}'
+
+def etiqueta_tamanio(tamanio: tuple[int, int]) -> str:
+    """
+    Arma la etiqueta con la que se guarda una imagen escalada a un tamanio fijo.
+
+    Args:
+        tamanio: Tamanio (ancho, alto) en pixeles
+
+    Returns:
+        str: Etiqueta del tamanio, por ejemplo '1600x900'
+    """
+    return f'{tamanio[0]}x{tamanio[1]}'
+
+def get_ruta_horneada(ruta_img: str, etiqueta: str) -> str:
+    """
+    Obtiene la ruta del archivo horneado de una imagen en un tamanio.
+
+    Args:
+        ruta_img: Ruta de la imagen fuente
+        etiqueta: Etiqueta del tamanio
+
+    Returns:
+        str: Ruta del archivo horneado dentro de la carpeta de cache
+    """
+    nombre = os.path.splitext(ruta_img.replace('\\', '/'))[0].replace('/', '__')
+    return f'{var.RUTA_HORNEADO}/{nombre}@{etiqueta}.raw'
+
+def calcular_hash_archivo(ruta_archivo: str) -> bytes:
+    """
+    Calcula el hash SHA-1 del contenido de un archivo.
+
+    Args:
+        ruta_archivo: Ruta del archivo
+
+    Returns:
+        bytes: Hash de 20 bytes
+    """
+    with open(ruta_archivo, 'rb') as file:
+        return hashlib.sha1(file.read()).digest()
+
+def fuente_coincide(ruta_img: str, mtime_ns: int, tamanio_bytes: int, hash_fuente: bytes) -> bool:
+    """
+    Verifica si la imagen fuente es la misma con la que se horneo. Si la fecha de modificacion coincide no se
+    lee el archivo; si cambio solo la fecha (por ejemplo al clonar el repositorio) se compara el hash.
+
+    Args:
+        ruta_img: Ruta de la imagen fuente
+        mtime_ns: Fecha de modificacion guardada en la cabecera
+        tamanio_bytes: Tamanio del archivo guardado en la cabecera
+        hash_fuente: Hash guardado en la cabecera
+
+    Returns:
+        bool: True si el archivo horneado corresponde a la fuente actual
+    """
+    try:
+        estado = os.stat(ruta_img)
+    except OSError:
+        return False
+
+    if estado.st_size != tamanio_bytes:
+        return False
+    if estado.st_mtime_ns == mtime_ns:
+        return True
+    return calcular_hash_archivo(ruta_img) == hash_fuente
+
+def leer_cabecera(ruta_horneada: str) -> tuple:
+    """
+    Lee la cabecera de un archivo horneado.
+
+    Args:
+        ruta_horneada: Ruta del archivo horneado
+
+    Returns:
+        tuple: Campos de la cabecera (firma, version, ancho, alto, mtime_ns, tamanio_bytes, hash), o None si no es valida
+    """
+    try:
+        with open(ruta_horneada, 'rb') as file:
+            cabecera = CABECERA.unpack(file.read(CABECERA.size))
+    except (OSError, struct.error):
+        return None
+
+    if cabecera[0] != FIRMA or cabecera[1] != VERSION:
+        return None
+    return cabecera
+
+def horneado_vigente(ruta_img: str, etiqueta: str) -> bool:
+    """
+    Verifica si existe un archivo horneado de la imagen en ese tamanio y si sigue correspondiendo a la fuente.
+
+    Args:
+        ruta_img: Ruta de la imagen fuente
+        etiqueta: Etiqueta del tamanio
+
+    Returns:
+        bool: True si el archivo horneado puede usarse
+    """
+    cabecera = leer_cabecera(get_ruta_horneada(ruta_img, etiqueta))
+    return cabecera is not None and fuente_coincide(ruta_img, cabecera[4], cabecera[5], cabecera[6])
+
+def hornear_superficie(ruta_img: str, etiqueta: str, superficie: pg.Surface) -> str:
+    """
+    Guarda los pixeles de una superficie escalada junto con los datos de su imagen fuente.
+
+    Args:
+        ruta_img: Ruta de la imagen fuente
+        etiqueta: Etiqueta del tamanio
+        superficie: Imagen ya escalada
+
+    Returns:
+        str: Ruta del archivo horneado
+    """
+    estado = os.stat(ruta_img)
+    ancho, alto = superficie.get_size()
+    cabecera = CABECERA.pack(FIRMA, VERSION, ancho, alto, estado.st_mtime_ns, estado.st_size, calcular_hash_archivo(ruta_img))
+
+    ruta_horneada = get_ruta_horneada(ruta_img, etiqueta)
+    os.makedirs(os.path.dirname(ruta_horneada), exist_ok=True)
+    # Se escribe a un temporal y se reemplaza, para que el juego nunca lea un archivo a medio escribir
+    ruta_temporal = f'{ruta_horneada}.tmp'
+    with open(ruta_temporal, 'wb') as file:
+        file.write(cabecera)
+        file.write(pg.image.tobytes(superficie, FORMATO_PIXELES))
+    os.replace(ruta_temporal, ruta_horneada)
+
+    return ruta_horneada
+
+def cargar_horneada(ruta_img: str, etiqueta: str) -> pg.Surface:
+    """
+    Carga la version horneada de una imagen en un tamanio si existe y esta vigente.
+
+    Args:
+        ruta_img: Ruta de la imagen fuente
+        etiqueta: Etiqueta del tamanio
+
+    Returns:
+        Surface: Imagen escalada, convertida al formato de pantalla si ya existe una, o None si no hay version horneada
+    """
+    if not var.USAR_HORNEADO:
+        return None
+
+    try:
+        with open(get_ruta_horneada(ruta_img, etiqueta), 'rb') as file:
+            datos = file.read()
+        firma, version, ancho, alto, mtime_ns, tamanio_bytes, hash_fuente = CABECERA.unpack_from(datos)
+    except (OSError, struct.error):
+        return None
+
+    if firma != FIRMA or version != VERSION or len(datos) != CABECERA.size + ancho * alto * 4:
+        return None
+    if not fuente_coincide(ruta_img, mtime_ns, tamanio_bytes, hash_fuente):
+        return None
+
+    # frombuffer usa los bytes leidos sin copiarlos; convert_alpha hace la unica copia
+    imagen = pg.image.frombuffer(memoryview(datos)[CABECERA.size:], (ancho, alto), FORMATO_PIXELES)
+    if pg.display.get_surface():
+        imagen = imagen.convert_alpha()
+    return imagen
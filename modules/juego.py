@@ -5,11 +5,51 @@ y maneja el bucle principal del juego.
 """
 
 import sys
+import time
 import pygame as pg
 from modules.forms import base_form
 import modules.variables as var
 import modules.forms.form_controller as form_controller
 import modules.particip_juego as particip_juego
+import modules.precarga as precarga
+import modules.recursos as recursos
+import modules.auxiliar as aux
+import modules.forms.form_carga as form_carga
+import modules.render as render
+import modules.sonido as sonido
+import modules.perfilador as perfilador
+import modules.overlay as overlay
+import modules.ritmo as ritmo
+
+def precargar_recursos(pantalla: pg.Surface, reloj: pg.time.Clock):
+    """
+    Precarga todas las imagenes del juego mostrando el formulario de carga con el progreso.
+    
+    Args:
+        pantalla: Superficie principal del juego
+        reloj: Reloj usado para limitar los fotogramas de la pantalla de carga
+        
+    Returns:
+        None
+    """
+    form = form_carga.create_form_carga({
+        'name': var.FORM_NAMES['CARGA'],
+        'screen': pantalla,
+        'precarga': precarga.crear_precarga(precarga.listar_imagenes_precarga())
+    })
+
+    while not form_carga.esta_finalizado(form):
+        eventos = pg.event.get()
+        reloj.tick(var.FPS)
+
+        for evento in eventos:
+            if evento.type == pg.QUIT:
+                pg.quit()
+                sys.exit()
+
+        form_carga.update(form, eventos)
+        form_carga.draw(form)
+        pg.display.flip()
 
 def dbz_tcg():
     """
@@ -22,21 +62,35 @@ def dbz_tcg():
         None
     """
 
-    pg.init() # Inicializa todos los modulos de Pygame
-    pg.display.set_caption(var.TITULO_JUEGO) # Establece el titulo de la ventana del juego
-    pantalla_juego = pg.display.set_mode(var.DIMENSION_PANTALLA) # Configura el tamanio de la ventana del juego
+    inicio = time.perf_counter() # Para medir cuanto tarda en verse el primer frame del menu
+    with perfilador.fase('pg.init'):
+        pg.init() # Inicializa todos los modulos de Pygame
+        sonido.reservar_canal_efectos(var.CANAL_EFECTOS) # Los efectos de sonido no compiten por un canal libre
+    with perfilador.fase('display.set_mode'):
+        pg.display.set_caption(var.TITULO_JUEGO) # Establece el titulo de la ventana del juego
+        pantalla_juego = pg.display.set_mode(var.DIMENSION_PANTALLA) # Configura el tamanio de la ventana del juego
     
-    # Configurar cursor personalizado
-    pg.mouse.set_visible(False)  # Ocultar cursor del sistema
-    var.CURSOR_IMG = pg.image.load(var.CURSOR_PATH).convert_alpha()
-    var.CURSOR_IMG = pg.transform.scale(var.CURSOR_IMG, (40, 65))
-
     corriendo = True # Variable para controlar el bucle principal del juego
     reloj = pg.time.Clock() # Crea un objeto Clock para controlar la velocidad de fotogramas
+
+    with perfilador.fase('actualizar_bd_cartas'):
+        aux.imprimir_resumen_bd_cartas(aux.actualizar_bd_cartas()) # Vuelve a parsear solo los mazos que cambiaron en disco
+    with perfilador.fase('precargar_recursos'):
+        precargar_recursos(pantalla_juego, reloj) # Decodifica todas las imagenes antes de crear los formularios
+    fin_precarga = time.perf_counter()
+
+    # Configurar cursor personalizado
+    with perfilador.fase('carga del cursor'):
+        pg.mouse.set_visible(False)  # Ocultar cursor del sistema
+        var.CURSOR_IMG = recursos.cargar_imagen(var.CURSOR_PATH)
+        var.CURSOR_IMG = pg.transform.scale(var.CURSOR_IMG, (40, 65))
+        recursos.descartar_original(var.CURSOR_PATH)
+    with perfilador.fase('inicializar_participante'):
+        jugador = particip_juego.inicializar_participante(pantalla=pantalla_juego, nombre='PLAYER')
     datos_juegos = {
         "puntaje": 0,
         "cantidad_vidas": var.CANTIDAD_VIDAS,
-        "player": particip_juego.inicializar_participante(pantalla=pantalla_juego, nombre='PLAYER'),
+        "player": jugador,
         "music_config": {
             "volume": var.VOLUMEN_INICIAL,
             "music_on": True
@@ -44,11 +98,13 @@ def dbz_tcg():
 
     } # Diccionario para almacenar datos del juego, como puntaje y vidas.
 
-    form_control = form_controller.create_form_controller(pantalla_juego, datos_juegos) # Crea el controlador de formularios, que maneja los diferentes formularios del juego
+    with perfilador.fase('create_form_controller'):
+        form_control = form_controller.create_form_controller(pantalla_juego, datos_juegos) # Crea el controlador de formularios, que maneja los diferentes formularios del juego
+    primer_frame = True
 
     while corriendo:
-        eventos = pg.event.get() # Obtiene todos los eventos de Pygame (como entradas del teclado y mouse)
-        reloj.tick(var.FPS) 
+        eventos = ritmo.obtener_eventos(reloj) # Obtiene los eventos de Pygame a ritmo completo, o esperandolos si el juego esta inactivo
+        overlay.registrar_frame() # Tiempo entre frames para el panel de rendimiento
 
         for evento in eventos: 
             if evento.type == pg.QUIT:
@@ -56,19 +112,27 @@ def dbz_tcg():
 
             if evento.type == pg.KEYDOWN:
                 if evento.key == pg.K_ESCAPE:
-                    form_activo = None
-                    for form in form_control['forms_list']:
-                        if form['active']:
-                            form_activo = form
-                            break
+                    form_activo = base_form.get_form_activo()
                     if form_activo['name'] == var.FORM_NAMES['STAGE']:
                         base_form.pausar_juego()
                     elif form_activo['name'] == var.FORM_NAMES['PAUSE']:
                         base_form.despausar_juego()
 
+        overlay.procesar_eventos(eventos) # F3 muestra u oculta el panel de rendimiento
+        render.procesar_eventos(eventos) # Los clicks y teclas pueden cambiar cualquier parte de la pantalla
+        render.iniciar_update(pantalla_juego)
         form_controller.update(form_control, eventos) # Actualiza el estado del formulario actual
+        overlay.draw(pantalla_juego)
 
-        pg.display.flip() # Actualiza la pantalla completa del juego
+        if primer_frame:
+            with perfilador.fase('primer flip'):
+                render.presentar(pantalla_juego)
+            primer_frame = False
+            fin = time.perf_counter()
+            print(f'Primer frame del menu: {(fin - inicio) * 1000:.0f} ms (precarga: {(fin_precarga - inicio) * 1000:.0f} ms, formularios y dibujo: {(fin - fin_precarga) * 1000:.0f} ms)')
+            perfilador.finalizar(var.RUTA_REPORTE_INICIO) # Solo tiene efecto si se pidio perfilar el inicio
+        else:
+            render.presentar(pantalla_juego) # Actualiza la pantalla completa, o solo las zonas sucias si el modo esta activo
 
     pg.quit()
     sys.exit()
\ No newline at end of file
@@ -0,0 +1,241 @@
+"""
+Modulo del panel de rendimiento que se muestra sobre el juego (tecla F3).
+Muestra FPS, percentiles del tiempo por frame, el reparto entre update y draw del formulario activo,
+la tasa de acierto de la cache de textos y un grafico con los ultimos tiempos por frame. El texto se arma con glifos renderizados una sola vez,
+para que dibujar el panel no altere los tiempos que muestra.
+"""
+
+from collections import deque
+import time
+import pygame as pg
+import modules.variables as var
+import modules.render as render
+import modules.recursos as recursos
+
+CARACTERES_PANEL = '0123456789.:%/|-_ abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+ANCHO_PANEL = 300
+ALTO_PANEL = 170
+ALTO_GRAFICO = 50
+ESCALA_GRAFICO_MS = 100
+
+overlay_configs = {
+    "visible": False,
+    "ultimo_frame": None,
+    "tiempos_frame": deque(maxlen=var.HUD_MUESTRAS),
+    "tiempos_update": deque(maxlen=var.HUD_MUESTRAS),
+    "tiempos_draw": deque(maxlen=var.HUD_MUESTRAS),
+    "form_actual": '',
+    "glifos": {},
+    "alto_glifo": 0,
+    "fondo": None,
+    "rect": pg.Rect(10, 10, ANCHO_PANEL, ALTO_PANEL)
+}
+
+def esta_visible() -> bool:
+    """
+    Verifica si el panel de rendimiento se esta mostrando.
+
+    Args:
+        Ninguno
+
+    Returns:
+        bool: True si el panel esta visible
+    """
+    return overlay_configs['visible']
+
+def alternar():
+    """
+    Muestra u oculta el panel de rendimiento.
+
+    Args:
+        Ninguno
+
+    Returns:
+        None
+    """
+    overlay_configs['visible'] = not overlay_configs['visible']
+    render.marcar_pantalla_completa()
+
+def procesar_eventos(eventos: list):
+    """
+    Alterna el panel al presionar la tecla configurada.
+
+    Args:
+        eventos: Lista de eventos de Pygame
+
+    Returns:
+        None
+    """
+    for evento in eventos:
+        if evento.type == pg.KEYDOWN and evento.key == var.TECLA_HUD:
+            alternar()
+
+def registrar_frame():
+    """
+    Registra el tiempo transcurrido desde el frame anterior. Se llama una vez por vuelta del bucle principal.
+
+    Args:
+        Ninguno
+
+    Returns:
+        None
+    """
+    ahora = time.perf_counter()
+    if overlay_configs['ultimo_frame'] is not None:
+        overlay_configs['tiempos_frame'].append((ahora - overlay_configs['ultimo_frame']) * 1000)
+    overlay_configs['ultimo_frame'] = ahora
+
+def registrar_tiempos_form(form_name: str, tiempo_update: float, tiempo_draw: float):
+    """
+    Registra cuanto tardaron el update y el draw del formulario activo. Al cambiar de formulario se descartan
+    las muestras del anterior.
+
+    Args:
+        form_name: Nombre del formulario activo
+        tiempo_update: Milisegundos del update
+        tiempo_draw: Milisegundos del draw
+
+    Returns:
+        None
+    """
+    if form_name != overlay_configs['form_actual']:
+        overlay_configs['form_actual'] = form_name
+        overlay_configs['tiempos_update'].clear()
+        overlay_configs['tiempos_draw'].clear()
+    overlay_configs['tiempos_update'].append(tiempo_update)
+    overlay_configs['tiempos_draw'].append(tiempo_draw)
+
+def calcular_percentil(valores_ordenados: list[float], percentil: int) -> float:
+    """
+    Calcula un percentil por el metodo del rango mas cercano.
+
+    Args:
+        valores_ordenados: Valores ordenados de menor a mayor
+        percentil: Percentil a calcular, entre 0 y 100
+
+    Returns:
+        float: Valor del percentil, o 0 si no hay valores
+    """
+    if not valores_ordenados:
+        return 0
+    indice = min(len(valores_ordenados) - 1, max(0, round(percentil / 100 * len(valores_ordenados)) - 1))
+    return valores_ordenados[indice]
+
+def calcular_promedio(valores) -> float:
+    """
+    Calcula el promedio de una serie de valores.
+
+    Args:
+        valores: Valores a promediar
+
+    Returns:
+        float: Promedio, o 0 si no hay valores
+    """
+    if not valores:
+        return 0
+    return sum(valores) / len(valores)
+
+def preparar_glifos():
+    """
+    Renderiza una sola vez cada caracter que puede mostrar el panel y el fondo semitransparente.
+
+    Args:
+        Ninguno
+
+    Returns:
+        None
+    """
+    fuente = pg.font.Font(None, 22)
+    for caracter in CARACTERES_PANEL:
+        overlay_configs['glifos'][caracter] = fuente.render(caracter, True, var.colores['blanco']).convert_alpha()
+    overlay_configs['alto_glifo'] = fuente.get_linesize()
+
+    fondo = pg.Surface(overlay_configs['rect'].size, pg.SRCALPHA)
+    fondo.fill((0, 0, 0, 180))
+    overlay_configs['fondo'] = fondo
+
+def draw_texto(screen: pg.Surface, texto: str, x: int, y: int):
+    """
+    Dibuja un texto blitteando los glifos ya renderizados, sin renderizar la fuente.
+
+    Args:
+        screen: Superficie donde se dibuja el texto
+        texto: Texto a mostrar (los caracteres sin glifo se omiten)
+        x: Posicion horizontal del texto
+        y: Posicion vertical del texto
+
+    Returns:
+        None
+    """
+    glifos = overlay_configs['glifos']
+    for caracter in texto:
+        glifo = glifos.get(caracter)
+        if glifo:
+            screen.blit(glifo, (x, y))
+            x += glifo.get_width()
+
+def draw_grafico(screen: pg.Surface, rect_grafico: pg.Rect):
+    """
+    Dibuja el grafico de barras de los ultimos tiempos por frame, con la linea del tiempo objetivo segun los FPS.
+
+    Args:
+        screen: Superficie donde se dibuja el grafico
+        rect_grafico: Zona del grafico
+
+    Returns:
+        None
+    """
+    tiempos = list(overlay_configs['tiempos_frame'])[-rect_grafico.width:]
+    objetivo = 1000 / var.FPS
+
+    x = rect_grafico.right - len(tiempos)
+    for tiempo in tiempos:
+        alto = min(rect_grafico.height, int(tiempo * rect_grafico.height / ESCALA_GRAFICO_MS))
+        color = var.colores['verde'] if tiempo <= objetivo * 1.1 else var.colores['rojo']
+        screen.fill(color, (x, rect_grafico.bottom - alto, 1, alto))
+        x += 1
+
+    y_objetivo = rect_grafico.bottom - int(objetivo * rect_grafico.height / ESCALA_GRAFICO_MS)
+    screen.fill(var.colores['amarillo'], (rect_grafico.x, y_objetivo, rect_grafico.width, 1))
+
+def draw(screen: pg.Surface):
+    """
+    Dibuja el panel de rendimiento encima de todo si esta visible.
+
+    Args:
+        screen: Superficie principal del juego
+
+    Returns:
+        None
+    """
+    if not overlay_configs['visible']:
+        return
+    if not overlay_configs['glifos']:
+        preparar_glifos()
+
+    rect = overlay_configs['rect']
+    render.marcar_rect(rect)
+    screen.blit(overlay_configs['fondo'], rect)
+
+    tiempos_ordenados = sorted(overlay_configs['tiempos_frame'])
+    promedio_frame = calcular_promedio(tiempos_ordenados)
+    fps = 1000 / promedio_frame if promedio_frame else 0
+
+    estadisticas_textos = recursos.get_estadisticas_cache_textos()
+
+    lineas = [
+        f'FPS: {fps:.1f}',
+        f'frame ms p50: {calcular_percentil(tiempos_ordenados, 50):.1f}  p95: {calcular_percentil(tiempos_ordenados, 95):.1f}  p99: {calcular_percentil(tiempos_ordenados, 99):.1f}',
+        f'{overlay_configs["form_actual"]}',
+        f'update: {calcular_promedio(overlay_configs["tiempos_update"]):.2f} ms  draw: {calcular_promedio(overlay_configs["tiempos_draw"]):.2f} ms',
+        f'cache textos: {estadisticas_textos["tasa_acierto"] * 100:.1f}%  {estadisticas_textos["entradas"]}/{var.CACHE_TEXTOS_MAX}'
+    ]
+
+    x = rect.x + 8
+    y = rect.y + 6
+    for linea in lineas:
+        draw_texto(screen, linea, x, y)
+        y += overlay_configs['alto_glifo']
+
+    rect_grafico = pg.Rect(x, rect.bottom - ALTO_GRAFICO - 8, rect.width - 16, ALTO_GRAFICO)
+    draw_grafico(screen, rect_grafico)
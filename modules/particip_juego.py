@@ -6,7 +6,7 @@ Maneja estadisticas, mazos de cartas, puntajes y renderizado de cada participant
 import pygame as pg
 import modules.carta as carta
 import modules.variables as var
-import modules.auxiliar as aux
+import modules.estadisticas_mazo as estadisticas_mazo
 
 def inicializar_participante(pantalla: pg.Surface, nombre: str = 'PC'):
     """
@@ -30,6 +30,7 @@ def inicializar_participante(pantalla: pg.Surface, nombre: str = 'PC'):
     player['mazo_asignado'] = []
     player['cartas_mazo'] = []
     player['cartas_mazo_usadas'] = []
+    player['estadisticas_mazo'] = estadisticas_mazo.crear_estadisticas_mazo([])
 
     player['screen'] = pantalla
     player['pos_deck_inicial'] = (0, 0)
@@ -223,10 +224,12 @@ def set_cartas_participante(participante: dict, lista_cartas: list[dict]):
     """
 
     for carta_b in lista_cartas:
-        carta_b['coordenadas'] = get_coordenadas_mazo_inicial(participante)
+        carta.asignar_coordenadas_carta(carta_b, get_coordenadas_mazo_inicial(participante))
 
     participante['mazo_asignado'] = lista_cartas
     participante['cartas_mazo'] = lista_cartas.copy()
+    # Las estadisticas siguen el orden del mazo asignado; las cartas se juegan desde el final
+    participante['estadisticas_mazo'] = estadisticas_mazo.crear_estadisticas_mazo(lista_cartas)
 
 def set_score_participante(participante: dict, score: int):
     """
@@ -276,22 +279,37 @@ def asignar_stats_iniciales_participante(participante: dict):
     Returns:
         None: Modifica los stats del participante directamente
     """
-    participante['hp_inicial'] = aux.reducir(
-        carta.get_hp_carta,
-        participante.get('mazo_asignado')
-    )
+    totales = estadisticas_mazo.calcular_totales(participante.get('estadisticas_mazo'))
 
+    participante['hp_inicial'] = totales.get('hp')
     participante['hp_actual'] = participante['hp_inicial']
+    participante['attack'] = totales.get('atk')
+    participante['defense'] = totales.get('def')
+
+def get_stats_restantes_participante(participante: dict) -> dict:
+    """
+    Obtiene la suma de HP, ATK y DEF de las cartas que el participante todavia no jugo.
     
-    participante['attack'] = aux.reducir(
-        carta.get_atk_carta,
-        participante.get('mazo_asignado')
-    )
+    Args:
+        participante: Diccionario con los datos del participante
+        
+    Returns:
+        dict: Diccionario 'hp', 'atk', 'def' -> total de las cartas que quedan en el mazo
+    """
+    # Las cartas se sacan del final del mazo, asi que las que quedan son las primeras del mazo asignado
+    return estadisticas_mazo.calcular_totales(participante.get('estadisticas_mazo'), len(participante.get('cartas_mazo')))
 
-    participante['defense'] = aux.reducir(
-        carta.get_def_carta,
-        participante.get('mazo_asignado')
-    )
+def get_desglose_estrellas_participante(participante: dict) -> dict:
+    """
+    Obtiene la cantidad de cartas y la suma de HP, ATK y DEF del mazo asignado agrupadas por estrellas.
+    
+    Args:
+        participante: Diccionario con los datos del participante
+        
+    Returns:
+        dict: Diccionario estrellas -> {'cantidad', 'hp', 'atk', 'def'}
+    """
+    return estadisticas_mazo.calcular_desglose_estrellas(participante.get('estadisticas_mazo'))
 
 def chequear_valor_negativo(stat: int):
     """
@@ -328,8 +346,8 @@ def restar_stats_participante(participante: dict, carta_g: dict, is_critic: bool
     atk_base = carta.get_atk_carta(carta_g)
     def_base = carta.get_def_carta(carta_jugador)
     
-    atk_con_bonus = carta.calcular_bonus_estrellas(carta_g, atk_base)
-    def_con_bonus = carta.calcular_bonus_estrellas(carta_jugador, def_base)
+    atk_con_bonus = carta.get_atk_efectivo_carta(carta_g)
+    def_con_bonus = carta.get_def_efectivo_carta(carta_jugador)
     
     damage = atk_con_bonus - def_con_bonus
     
@@ -395,6 +413,23 @@ def info_to_csv(participante: dict) -> str:
     """
     return f'{get_nombre_participante(participante)},{participante.get("score")}\n'
 
+def get_cartas_en_mesa_participante(participante: dict) -> list[tuple[dict, bool]]:
+    """
+    Obtiene las cartas del participante que se ven en la mesa: la de arriba del mazo y la ultima jugada.
+    
+    Args:
+        participante: Diccionario con los datos del participante
+        
+    Returns:
+        list: Tuplas (carta, es_jugada); solo la carta jugada responde al hover
+    """
+    cartas_en_mesa = []
+    if participante.get('cartas_mazo'):
+        cartas_en_mesa.append((participante.get('cartas_mazo')[-1], False))
+    if participante.get('cartas_mazo_usadas'):
+        cartas_en_mesa.append((participante.get('cartas_mazo_usadas')[-1], True))
+    return cartas_en_mesa
+
 def draw_participante(participante: dict, screen: pg.Surface, mouse_pos=None):
     """
     Dibuja las cartas del participante en la pantalla.
@@ -407,11 +442,6 @@ def draw_participante(participante: dict, screen: pg.Surface, mouse_pos=None):
     Returns:
         None: Dibuja las cartas en la pantalla
     """
-
-    if participante.get('cartas_mazo'):
-        carta.draw_carta(participante.get('cartas_mazo')[-1], screen)
-    if participante.get('cartas_mazo_usadas'):
+    for carta_mesa, es_jugada in get_cartas_en_mesa_participante(participante):
         # Solo zoom en carta jugada
-        carta.draw_carta(participante.get('cartas_mazo_usadas')[-1], screen, mouse_pos)
-
-
+        carta.draw_carta(carta_mesa, screen, mouse_pos if es_jugada else None)
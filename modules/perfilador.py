@@ -0,0 +1,227 @@
+"""
+Modulo perfilador del inicio del juego.
+Mide la duracion de cada fase del arranque y el tiempo de importacion de los modulos del juego,
+imprime un resumen y guarda un reporte en JSON para comparar arranques entre versiones.
+No importa pygame ni modules.variables, para poder activarse antes que cualquier otro modulo del juego.
+"""
+
+import sys
+import os
+import json
+import time
+import datetime
+from contextlib import contextmanager
+
+VARIABLE_ENTORNO = 'DBZ_PERFIL_INICIO'
+ARGUMENTO_LINEA_COMANDOS = '--perfil-inicio'
+PREFIJOS_MEDIDOS = ('modules.', 'utn_fra.pygame_widgets')
+
+perfil_configs = {
+    "activo": False,
+    "inicio": 0,
+    "fases": [],
+    "importaciones": [],
+    "pila_importaciones": []
+}
+
+class MedidorImportaciones:
+    '''
+    Buscador de modulos que no carga nada por si mismo: delega en los demas buscadores de sys.meta_path
+    y envuelve la ejecucion de los modulos medidos para registrar cuanto tardan en importarse
+    '''
+    def find_spec(self, fullname: str, path=None, target=None):
+        if not es_modulo_medido(fullname):
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    envolver_loader(spec.loader, fullname)
+                return spec
+        return None
+
+def perfil_solicitado() -> bool:
+    """
+    Verifica si se pidio perfilar el inicio por variable de entorno o por linea de comandos.
+
+    Args:
+        Ninguno
+
+    Returns:
+        bool: True si hay que perfilar el inicio
+    """
+    return os.environ.get(VARIABLE_ENTORNO) == '1' or ARGUMENTO_LINEA_COMANDOS in sys.argv
+
+def esta_activo() -> bool:
+    """
+    Verifica si el perfilador esta midiendo.
+
+    Args:
+        Ninguno
+
+    Returns:
+        bool: True si el perfilador esta activo
+    """
+    return perfil_configs['activo']
+
+def es_modulo_medido(nombre_modulo: str) -> bool:
+    """
+    Verifica si la importacion de un modulo debe medirse.
+
+    Args:
+        nombre_modulo: Nombre completo del modulo
+
+    Returns:
+        bool: True si el modulo pertenece al juego o a los widgets de utn_fra
+    """
+    return nombre_modulo.startswith(PREFIJOS_MEDIDOS)
+
+def envolver_loader(loader, nombre_modulo: str):
+    """
+    Reemplaza el exec_module de un loader por uno que registra el tiempo de ejecucion del modulo.
+    El tiempo propio descuenta el de los modulos medidos que se importan desde el.
+
+    Args:
+        loader: Loader del modulo
+        nombre_modulo: Nombre completo del modulo
+
+    Returns:
+        None
+    """
+    exec_module_original = loader.exec_module
+
+    def exec_module_medido(module):
+        pila = perfil_configs['pila_importaciones']
+        pila.append(0)
+        inicio = time.perf_counter()
+        try:
+            exec_module_original(module)
+        finally:
+            acumulado = (time.perf_counter() - inicio) * 1000
+            tiempo_hijos = pila.pop()
+            if pila:
+                pila[-1] += acumulado
+            perfil_configs['importaciones'].append({
+                'modulo': nombre_modulo,
+                'acumulado_ms': round(acumulado, 3),
+                'propio_ms': round(acumulado - tiempo_hijos, 3)
+            })
+
+    loader.exec_module = exec_module_medido
+
+def activar():
+    """
+    Empieza a medir: toma el instante de inicio e instala el medidor de importaciones.
+    Debe llamarse antes de importar los modulos del juego.
+
+    Args:
+        Ninguno
+
+    Returns:
+        None
+    """
+    if perfil_configs['activo']:
+        return
+    perfil_configs['activo'] = True
+    perfil_configs['inicio'] = time.perf_counter()
+    sys.meta_path.insert(0, MedidorImportaciones())
+
+def desactivar():
+    """
+    Deja de medir y quita el medidor de importaciones.
+
+    Args:
+        Ninguno
+
+    Returns:
+        None
+    """
+    perfil_configs['activo'] = False
+    sys.meta_path[:] = [finder for finder in sys.meta_path if not isinstance(finder, MedidorImportaciones)]
+
+@contextmanager
+def fase(nombre: str):
+    """
+    Mide la duracion del bloque de codigo como una fase del inicio. Si el perfilador no esta activo no hace nada.
+
+    Args:
+        nombre: Nombre de la fase
+
+    Returns:
+        None
+    """
+    if not perfil_configs['activo']:
+        yield
+        return
+
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        fin = time.perf_counter()
+        perfil_configs['fases'].append({
+            'nombre': nombre,
+            'inicio_ms': round((inicio - perfil_configs['inicio']) * 1000, 3),
+            'duracion_ms': round((fin - inicio) * 1000, 3)
+        })
+
+def generar_reporte() -> dict:
+    """
+    Arma el reporte con las fases y las importaciones medidas hasta el momento.
+
+    Args:
+        Ninguno
+
+    Returns:
+        dict: Reporte con el total, las fases en orden y las importaciones de mas lenta a mas rapida
+    """
+    return {
+        'fecha': datetime.datetime.now().isoformat(timespec='seconds'),
+        'total_ms': round((time.perf_counter() - perfil_configs['inicio']) * 1000, 3),
+        'fases': list(perfil_configs['fases']),
+        'importaciones': sorted(perfil_configs['importaciones'], key=lambda importacion: importacion['acumulado_ms'], reverse=True)
+    }
+
+def imprimir_reporte(reporte: dict):
+    """
+    Imprime el desglose de tiempos del inicio.
+
+    Args:
+        reporte: Reporte generado con generar_reporte
+
+    Returns:
+        None
+    """
+    print(f'Perfil de inicio: {reporte["total_ms"]:.1f} ms')
+    for datos_fase in reporte['fases']:
+        print(f'  {datos_fase["nombre"]:<44} {datos_fase["duracion_ms"]:9.1f} ms  (desde {datos_fase["inicio_ms"]:.1f} ms)')
+    print('Importaciones (acumulado / propio):')
+    for importacion in reporte['importaciones']:
+        print(f'  {importacion["modulo"]:<44} {importacion["acumulado_ms"]:9.1f} ms {importacion["propio_ms"]:9.1f} ms')
+
+def finalizar(ruta_reporte: str):
+    """
+    Termina la medicion del inicio, imprime el resumen y guarda el reporte en JSON.
+
+    Args:
+        ruta_reporte: Ruta del archivo JSON del reporte
+
+    Returns:
+        None
+    """
+    if not perfil_configs['activo']:
+        return
+
+    reporte = generar_reporte()
+    desactivar()
+    imprimir_reporte(reporte)
+
+    directorio = os.path.dirname(ruta_reporte)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    with open(ruta_reporte, 'w', encoding='utf-8') as file:
+        json.dump(reporte, file, indent=4)
+    print(f'Reporte de inicio guardado en {ruta_reporte}')
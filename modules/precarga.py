@@ -0,0 +1,155 @@
+"""
+Modulo de precarga de imagenes al iniciar el juego.
+Lee y decodifica los archivos de imagen en un pool de hilos y deja la conversion al formato de pantalla
+en el hilo principal, guardando el resultado en la cache de recursos.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import io
+import os
+import pygame as pg
+import modules.variables as var
+import modules.recursos as recursos
+import modules.atlas as atlas
+import modules.horneado as horneado
+import modules.almacen_cartas as almacen_cartas
+
+def listar_imagenes_precarga(ruta_base: str = var.RUTA_IMAGENES) -> list[str]:
+    """
+    Lista todas las imagenes a precargar. Los mazos con un almacen mapeado vigente no se precargan,
+    los que tienen un atlas vigente se reemplazan por su atlas y, si los fondos usan la calidad precalculada,
+    los fondos ya horneados al tamanio de pantalla tampoco se precargan.
+
+    Args:
+        ruta_base: Directorio raiz de las imagenes del juego
+
+    Returns:
+        list: Rutas de las imagenes a precargar con separador '/'
+    """
+    rutas = []
+    fondos_horneados = recursos.get_calidad_escalado('fondos') == var.CALIDAD_PRECALCULADA
+
+    for root, dirs, files in os.walk(ruta_base):
+        root = root.replace('\\', '/')
+        nombre_directorio = root.split('/')[-1]
+
+        if var.ALMACEN_CARTAS == 'mmap':
+            if atlas.atlas_vigente(almacen_cartas.cargar_indice_almacen(nombre_directorio), root):
+                continue
+        else:
+            indice = atlas.cargar_indice_atlas(nombre_directorio)
+            if atlas.atlas_vigente(indice, root):
+                rutas.append(indice.get('imagen'))
+                continue
+
+        for archivo in sorted(files):
+            ruta = f'{root}/{archivo}'
+            if fondos_horneados and ruta in var.FONDOS_FORMULARIOS and horneado.horneado_vigente(ruta, horneado.etiqueta_tamanio(var.DIMENSION_PANTALLA)):
+                continue
+            if archivo.endswith('.png'):
+                rutas.append(ruta)
+
+    return rutas
+
+def leer_y_decodificar(ruta_img: str) -> tuple[str, pg.Surface]:
+    """
+    Lee los bytes de una imagen y la decodifica. Se ejecuta en los hilos del pool.
+
+    Args:
+        ruta_img: Ruta de la imagen
+
+    Returns:
+        tuple: Ruta y superficie decodificada (sin convertir al formato de pantalla)
+    """
+    with open(ruta_img, 'rb') as file:
+        datos = file.read()
+    return ruta_img, pg.image.load(io.BytesIO(datos), os.path.basename(ruta_img))
+
+def crear_precarga(rutas: list[str]) -> dict:
+    """
+    Inicia la lectura y decodificacion en paralelo de una lista de imagenes.
+
+    Args:
+        rutas: Rutas de las imagenes a precargar
+
+    Returns:
+        dict: Estado de la precarga con las tareas pendientes y el progreso
+    """
+    precarga = {}
+    precarga['total'] = len(rutas)
+    precarga['completadas'] = 0
+    precarga['errores'] = []
+    precarga['executor'] = ThreadPoolExecutor(max_workers=var.PRECARGA_HILOS)
+    precarga['pendientes'] = [(ruta, precarga['executor'].submit(leer_y_decodificar, ruta)) for ruta in rutas]
+    return precarga
+
+def procesar_precarga(precarga: dict):
+    """
+    Convierte al formato de pantalla las imagenes ya decodificadas y las registra en la cache.
+    Debe llamarse desde el hilo principal. Al terminar informa las imagenes que no se pudieron cargar.
+
+    Args:
+        precarga: Estado de la precarga
+
+    Returns:
+        None
+    """
+    pendientes = []
+    for ruta, tarea in precarga.get('pendientes'):
+        if not tarea.done():
+            pendientes.append((ruta, tarea))
+            continue
+
+        try:
+            ruta, imagen = tarea.result()
+            recursos.registrar_original(ruta, imagen.convert_alpha())
+        except (OSError, pg.error) as error:
+            precarga['errores'].append(f'{ruta}: {error}')
+        precarga['completadas'] += 1
+
+    if not pendientes:
+        precarga['executor'].shutdown()
+        if precarga.get('pendientes'):
+            imprimir_errores(precarga)
+    precarga['pendientes'] = pendientes
+
+def imprimir_errores(precarga: dict):
+    """
+    Imprime las imagenes que no se pudieron precargar. El juego las vuelve a intentar leer cuando las necesita.
+
+    Args:
+        precarga: Estado de la precarga
+
+    Returns:
+        None
+    """
+    if precarga.get('errores'):
+        print(f'No se pudieron precargar {len(precarga.get("errores"))} imagenes:')
+        for error in precarga.get('errores'):
+            print(f'  Error: {error}')
+
+def get_progreso_precarga(precarga: dict) -> float:
+    """
+    Obtiene el progreso de la precarga como fraccion entre 0 y 1.
+
+    Args:
+        precarga: Estado de la precarga
+
+    Returns:
+        float: Fraccion de imagenes ya registradas
+    """
+    if not precarga.get('total'):
+        return 1
+    return precarga.get('completadas') / precarga.get('total')
+
+def precarga_finalizada(precarga: dict) -> bool:
+    """
+    Verifica si todas las imagenes fueron procesadas.
+
+    Args:
+        precarga: Estado de la precarga
+
+    Returns:
+        bool: True si no quedan imagenes pendientes
+    """
+    return not precarga.get('pendientes')
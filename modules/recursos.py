@@ -0,0 +1,544 @@
+"""
+Modulo de gestion de recursos graficos del juego.
+Mantiene una cache de superficies escaladas para evitar leer y redimensionar imagenes desde disco en cada frame,
+y una cache de textos renderizados compartida por todos los widgets.
+Los fondos de los formularios se comparten con conteo de referencias: una sola superficie por ruta y tamanio.
+"""
+
+from collections import OrderedDict
+import pygame as pg
+import modules.variables as var
+import modules.horneado as horneado
+
+cache_superficies = {
+    "originales": {},
+    "superficies": OrderedDict(),
+    "fijadas": {},
+    "regiones": {},
+    "max_entradas": var.CACHE_SUPERFICIES_MAX,
+    "hits": 0,
+    "misses": 0
+}
+
+cache_zoom = {
+    "frames": OrderedDict(),
+    "bytes": 0,
+    "max_bytes": var.CACHE_ZOOM_MEMORIA_MAX,
+    "hits": 0,
+    "misses": 0
+}
+
+superficies_compartidas = {
+    "superficies": {},
+    "referencias": {},
+    "propietarios": {}
+}
+
+cache_textos = {
+    "fuentes": {},
+    "textos": OrderedDict(),
+    "max_entradas": var.CACHE_TEXTOS_MAX,
+    "hits": 0,
+    "misses": 0
+}
+
+def calcular_tamanio_escalado(ancho: int, alto: int, porcentaje_a_ajustar: int) -> tuple[int, int]:
+    """
+    Calcula las dimensiones finales de una imagen al aplicarle un porcentaje de escala.
+
+    Args:
+        ancho: Ancho original de la imagen
+        alto: Alto original de la imagen
+        porcentaje_a_ajustar: Porcentaje de escala a aplicar (50 significa 50%)
+
+    Returns:
+        tuple: Dimensiones (ancho, alto) escaladas
+    """
+    nuevo_ancho = ancho * porcentaje_a_ajustar // 100
+    nuevo_alto = alto * porcentaje_a_ajustar // 100
+    return (nuevo_ancho, nuevo_alto)
+
+def get_calidad_escalado(clase_recurso: str) -> str:
+    """
+    Obtiene la calidad de escalado configurada para una clase de recurso.
+
+    Args:
+        clase_recurso: Clase del recurso ('cartas', 'fondos' o 'zoom')
+
+    Returns:
+        str: Calidad de escalado, rapida si la clase no esta configurada
+    """
+    return var.CALIDAD_ESCALADO.get(clase_recurso, var.CALIDAD_RAPIDA)
+
+def get_calidad_sin_horneado(clase_recurso: str) -> str:
+    """
+    Obtiene la calidad con la que se escala en el momento una imagen de la clase que no tiene version horneada.
+    Si la clase usa la calidad precalculada se escala con la rapida: sin hornear, la calidad suave costaria un
+    smoothscale en cada carga. 'python -m modules.auxiliar bake' genera las versiones suaves.
+
+    Args:
+        clase_recurso: Clase del recurso ('cartas', 'fondos' o 'zoom')
+
+    Returns:
+        str: Calidad de escalado
+    """
+    calidad = get_calidad_escalado(clase_recurso)
+    if calidad == var.CALIDAD_PRECALCULADA:
+        return var.CALIDAD_RAPIDA
+    return calidad
+
+def escalar_con_calidad(imagen: pg.Surface, tamanio: tuple[int, int], calidad: str) -> pg.Surface:
+    """
+    Escala una imagen con la calidad indicada. La calidad precalculada escala como la suave, que es
+    con la que se hornean las imagenes.
+
+    Args:
+        imagen: Imagen a escalar
+        tamanio: Tamanio (ancho, alto) final
+        calidad: Calidad de escalado
+
+    Returns:
+        Surface: Imagen escalada
+    """
+    if calidad == var.CALIDAD_RAPIDA:
+        return pg.transform.scale(imagen, tamanio)
+
+    # smoothscale solo acepta imagenes de 24 o 32 bits
+    if imagen.get_bitsize() < 24:
+        imagen_32 = pg.Surface(imagen.get_size(), pg.SRCALPHA, 32)
+        imagen_32.blit(imagen, (0, 0))
+        imagen = imagen_32
+    return pg.transform.smoothscale(imagen, tamanio)
+
+def escalar_superficie(imagen: pg.Surface, tamanio: tuple[int, int], clase_recurso: str) -> pg.Surface:
+    """
+    Escala una imagen con la calidad configurada para su clase de recurso.
+
+    Args:
+        imagen: Imagen a escalar
+        tamanio: Tamanio (ancho, alto) final
+        clase_recurso: Clase del recurso ('cartas', 'fondos' o 'zoom')
+
+    Returns:
+        Surface: Imagen escalada
+    """
+    return escalar_con_calidad(imagen, tamanio, get_calidad_escalado(clase_recurso))
+
+def registrar_original(ruta_img: str, imagen: pg.Surface):
+    """
+    Guarda una imagen ya decodificada en su tamanio original para no volver a leerla desde disco.
+
+    Args:
+        ruta_img: Ruta de la imagen
+        imagen: Superficie decodificada (idealmente convertida al formato de pantalla)
+
+    Returns:
+        None
+    """
+    cache_superficies['originales'][ruta_img] = imagen
+
+def descartar_original(ruta_img: str):
+    """
+    Libera la imagen precargada en tamanio original de una ruta. Se llama cuando ya existen todas las versiones
+    escaladas que el juego usa de esa imagen, para no mantener en memoria los originales durante toda la sesion.
+    Si despues se vuelve a pedir, se lee desde disco.
+
+    Args:
+        ruta_img: Ruta de la imagen
+
+    Returns:
+        None
+    """
+    cache_superficies['originales'].pop(ruta_img, None)
+
+def cargar_imagen(ruta_img: str) -> pg.Surface:
+    """
+    Obtiene una imagen en su tamanio original, usando la version precargada si existe.
+
+    Args:
+        ruta_img: Ruta de la imagen
+
+    Returns:
+        Surface: Imagen original (compartida si fue precargada, no debe modificarse)
+    """
+    imagen = cache_superficies['originales'].get(ruta_img)
+    if imagen is None:
+        imagen = pg.image.load(ruta_img)
+        if pg.display.get_surface():
+            imagen = imagen.convert_alpha()
+    return imagen
+
+def escalar_imagen(ruta_img: str, porcentaje_a_ajustar: int) -> pg.Surface:
+    """
+    Carga una carta (horneada, precargada o desde disco) y la redimensiona sin pasar por la cache.
+    Con calidad precalculada se usa la version horneada, que ya tiene el tamanio final,
+    asi que no se decodifica el PNG ni se escala; si no esta horneada se escala con la calidad rapida.
+
+    Args:
+        ruta_img: Ruta de la imagen a cargar
+        porcentaje_a_ajustar: Porcentaje de escala a aplicar
+
+    Returns:
+        Surface: Imagen redimensionada, convertida al formato de pantalla si ya existe una
+    """
+    if get_calidad_escalado('cartas') == var.CALIDAD_PRECALCULADA:
+        imagen_horneada = horneado.cargar_horneada(ruta_img, horneado.etiqueta_porcentaje(porcentaje_a_ajustar))
+        if imagen_horneada is not None:
+            return imagen_horneada
+
+    image_raw = cargar_imagen(ruta_img)
+    tamanio = calcular_tamanio_escalado(image_raw.get_width(), image_raw.get_height(), porcentaje_a_ajustar)
+    return escalar_con_calidad(image_raw, tamanio, get_calidad_sin_horneado('cartas'))
+
+def obtener_superficie(ruta_img: str, porcentaje_a_ajustar: int) -> pg.Surface:
+    """
+    Obtiene una imagen escalada desde la cache, cargandola desde disco solo si no estaba cacheada.
+    Cuando la cache supera su capacidad se descarta la imagen usada hace mas tiempo.
+
+    Args:
+        ruta_img: Ruta de la imagen
+        porcentaje_a_ajustar: Porcentaje de escala a aplicar
+
+    Returns:
+        Surface: Imagen escalada compartida (no debe modificarse)
+    """
+    clave = (ruta_img, porcentaje_a_ajustar)
+
+    superficie = cache_superficies['regiones'].get(clave)
+    if superficie is None:
+        superficie = cache_superficies['fijadas'].get(clave)
+    if superficie is not None:
+        cache_superficies['hits'] += 1
+        return superficie
+
+    superficies = cache_superficies['superficies']
+    superficie = superficies.get(clave)
+    if superficie is not None:
+        cache_superficies['hits'] += 1
+        superficies.move_to_end(clave)
+        return superficie
+
+    cache_superficies['misses'] += 1
+    superficie = escalar_imagen(ruta_img, porcentaje_a_ajustar)
+    superficies[clave] = superficie
+
+    while len(superficies) > cache_superficies['max_entradas']:
+        superficies.popitem(last=False)
+
+    return superficie
+
+def fijar_superficie(ruta_img: str, porcentaje_a_ajustar: int):
+    """
+    Carga una imagen escalada en la cache de forma permanente, sin que pueda ser descartada.
+
+    Args:
+        ruta_img: Ruta de la imagen
+        porcentaje_a_ajustar: Porcentaje de escala a aplicar
+
+    Returns:
+        None
+    """
+    clave = (ruta_img, porcentaje_a_ajustar)
+    if clave not in cache_superficies['fijadas'] and clave not in cache_superficies['regiones']:
+        superficie = cache_superficies['superficies'].pop(clave, None)
+        if superficie is None:
+            superficie = escalar_imagen(ruta_img, porcentaje_a_ajustar)
+        cache_superficies['fijadas'][clave] = superficie
+
+def registrar_region(ruta_img: str, porcentaje_a_ajustar: int, region: pg.Surface):
+    """
+    Registra una region de un atlas como la imagen escalada de una ruta y porcentaje.
+    Las regiones tienen prioridad sobre la cache y nunca se descartan.
+
+    Args:
+        ruta_img: Ruta de la imagen original
+        porcentaje_a_ajustar: Porcentaje de escala con el que se horneo la region
+        region: Subsuperficie del atlas con la imagen ya escalada
+
+    Returns:
+        None
+    """
+    clave = (ruta_img, porcentaje_a_ajustar)
+    cache_superficies['regiones'][clave] = region
+    cache_superficies['superficies'].pop(clave, None)
+    cache_superficies['fijadas'].pop(clave, None)
+
+def precargar_reverso(ruta_reverso: str):
+    """
+    Fija en la cache el reverso compartido de un mazo en los tamanios normal y hover de las cartas.
+
+    Args:
+        ruta_reverso: Ruta de la imagen del reverso del mazo
+
+    Returns:
+        None
+    """
+    if ruta_reverso:
+        fijar_superficie(ruta_reverso, var.CARTA_SIZE_NORMAL)
+        fijar_superficie(ruta_reverso, var.CARTA_SIZE_HOVER)
+        descartar_original(ruta_reverso)
+
+def calcular_bytes_superficie(superficie: pg.Surface) -> int:
+    """
+    Calcula la memoria de pixeles que ocupa una superficie.
+
+    Args:
+        superficie: Superficie a medir
+
+    Returns:
+        int: Cantidad de bytes de pixeles
+    """
+    return superficie.get_width() * superficie.get_height() * superficie.get_bytesize()
+
+def obtener_frame_zoom(ruta_img: str, indice_frame: int) -> pg.Surface:
+    """
+    Obtiene un frame de la animacion de zoom de una carta, entre el tamanio normal (frame 0)
+    y el tamanio hover (ultimo frame). Los frames intermedios se generan la primera vez que se piden
+    a partir de la imagen hover y se cachean con un limite de memoria.
+
+    Args:
+        ruta_img: Ruta de la imagen de la carta
+        indice_frame: Frame de la animacion, entre 0 y var.CARTA_ZOOM_FRAMES
+
+    Returns:
+        Surface: Imagen de la carta para ese frame (compartida, no debe modificarse)
+    """
+    if indice_frame <= 0:
+        return obtener_superficie(ruta_img, var.CARTA_SIZE_NORMAL)
+    if indice_frame >= var.CARTA_ZOOM_FRAMES:
+        return obtener_superficie(ruta_img, var.CARTA_SIZE_HOVER)
+
+    clave = (ruta_img, indice_frame)
+    frames = cache_zoom['frames']
+
+    superficie = frames.get(clave)
+    if superficie is not None:
+        cache_zoom['hits'] += 1
+        frames.move_to_end(clave)
+        return superficie
+
+    cache_zoom['misses'] += 1
+    imagen_normal = obtener_superficie(ruta_img, var.CARTA_SIZE_NORMAL)
+    imagen_hover = obtener_superficie(ruta_img, var.CARTA_SIZE_HOVER)
+
+    progreso = indice_frame / var.CARTA_ZOOM_FRAMES
+    ancho = round(imagen_normal.get_width() + (imagen_hover.get_width() - imagen_normal.get_width()) * progreso)
+    alto = round(imagen_normal.get_height() + (imagen_hover.get_height() - imagen_normal.get_height()) * progreso)
+
+    superficie = escalar_superficie(imagen_hover, (ancho, alto), 'zoom')
+    frames[clave] = superficie
+    cache_zoom['bytes'] += calcular_bytes_superficie(superficie)
+
+    while cache_zoom['bytes'] > cache_zoom['max_bytes'] and len(frames) > 1:
+        clave_descartada, superficie_descartada = frames.popitem(last=False)
+        cache_zoom['bytes'] -= calcular_bytes_superficie(superficie_descartada)
+
+    return superficie
+
+def get_estadisticas_cache() -> dict:
+    """
+    Obtiene los contadores de uso de la cache de superficies.
+
+    Args:
+        Ninguno
+
+    Returns:
+        dict: Aciertos, fallos, tasa de acierto, cantidad de entradas de la cache y memoria de los originales
+    """
+    hits = cache_superficies['hits']
+    misses = cache_superficies['misses']
+    total = hits + misses
+
+    return {
+        'hits': hits,
+        'misses': misses,
+        'tasa_acierto': hits / total if total else 0,
+        'entradas': len(cache_superficies['superficies']),
+        'fijadas': len(cache_superficies['fijadas']),
+        'regiones': len(cache_superficies['regiones']),
+        'originales': len(cache_superficies['originales']),
+        'bytes_originales': sum(calcular_bytes_superficie(imagen) for imagen in cache_superficies['originales'].values()),
+        'frames_zoom': len(cache_zoom['frames']),
+        'bytes_zoom': cache_zoom['bytes']
+    }
+
+def limpiar_cache():
+    """
+    Vacia la cache de superficies, las imagenes precargadas y reinicia sus contadores.
+
+    Args:
+        Ninguno
+
+    Returns:
+        None
+    """
+    cache_superficies['originales'].clear()
+    cache_superficies['superficies'].clear()
+    cache_superficies['fijadas'].clear()
+    cache_superficies['regiones'].clear()
+    cache_superficies['hits'] = 0
+    cache_superficies['misses'] = 0
+    cache_zoom['frames'].clear()
+    cache_zoom['bytes'] = 0
+
+def adquirir_superficie(ruta_img: str, tamanio: tuple[int, int], propietario: str) -> pg.Surface:
+    """
+    Entrega la superficie compartida de una imagen escalada a un tamanio, creandola si nadie la tenia
+    (desde su version horneada si la calidad de los fondos es precalculada y existe).
+    Cada llamada suma una referencia que debe devolverse con liberar_superficie.
+
+    Args:
+        ruta_img: Ruta de la imagen
+        tamanio: Tamanio (ancho, alto) de la superficie
+        propietario: Nombre de quien usa la superficie, normalmente el formulario
+
+    Returns:
+        Surface: Superficie compartida (no debe modificarse)
+    """
+    clave = (ruta_img, tuple(tamanio))
+
+    if clave not in superficies_compartidas['superficies']:
+        superficie = None
+        if get_calidad_escalado('fondos') == var.CALIDAD_PRECALCULADA:
+            superficie = horneado.cargar_horneada(ruta_img, horneado.etiqueta_tamanio(clave[1]))
+        if superficie is None:
+            superficie = escalar_con_calidad(cargar_imagen(ruta_img), clave[1], get_calidad_sin_horneado('fondos'))
+        # Los fondos solo se usan al tamanio de pantalla: ya escalado, el original no vuelve a hacer falta
+        descartar_original(ruta_img)
+        superficies_compartidas['superficies'][clave] = superficie
+        superficies_compartidas['referencias'][clave] = 0
+
+    superficies_compartidas['referencias'][clave] += 1
+    superficies_compartidas['propietarios'].setdefault(propietario, []).append(clave)
+
+    return superficies_compartidas['superficies'][clave]
+
+def liberar_superficie(ruta_img: str, tamanio: tuple[int, int], propietario: str):
+    """
+    Devuelve una referencia a una superficie compartida. Al no quedar referencias, la superficie se descarta.
+
+    Args:
+        ruta_img: Ruta de la imagen
+        tamanio: Tamanio (ancho, alto) de la superficie
+        propietario: Nombre de quien la habia adquirido
+
+    Returns:
+        None
+    """
+    clave = (ruta_img, tuple(tamanio))
+    claves_propietario = superficies_compartidas['propietarios'].get(propietario, [])
+    if clave not in claves_propietario:
+        return
+
+    claves_propietario.remove(clave)
+    if not claves_propietario:
+        del superficies_compartidas['propietarios'][propietario]
+
+    superficies_compartidas['referencias'][clave] -= 1
+    if superficies_compartidas['referencias'][clave] == 0:
+        del superficies_compartidas['referencias'][clave]
+        del superficies_compartidas['superficies'][clave]
+
+def get_memoria_propietarios() -> dict:
+    """
+    Calcula la memoria de las superficies compartidas que usa cada propietario.
+    Una superficie compartida suma en cada propietario que la usa.
+
+    Args:
+        Ninguno
+
+    Returns:
+        dict: Bytes de pixeles por propietario
+    """
+    memoria = {}
+    for propietario, claves in superficies_compartidas['propietarios'].items():
+        memoria[propietario] = sum(calcular_bytes_superficie(superficies_compartidas['superficies'][clave]) for clave in set(claves))
+    return memoria
+
+def get_estadisticas_compartidas() -> dict:
+    """
+    Obtiene el estado de las superficies compartidas.
+
+    Args:
+        Ninguno
+
+    Returns:
+        dict: Cantidad de superficies, referencias totales y bytes reales ocupados
+    """
+    return {
+        'superficies': len(superficies_compartidas['superficies']),
+        'referencias': sum(superficies_compartidas['referencias'].values()),
+        'bytes': sum(calcular_bytes_superficie(superficie) for superficie in superficies_compartidas['superficies'].values())
+    }
+
+def obtener_fuente(font_path: str, font_size: int) -> pg.font.Font:
+    """
+    Obtiene una fuente cargada, creandola solo la primera vez que se pide.
+
+    Args:
+        font_path: Ruta del archivo de la fuente
+        font_size: Tamanio de la fuente
+
+    Returns:
+        Font: Fuente compartida
+    """
+    clave = (font_path, font_size)
+    fuente = cache_textos['fuentes'].get(clave)
+    if fuente is None:
+        fuente = pg.font.Font(font_path, font_size)
+        cache_textos['fuentes'][clave] = fuente
+    return fuente
+
+def renderizar_texto(font_path: str, font_size: int, texto: str, color: tuple) -> pg.Surface:
+    """
+    Obtiene un texto renderizado desde la cache, renderizandolo solo si no estaba cacheado.
+    Cuando la cache supera su capacidad se descarta el texto usado hace mas tiempo.
+
+    Args:
+        font_path: Ruta del archivo de la fuente
+        font_size: Tamanio de la fuente
+        texto: Texto a renderizar
+        color: Color del texto
+
+    Returns:
+        Surface: Texto renderizado compartido (no debe modificarse)
+    """
+    clave = (font_path, font_size, texto, tuple(color))
+    textos = cache_textos['textos']
+
+    superficie = textos.get(clave)
+    if superficie is not None:
+        cache_textos['hits'] += 1
+        textos.move_to_end(clave)
+        return superficie
+
+    cache_textos['misses'] += 1
+    superficie = obtener_fuente(font_path, font_size).render(texto, True, color)
+    textos[clave] = superficie
+
+    while len(textos) > cache_textos['max_entradas']:
+        textos.popitem(last=False)
+
+    return superficie
+
+def get_estadisticas_cache_textos() -> dict:
+    """
+    Obtiene los contadores de uso de la cache de textos.
+
+    Args:
+        Ninguno
+
+    Returns:
+        dict: Aciertos, fallos, tasa de acierto, textos y fuentes cacheadas
+    """
+    hits = cache_textos['hits']
+    misses = cache_textos['misses']
+    total = hits + misses
+
+    return {
+        'hits': hits,
+        'misses': misses,
+        'tasa_acierto': hits / total if total else 0,
+        'entradas': len(cache_textos['textos']),
+        'fuentes': len(cache_textos['fuentes'])
+    }
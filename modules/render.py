@@ -0,0 +1,250 @@
+"""
+Modulo de presentacion de frames en pantalla.
+Implementa el modo opcional de rectangulos sucios: los formularios y widgets informan las zonas que cambiaron
+y solo esas zonas se redibujan y se envian a la pantalla, en lugar de la ventana completa.
+"""
+
+import pygame as pg
+import modules.variables as var
+
+render_configs = {
+    "dirty_rects": var.DIRTY_RECTS,
+    "pantalla_completa": True,
+    "completo_frame": False,
+    "rects": [],
+    "rects_frame": [],
+    "clip_activo": False,
+    "widgets_previos": {},
+    "cursor_rect_previo": None,
+    "frame_omitido": False
+}
+
+EVENTOS_REDIBUJO_COMPLETO = (
+    pg.MOUSEBUTTONDOWN,
+    pg.MOUSEBUTTONUP,
+    pg.KEYDOWN,
+    pg.KEYUP,
+    pg.VIDEOEXPOSE,
+    pg.WINDOWEXPOSED,
+    pg.WINDOWRESTORED
+)
+
+def modo_dirty_activo() -> bool:
+    """
+    Verifica si el modo de rectangulos sucios esta activo.
+
+    Args:
+        Ninguno
+
+    Returns:
+        bool: True si solo se redibujan las zonas que cambiaron
+    """
+    return render_configs['dirty_rects']
+
+def set_modo_dirty(activo: bool):
+    """
+    Activa o desactiva el modo de rectangulos sucios forzando un redibujo completo.
+
+    Args:
+        activo: True para activar el modo
+
+    Returns:
+        None
+    """
+    render_configs['dirty_rects'] = activo
+    marcar_pantalla_completa()
+
+def marcar_pantalla_completa():
+    """
+    Indica que el proximo frame debe redibujarse y presentarse completo.
+
+    Args:
+        Ninguno
+
+    Returns:
+        None
+    """
+    render_configs['pantalla_completa'] = True
+
+def redibujo_completo_pendiente() -> bool:
+    """
+    Verifica si se pidio redibujar la pantalla completa y el pedido todavia no se atendio.
+
+    Args:
+        Ninguno
+
+    Returns:
+        bool: True si el proximo frame debe dibujarse completo
+    """
+    return render_configs['pantalla_completa']
+
+def omitir_frame():
+    """
+    Indica que en este frame no se dibujo nada porque la pantalla no cambio, asi no se presenta.
+
+    Args:
+        Ninguno
+
+    Returns:
+        None
+    """
+    render_configs['frame_omitido'] = True
+
+def marcar_rect(rect: pg.Rect):
+    """
+    Informa una zona de la pantalla que cambio. Si el frame ya empezo a dibujarse, la zona se redibuja en el siguiente.
+
+    Args:
+        rect: Rectangulo de la zona modificada
+
+    Returns:
+        None
+    """
+    if render_configs['dirty_rects'] and rect:
+        render_configs['rects'].append(pg.Rect(rect))
+
+def marcar_cambio(rect_previo: pg.Rect, rect_nuevo: pg.Rect):
+    """
+    Informa que un elemento se movio o cambio, marcando tanto su zona anterior como la nueva.
+
+    Args:
+        rect_previo: Rectangulo que ocupaba el elemento (puede ser None)
+        rect_nuevo: Rectangulo que ocupa ahora el elemento (puede ser None)
+
+    Returns:
+        None
+    """
+    marcar_rect(rect_previo)
+    marcar_rect(rect_nuevo)
+
+def detectar_cambios_widgets(widgets: list):
+    """
+    Compara la imagen y posicion de cada widget con las del frame anterior y marca las zonas que cambiaron.
+
+    Args:
+        widgets: Lista de widgets a revisar
+
+    Returns:
+        None
+    """
+    widgets_previos = render_configs['widgets_previos']
+
+    for widget in widgets:
+        estado_previo = widgets_previos.get(id(widget))
+        if estado_previo and estado_previo[0] is widget.image and estado_previo[1] == widget.rect:
+            continue
+        if estado_previo:
+            marcar_rect(estado_previo[1])
+        marcar_rect(widget.rect)
+        widgets_previos[id(widget)] = (widget.image, pg.Rect(widget.rect))
+
+def detectar_cambio_cursor():
+    """
+    Marca la zona anterior y la nueva del cursor personalizado si el mouse se movio.
+
+    Args:
+        Ninguno
+
+    Returns:
+        None
+    """
+    if not var.CURSOR_IMG:
+        return
+    rect_cursor = pg.Rect(pg.mouse.get_pos(), var.CURSOR_IMG.get_size())
+    if rect_cursor != render_configs['cursor_rect_previo']:
+        marcar_cambio(render_configs['cursor_rect_previo'], rect_cursor)
+        render_configs['cursor_rect_previo'] = rect_cursor
+
+def procesar_eventos(eventos: list):
+    """
+    Fuerza un redibujo completo ante eventos que pueden cambiar el estado de cualquier parte de la pantalla.
+
+    Args:
+        eventos: Lista de eventos de Pygame
+
+    Returns:
+        None
+    """
+    for evento in eventos:
+        if evento.type in EVENTOS_REDIBUJO_COMPLETO:
+            marcar_pantalla_completa()
+            return
+
+def iniciar_update(screen: pg.Surface):
+    """
+    Anula el dibujo durante la fase de actualizacion, ya que los widgets que se dibujan al actualizarse
+    vuelven a dibujarse despues sobre el fondo. Solo tiene efecto en modo de rectangulos sucios.
+
+    Args:
+        screen: Superficie principal del juego
+
+    Returns:
+        None
+    """
+    if render_configs['dirty_rects']:
+        screen.set_clip(pg.Rect(0, 0, 0, 0))
+
+def iniciar_frame(screen: pg.Surface, widgets: list):
+    """
+    Reune las zonas sucias del frame y limita el dibujo a ellas. Se llama antes de dibujar el fondo del formulario.
+
+    Args:
+        screen: Superficie principal del juego
+        widgets: Widgets del formulario activo
+
+    Returns:
+        None
+    """
+    if not render_configs['dirty_rects']:
+        render_configs['pantalla_completa'] = False
+        return
+    if render_configs['clip_activo']:
+        return
+
+    render_configs['completo_frame'] = render_configs['pantalla_completa']
+    render_configs['pantalla_completa'] = False
+    if render_configs['completo_frame']:
+        render_configs['widgets_previos'].clear()
+
+    detectar_cambios_widgets(widgets)
+    detectar_cambio_cursor()
+
+    render_configs['rects_frame'] = render_configs['rects']
+    render_configs['rects'] = []
+    render_configs['clip_activo'] = True
+
+    if render_configs['completo_frame']:
+        screen.set_clip(None)
+    elif render_configs['rects_frame']:
+        screen.set_clip(render_configs['rects_frame'][0].unionall(render_configs['rects_frame'][1:]))
+    else:
+        screen.set_clip(pg.Rect(0, 0, 0, 0))
+
+def presentar(screen: pg.Surface):
+    """
+    Envia el frame dibujado a la pantalla: completo, o solo las zonas sucias en el modo de rectangulos sucios.
+    Si el frame se omitio porque nada cambio, no se envia nada.
+
+    Args:
+        screen: Superficie principal del juego
+
+    Returns:
+        None
+    """
+    if render_configs['frame_omitido']:
+        render_configs['frame_omitido'] = False
+        screen.set_clip(None)
+        return
+
+    if not render_configs['dirty_rects'] or not render_configs['clip_activo']:
+        pg.display.flip()
+        return
+
+    if render_configs['completo_frame']:
+        pg.display.flip()
+    elif render_configs['rects_frame']:
+        pg.display.update(render_configs['rects_frame'])
+
+    screen.set_clip(None)
+    render_configs['rects_frame'] = []
+    render_configs['clip_activo'] = False
@@ -0,0 +1,149 @@
+"""
+Modulo de ritmo del bucle principal.
+En modo adaptativo el juego corre a los FPS completos mientras hay entrada del usuario, animaciones en curso
+o un cambio programado cercano (como el segundo del timer), y baja a un ritmo de reposo cuando no pasa nada.
+En reposo se espera bloqueado en la cola de eventos, asi cualquier entrada despierta el bucle al instante.
+"""
+
+import pygame as pg
+import modules.variables as var
+
+ritmo_configs = {
+    "adaptativo": var.FPS_ADAPTATIVO,
+    "ultima_actividad": 0,
+    "animacion_pendiente": False,
+    "proximo_despertar": None,
+    "en_reposo": False
+}
+
+def set_modo_adaptativo(activo: bool):
+    """
+    Activa o desactiva el ritmo adaptativo.
+
+    Args:
+        activo: True para bajar los FPS cuando el juego esta inactivo
+
+    Returns:
+        None
+    """
+    ritmo_configs['adaptativo'] = activo
+    ritmo_configs['ultima_actividad'] = pg.time.get_ticks()
+
+def marcar_animacion():
+    """
+    Indica que hay una animacion en curso y el proximo frame debe dibujarse a ritmo completo.
+
+    Args:
+        Ninguno
+
+    Returns:
+        None
+    """
+    ritmo_configs['animacion_pendiente'] = True
+
+def programar_despertar(tiempo_ticks: int):
+    """
+    Pide que el bucle en reposo despierte a mas tardar en un instante dado, por ejemplo cuando cambia un timer.
+    Si hay varios pedidos se respeta el mas cercano.
+
+    Args:
+        tiempo_ticks: Instante, en milisegundos de pg.time.get_ticks, en el que habra un cambio en pantalla
+
+    Returns:
+        None
+    """
+    proximo = ritmo_configs['proximo_despertar']
+    if proximo is None or tiempo_ticks < proximo:
+        ritmo_configs['proximo_despertar'] = tiempo_ticks
+
+def esta_en_reposo() -> bool:
+    """
+    Verifica si el ultimo frame se espero a ritmo de reposo.
+
+    Args:
+        Ninguno
+
+    Returns:
+        bool: True si el bucle esta en reposo
+    """
+    return ritmo_configs['en_reposo']
+
+def hay_actividad(tiempo_actual: int) -> bool:
+    """
+    Verifica si el bucle debe seguir a ritmo completo: por una animacion pendiente o por actividad reciente.
+
+    Args:
+        tiempo_actual: Milisegundos actuales de pg.time.get_ticks
+
+    Returns:
+        bool: True si hay que correr a los FPS completos
+    """
+    if ritmo_configs['animacion_pendiente']:
+        ritmo_configs['ultima_actividad'] = tiempo_actual
+        ritmo_configs['animacion_pendiente'] = False
+        return True
+    return tiempo_actual - ritmo_configs['ultima_actividad'] < var.FPS_GRACIA_MS
+
+def calcular_espera_reposo(tiempo_actual: int) -> int:
+    """
+    Calcula cuanto esperar en reposo: un frame del ritmo de reposo, o menos si hay un despertar programado antes.
+
+    Args:
+        tiempo_actual: Milisegundos actuales de pg.time.get_ticks
+
+    Returns:
+        int: Milisegundos maximos a esperar un evento, al menos 1 (pg.event.wait(0) espera sin limite)
+    """
+    espera = 1000 // var.FPS_INACTIVO
+    proximo = ritmo_configs['proximo_despertar']
+    if proximo is not None:
+        espera = max(1, min(espera, proximo - tiempo_actual))
+    return espera
+
+def despertar_vencido(tiempo_actual: int) -> bool:
+    """
+    Verifica si ya paso el instante de un despertar programado.
+
+    Args:
+        tiempo_actual: Milisegundos actuales de pg.time.get_ticks
+
+    Returns:
+        bool: True si hay un despertar programado que ya vencio
+    """
+    proximo = ritmo_configs['proximo_despertar']
+    return proximo is not None and tiempo_actual >= proximo
+
+def obtener_eventos(reloj: pg.time.Clock) -> list:
+    """
+    Obtiene los eventos del frame respetando el ritmo: a los FPS completos con actividad,
+    o esperando el primer evento hasta un frame del ritmo de reposo cuando el juego esta inactivo.
+
+    Args:
+        reloj: Reloj del bucle principal
+
+    Returns:
+        list: Eventos de Pygame del frame
+    """
+    tiempo_actual = pg.time.get_ticks()
+
+    # Con un despertar vencido (por ejemplo el segundo del timer) el frame corre a ritmo completo, sin esperar
+    if not ritmo_configs['adaptativo'] or despertar_vencido(tiempo_actual) or hay_actividad(tiempo_actual):
+        ritmo_configs['en_reposo'] = False
+        eventos = pg.event.get()
+        reloj.tick(var.FPS)
+    else:
+        ritmo_configs['en_reposo'] = True
+        evento = pg.event.wait(calcular_espera_reposo(tiempo_actual))
+        eventos = [] if evento.type == pg.NOEVENT else [evento]
+        eventos.extend(pg.event.get())
+        reloj.tick()
+
+    # Un despertar programado solo necesita este frame; los eventos mantienen el ritmo completo un rato
+    tiempo_actual = pg.time.get_ticks()
+    if despertar_vencido(tiempo_actual):
+        ritmo_configs['proximo_despertar'] = None
+
+    if eventos:
+        ritmo_configs['ultima_actividad'] = tiempo_actual
+
+    return eventos
@@ -13,6 +13,11 @@ music_configs = {
     
 }
 
+sfx_configs = {
+    "sonidos": {},
+    "canal": None
+}
+
 def set_music_path(music_path: str) -> None:
     """
     Establece la ruta de la musica actual en la configuracion.
@@ -103,4 +108,57 @@ def is_music_enabled() -> bool:
     Returns:
         bool: True si la musica esta habilitada, False si esta deshabilitada
     """
-    return music_configs['music_enabled']
\ No newline at end of file
+    return music_configs['music_enabled']
+
+def reservar_canal_efectos(nro_canal: int) -> None:
+    """
+    Reserva un canal del mixer para los efectos de sonido, asi no compiten con otros sonidos.
+    
+    Args:
+        nro_canal: Numero de canal a reservar
+        
+    Returns:
+        None
+    """
+    if not mixer.get_init():
+        return
+    mixer.set_reserved(nro_canal + 1)
+    sfx_configs['canal'] = mixer.Channel(nro_canal)
+
+def cargar_efecto_sonido(sound_path: str) -> mixer.Sound:
+    """
+    Carga un efecto de sonido una sola vez y lo guarda en el pool de efectos.
+    
+    Args:
+        sound_path: Ruta del archivo de sonido
+        
+    Returns:
+        Sound: Sonido cargado, o None si el mixer no esta disponible o el archivo no se pudo leer
+    """
+    if sound_path not in sfx_configs['sonidos']:
+        sonido = None
+        if mixer.get_init():
+            try:
+                sonido = mixer.Sound(sound_path)
+            except (pg.error, FileNotFoundError) as error:
+                print(f'No se pudo cargar el sonido {sound_path}: {error}')
+        sfx_configs['sonidos'][sound_path] = sonido
+    return sfx_configs['sonidos'][sound_path]
+
+def play_efecto_sonido(sound_path: str) -> None:
+    """
+    Reproduce un efecto de sonido precargado en el canal reservado, cortando el efecto anterior si seguia sonando.
+    
+    Args:
+        sound_path: Ruta del archivo de sonido
+        
+    Returns:
+        None
+    """
+    sonido = cargar_efecto_sonido(sound_path)
+    if not sonido:
+        return
+    if sfx_configs['canal']:
+        sfx_configs['canal'].play(sonido)
+    else:
+        sonido.play()
@@ -9,6 +9,7 @@ import modules.auxiliar as aux
 import random as rd
 import modules.carta as carta
 import modules.particip_juego as particip_juego
+import modules.capa_cartas as capa_cartas
 
 def inicializar_stage(jugador: dict, pantalla: pg.Surface, nro_stage: int):
     """
@@ -60,6 +61,7 @@ def inicializar_stage(jugador: dict, pantalla: pg.Surface, nro_stage: int):
     stage_data['ganador'] = None
     stage_data['critical_hit_time'] = 0
     stage_data['critical_hit_duration'] = var.CRITICAL_HIT_DURATION
+    stage_data['capa_cartas'] = capa_cartas.crear_capa()
 
     return stage_data
 
@@ -261,8 +263,8 @@ def comparar_damage(stage_data: dict):
         atk_jugador_base = carta.get_atk_carta(carta_jugador)
         atk_enemigo_base = carta.get_atk_carta(carta_enemigo)
         
-        atk_jugador = carta.calcular_bonus_estrellas(carta_jugador, atk_jugador_base)
-        atk_enemigo = carta.calcular_bonus_estrellas(carta_enemigo, atk_enemigo_base)
+        atk_jugador = carta.get_atk_efectivo_carta(carta_jugador)
+        atk_enemigo = carta.get_atk_efectivo_carta(carta_enemigo)
         
         estrellas_j = carta.get_estrellas_carta(carta_jugador)
         estrellas_e = carta.get_estrellas_carta(carta_enemigo)
@@ -383,7 +385,7 @@ def obtener_ganador(stage_data: dict) -> bool:
 
 def draw_jugadores(stage_data: dict):
     """
-    Dibuja las cartas de ambos participantes en pantalla.
+    Dibuja las cartas de ambos participantes en pantalla a traves de la capa de cartas.
     
     Args:
         stage_data: Diccionario con los datos del nivel
@@ -392,8 +394,12 @@ def draw_jugadores(stage_data: dict):
         None: Dibuja los participantes en la pantalla
     """
     mouse_pos = pg.mouse.get_pos()
-    particip_juego.draw_participante(stage_data.get('jugador'), stage_data.get('screen'), mouse_pos)
-    particip_juego.draw_participante(stage_data.get('enemigo'), stage_data.get('screen'), mouse_pos)
+    cartas_en_mesa = (
+        particip_juego.get_cartas_en_mesa_participante(stage_data.get('jugador')) +
+        particip_juego.get_cartas_en_mesa_participante(stage_data.get('enemigo'))
+    )
+    capa_cartas.sincronizar_capa(stage_data.get('capa_cartas'), cartas_en_mesa, mouse_pos)
+    capa_cartas.draw_capa(stage_data.get('capa_cartas'), stage_data.get('screen'))
 
 
 def update(stage_data: dict):
@@ -9,22 +9,47 @@ import pygame as pg
 DIMENSION_PANTALLA = (1600, 900)
 TITULO_JUEGO = 'Dragon Ball Z TCG'
 FPS = 30
+FPS_ADAPTATIVO = True  # Bajar a FPS_INACTIVO cuando no hay entrada ni animaciones
+FPS_INACTIVO = 5
+FPS_GRACIA_MS = 500  # Tiempo a ritmo completo despues de la ultima entrada o animacion
+DIRTY_RECTS = False  # Redibujar y presentar solo las zonas de pantalla que cambiaron
+TECLA_HUD = pg.K_F3  # Muestra u oculta el panel de rendimiento
+HUD_MUESTRAS = 120  # Frames que se guardan para los percentiles y el grafico del panel
 dict_forms_status = {}
 STAGE_TIMER = 60
 JSON_CONFIGS = 'configs.json'
 JSON_INFO_CARDS = 'info_cartas.json'
 VOLUMEN_INICIAL = 50
 CANTIDAD_VIDAS = 3
+PRECARGA_HILOS = 4  # Hilos usados para leer y decodificar imagenes al iniciar
+ESCANER_PROCESOS = None  # Procesos usados para validar las imagenes de los mazos (None usa uno por nucleo)
+PRECARGAR_FONDOS_MENU = True  # Preparar los fondos de los formularios no construidos mientras el menu esta inactivo
 
 ########## Configuracion de Cartas ##########
 CARTA_SIZE_NORMAL = 50
 CARTA_SIZE_HOVER = 70
+CACHE_SUPERFICIES_MAX = 64  # Cantidad maxima de imagenes escaladas en cache
+CARTA_ZOOM_FRAMES = 6  # Frames de la animacion de zoom entre el tamanio normal y el hover
+CACHE_ZOOM_MEMORIA_MAX = 32 * 1024 * 1024  # Bytes maximos para los frames intermedios del zoom
+
+########## Calidad de Escalado ##########
+CALIDAD_RAPIDA = 'rapida'  # pg.transform.scale: vecino mas cercano, la mas barata
+CALIDAD_SUAVE = 'suave'  # pg.transform.smoothscale en el momento: mejor imagen, mas costo de CPU
+CALIDAD_PRECALCULADA = 'precalculada'  # Imagenes suavizadas por 'python -m modules.auxiliar bake'; sin hornear se usa la rapida
+CALIDAD_ESCALADO = {
+    "cartas": CALIDAD_PRECALCULADA,
+    "fondos": CALIDAD_PRECALCULADA,
+    "zoom": CALIDAD_SUAVE
+}
 
 ########## Sistema de Combate ##########
 CRITICAL_HIT_CHANCE = 0.25  # 25% de probabilidad
 CRITICAL_DAMAGE_MULTIPLIER = 5
 CRITICAL_HIT_DURATION = 1000  # milisegundos
 CRITICAL_EFFECT_SIZE = 400
+CRITICAL_EFFECT_FRAMES = 24  # Frames precalculados de la animacion del critico
+CRITICAL_EFFECT_ESCALA_INICIAL = 50  # Porcentaje del tamanio con el que aparece el efecto
+CANAL_EFECTOS = 0  # Canal del mixer reservado para los efectos de sonido
 
 ########## Interfaz ##########
 MAX_NAME_LENGTH = 6
@@ -32,6 +57,7 @@ PAUSE_VOLUME = 0.1
 
 ########## Fuentes ##########
 FONT_AKSARAKOMIK = 'assets/fonts/AksaraKomik-Regular.ttf'
+CACHE_TEXTOS_MAX = 256  # Cantidad maxima de textos renderizados en cache
 
 ########## FORMS ##########
 FORM_NAMES = {
@@ -43,7 +69,8 @@ FORM_NAMES = {
     'PAUSE': 'form_pause',
     'STAGE': 'form_stage',
     'NAME': 'form_name',
-    'WISH': 'form_wish'
+    'WISH': 'form_wish',
+    'CARGA': 'form_carga'
 }
 
 ########## Fondos de formularios ##########
@@ -56,6 +83,7 @@ FONDO_NAME = 'assets/img/background/victory.png'
 FONDO_WISH = 'assets/img/background/wish.png'
 FONDO_VICTORY = 'assets/img/background/victory.png'
 FONDO_DEFEAT = 'assets/img/background/defeat.png'
+FONDOS_FORMULARIOS = (FONDO_MENU, FONDO_RANKING, FONDO_OPTIONS, FONDO_PAUSE, FONDO_STAGE, FONDO_WISH, FONDO_VICTORY, FONDO_DEFEAT)
 CRITICAL_HIT = 'assets/img/fx/critico.png'
 
 ########## Imagenes Botones ##########
@@ -72,6 +100,16 @@ IMG_BTN_SHIELD = 'assets/img/buttons/boton-shield.png'
 
 ########## Archivos ##########
 RANKING_CSV = 'puntajes.csv'
+RUTA_IMAGENES = 'assets/img'
+RUTA_CACHE = 'cache'
+RUTA_ATLAS = 'cache/atlas'
+RUTA_HORNEADO = 'cache/horneado'
+RUTA_ALMACEN_CARTAS = 'cache/mazos'
+RUTA_BD_CARTAS = 'cache/bd_cartas'
+RUTA_REPORTE_INICIO = 'cache/perfil_inicio.json'
+ATLAS_ANCHO_MAX = 4096
+ALMACEN_CARTAS = 'mmap'  # 'mmap' mapea en memoria los pixeles de cada mazo, 'atlas' carga un atlas PNG por mazo
+USAR_HORNEADO = True  # Cargar las imagenes escaladas por 'python -m modules.auxiliar bake' cuando existan
 
 
 ########## Colores ##########
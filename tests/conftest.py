@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Los tests importan los modulos del juego como 'modules.<nombre>', igual que main.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Sin pantalla: los tests que usan la cola de eventos de Pygame corren con los drivers dummy de SDL
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
@@ -0,0 +1,137 @@
+import json
+import os
+import shutil
+import pygame as pg
+import pytest
+import modules.variables as var
+import modules.auxiliar as aux
+import modules.bd_cartas as bd_cartas
+
+TAMANIO_CARTA = (4, 6)
+CARTAS_AZUL = ('1_HP_100_ATK_200_DEF_300_1.png', '2_HP_110_ATK_210_DEF_310_2.png')
+CARTAS_ROJO = ('1_HP_400_ATK_500_DEF_600_3.png',)
+
+def crear_imagen(ruta: str):
+    pg.image.save(pg.Surface(TAMANIO_CARTA), ruta)
+
+def crear_mazo(ruta_mazos, nombre_mazo: str, archivos: tuple) -> str:
+    ruta_directorio = ruta_mazos / nombre_mazo
+    ruta_directorio.mkdir()
+    for archivo in archivos + ('reverse.png',):
+        crear_imagen(str(ruta_directorio / archivo))
+    return ruta_directorio.as_posix()
+
+def adelantar_fecha(ruta: str, segundos: int = 10):
+    # Los sistemas de archivos con fechas de baja resolucion pueden no notar un cambio hecho enseguida
+    estado = os.stat(ruta)
+    nueva_fecha = estado.st_mtime_ns + segundos * 1_000_000_000
+    os.utime(ruta, ns=(nueva_fecha, nueva_fecha))
+
+def guardar_info_cartas(cartas_por_mazo: dict):
+    with open(var.JSON_INFO_CARDS, 'w', encoding='utf-8') as file:
+        json.dump({'cartas': cartas_por_mazo}, file)
+
+@pytest.fixture
+def mazos(tmp_path, monkeypatch):
+    ruta_mazos = tmp_path / 'decks'
+    ruta_mazos.mkdir()
+    ruta_configs = tmp_path / 'configs.json'
+    ruta_configs.write_text(json.dumps({'nivel_1': {'ruta_mazo': ruta_mazos.as_posix()}}), encoding='utf-8')
+
+    monkeypatch.setattr(var, 'JSON_CONFIGS', ruta_configs.as_posix())
+    monkeypatch.setattr(var, 'JSON_INFO_CARDS', (tmp_path / 'info_cartas.json').as_posix())
+    monkeypatch.setattr(var, 'RUTA_BD_CARTAS', (tmp_path / 'bd_cartas').as_posix())
+
+    crear_mazo(ruta_mazos, 'azul', CARTAS_AZUL)
+    crear_mazo(ruta_mazos, 'rojo', CARTAS_ROJO)
+    return ruta_mazos
+
+def get_ids_fragmento(nombre_mazo: str) -> list[str]:
+    return [datos_card['id'] for datos_card in bd_cartas.cargar_fragmento(bd_cartas.cargar_indice(), nombre_mazo)]
+
+def test_mazos_nuevos_se_agregan_con_sus_cartas(mazos):
+    resumen = aux.actualizar_bd_cartas()
+
+    assert sorted(resumen['nuevos']) == ['azul', 'rojo']
+    assert resumen['modificados'] == [] and resumen['eliminados'] == [] and resumen['errores'] == []
+    assert get_ids_fragmento('azul') == ['1', '2']
+    cartas_rojo = bd_cartas.cargar_fragmento(bd_cartas.cargar_indice(), 'rojo')
+    assert cartas_rojo[0]['hp'] == 400 and cartas_rojo[0]['estrellas'] == 3
+    assert cartas_rojo[0]['ruta_reverso'] == f'{mazos.as_posix()}/rojo/reverse.png'
+
+def test_sin_cambios_no_regenera(mazos):
+    aux.actualizar_bd_cartas()
+    resumen = aux.actualizar_bd_cartas()
+
+    assert resumen['sin_cambios'] == 2
+    assert resumen['nuevos'] == [] and resumen['modificados'] == [] and resumen['eliminados'] == []
+
+def test_mazo_tocado_sin_cambios_de_contenido(mazos):
+    aux.actualizar_bd_cartas()
+    for archivo in CARTAS_AZUL:
+        adelantar_fecha(str(mazos / 'azul' / archivo))
+    adelantar_fecha(str(mazos / 'azul'))
+
+    resumen = aux.actualizar_bd_cartas()
+
+    assert resumen['sin_cambios'] == 2 and resumen['modificados'] == []
+    # El manifiesto guarda la fecha nueva, asi la proxima vez no se vuelven a calcular los hashes
+    manifiesto = bd_cartas.cargar_indice()['mazos']['azul']['manifiesto']
+    assert manifiesto['mtime_directorio'] == os.stat(mazos / 'azul').st_mtime_ns
+
+def test_mazo_modificado_se_regenera(mazos):
+    aux.actualizar_bd_cartas()
+    crear_imagen(str(mazos / 'azul' / '3_HP_120_ATK_220_DEF_320_1.png'))
+    adelantar_fecha(str(mazos / 'azul'))
+
+    resumen = aux.actualizar_bd_cartas()
+
+    assert resumen['modificados'] == ['azul'] and resumen['sin_cambios'] == 1
+    assert get_ids_fragmento('azul') == ['1', '2', '3']
+
+def test_mazo_borrado_se_elimina(mazos):
+    aux.actualizar_bd_cartas()
+    shutil.rmtree(mazos / 'rojo')
+
+    resumen = aux.actualizar_bd_cartas()
+
+    assert resumen['eliminados'] == ['rojo']
+    assert 'rojo' not in bd_cartas.cargar_indice()['mazos']
+    assert not os.path.exists(bd_cartas.get_ruta_fragmento('rojo.json'))
+
+def test_mazos_solo_del_json_se_mantienen(mazos):
+    cartas_por_mazo = aux.generar_bd_cartas(mazos.as_posix())['cartas']
+    cartas_por_mazo['dorado'] = [{'id': '9', 'atk': 1, 'def': 1, 'hp': 1, 'estrellas': 1, 'ruta_frente': 'x.png', 'ruta_reverso': ''}]
+    guardar_info_cartas(cartas_por_mazo)
+
+    resumen = aux.actualizar_bd_cartas()
+
+    assert resumen['eliminados'] == []
+    assert get_ids_fragmento('dorado') == ['9']
+
+def test_mazos_del_json_iguales_al_disco_no_cuentan_como_modificados(mazos):
+    guardar_info_cartas(aux.generar_bd_cartas(mazos.as_posix())['cartas'])
+
+    resumen = aux.actualizar_bd_cartas()
+    assert resumen['sin_cambios'] == 2 and resumen['modificados'] == [] and resumen['nuevos'] == []
+
+    # Si cambia la fecha de info_cartas.json la base se vuelve a armar y los mazos pierden su manifiesto
+    adelantar_fecha(var.JSON_INFO_CARDS)
+    resumen = aux.actualizar_bd_cartas()
+    assert resumen['sin_cambios'] == 2 and resumen['modificados'] == []
+
+    resumen = aux.actualizar_bd_cartas()
+    assert resumen['sin_cambios'] == 2 and resumen['modificados'] == []
+
+def test_mazo_del_json_distinto_al_disco_se_regenera(mazos):
+    cartas_por_mazo = aux.generar_bd_cartas(mazos.as_posix())['cartas']
+    cartas_por_mazo['azul'] = cartas_por_mazo['azul'][:1]
+    guardar_info_cartas(cartas_por_mazo)
+
+    resumen = aux.actualizar_bd_cartas()
+
+    assert resumen['modificados'] == ['azul'] and resumen['sin_cambios'] == 1
+    assert get_ids_fragmento('azul') == ['1', '2']
+
+def test_modo_paralelo_da_el_mismo_resultado(mazos):
+    assert aux.generar_bd_cartas(mazos.as_posix(), paralelo=True) == aux.generar_bd_cartas(mazos.as_posix())
@@ -0,0 +1,91 @@
+import random
+import sys
+import pygame as pg
+import pytest
+import modules.carta as carta
+import modules.estadisticas_mazo as estadisticas_mazo
+import modules.particip_juego as particip_juego
+
+@pytest.fixture(params=['numpy', 'array'])
+def modo(request, monkeypatch):
+    if request.param == 'numpy':
+        monkeypatch.setattr(estadisticas_mazo, 'np', pytest.importorskip('numpy'))
+    else:
+        monkeypatch.setattr(estadisticas_mazo, 'np', None)
+    return request.param
+
+def crear_cartas(cantidad: int, semilla: int = 317) -> list[carta.Carta]:
+    generador = random.Random(semilla)
+    return [
+        carta.inicializar_carta({
+            'id': str(indice),
+            'hp': generador.randint(0, 5000),
+            'atk': generador.randint(0, 5000),
+            'def': generador.randint(0, 5000),
+            'estrellas': generador.randint(0, 5)
+        }, [0, 0])
+        for indice in range(cantidad)
+    ]
+
+def sumar_cartas(cartas: list[carta.Carta]) -> dict:
+    return {
+        'hp': sum(carta.get_hp_carta(card) for card in cartas),
+        'atk': sum(carta.get_atk_carta(card) for card in cartas),
+        'def': sum(carta.get_def_carta(card) for card in cartas)
+    }
+
+def desglosar_cartas(cartas: list[carta.Carta]) -> dict:
+    desglose = {}
+    for card in sorted(cartas, key=carta.get_estrellas_carta):
+        grupo = desglose.setdefault(carta.get_estrellas_carta(card), {'cantidad': 0, 'hp': 0, 'atk': 0, 'def': 0})
+        grupo['cantidad'] += 1
+        grupo['hp'] += carta.get_hp_carta(card)
+        grupo['atk'] += carta.get_atk_carta(card)
+        grupo['def'] += carta.get_def_carta(card)
+    return desglose
+
+TAMANIOS_MAZO = [0, 1, 40, sys.getrecursionlimit() + 500]
+
+@pytest.mark.parametrize('cantidad_cartas', TAMANIOS_MAZO)
+def test_totales_coinciden_con_la_suma(modo, cantidad_cartas):
+    cartas = crear_cartas(cantidad_cartas)
+    estadisticas = estadisticas_mazo.crear_estadisticas_mazo(cartas)
+
+    totales = estadisticas_mazo.calcular_totales(estadisticas)
+
+    assert totales == sumar_cartas(cartas)
+    assert all(type(total) is int for total in totales.values())
+
+@pytest.mark.parametrize('cantidad_cartas', TAMANIOS_MAZO)
+def test_totales_de_las_primeras_cartas(modo, cantidad_cartas):
+    cartas = crear_cartas(cantidad_cartas)
+    estadisticas = estadisticas_mazo.crear_estadisticas_mazo(cartas)
+
+    for cantidad in {0, cantidad_cartas // 3, cantidad_cartas}:
+        assert estadisticas_mazo.calcular_totales(estadisticas, cantidad) == sumar_cartas(cartas[:cantidad])
+
+@pytest.mark.parametrize('cantidad_cartas', TAMANIOS_MAZO)
+def test_desglose_estrellas_coincide_con_la_suma(modo, cantidad_cartas):
+    cartas = crear_cartas(cantidad_cartas)
+    estadisticas = estadisticas_mazo.crear_estadisticas_mazo(cartas)
+
+    desglose = estadisticas_mazo.calcular_desglose_estrellas(estadisticas)
+
+    assert desglose == desglosar_cartas(cartas)
+    assert list(desglose) == sorted(desglose)
+
+def test_stats_restantes_despues_de_jugar_cartas(modo):
+    cartas = crear_cartas(sys.getrecursionlimit() + 500)
+    participante = particip_juego.inicializar_participante(pantalla=pg.Surface((1, 1)), nombre='TEST')
+    particip_juego.set_cartas_participante(participante, cartas)
+    particip_juego.asignar_stats_iniciales_participante(participante)
+
+    assert particip_juego.get_stats_restantes_participante(participante) == sumar_cartas(cartas)
+
+    # Las cartas se juegan desde el final del mazo
+    for _ in range(25):
+        participante.get('cartas_mazo').pop()
+
+    assert particip_juego.get_stats_restantes_participante(participante) == sumar_cartas(cartas[:-25])
+    assert particip_juego.get_desglose_estrellas_participante(participante) == desglosar_cartas(cartas)
+    assert participante.get('hp_inicial') == sumar_cartas(cartas)['hp']
@@ -0,0 +1,53 @@
+import time
+import pygame as pg
+import pytest
+import modules.ritmo as ritmo
+
+@pytest.fixture
+def reposo(monkeypatch):
+    pg.init()
+    pg.display.set_mode((1, 1))
+    pg.event.clear()
+    monkeypatch.setitem(ritmo.ritmo_configs, 'adaptativo', True)
+    monkeypatch.setitem(ritmo.ritmo_configs, 'animacion_pendiente', False)
+    monkeypatch.setitem(ritmo.ritmo_configs, 'proximo_despertar', None)
+    # Sin actividad desde hace rato: el bucle esta en condiciones de entrar en reposo
+    monkeypatch.setitem(ritmo.ritmo_configs, 'ultima_actividad', pg.time.get_ticks() - 10_000)
+
+    esperas = []
+    wait_original = pg.event.wait
+    def wait_registrado(timeout: int = 0):
+        esperas.append(timeout)
+        # pg.event.wait(0) espera sin limite: aca fallaria en lugar de colgar el test
+        assert timeout > 0
+        return wait_original(timeout)
+    monkeypatch.setattr(pg.event, 'wait', wait_registrado)
+
+    yield esperas
+    pg.quit()
+
+def test_despertar_vencido_no_bloquea(reposo):
+    ritmo.programar_despertar(pg.time.get_ticks() - 50)
+
+    inicio = time.perf_counter()
+    eventos = ritmo.obtener_eventos(pg.time.Clock())
+
+    assert eventos == []
+    assert time.perf_counter() - inicio < 0.5
+    assert reposo == []
+    assert not ritmo.esta_en_reposo()
+    assert ritmo.ritmo_configs['proximo_despertar'] is None
+
+def test_despertar_cercano_acorta_la_espera(reposo):
+    ritmo.programar_despertar(pg.time.get_ticks() + 20)
+
+    ritmo.obtener_eventos(pg.time.Clock())
+
+    assert ritmo.esta_en_reposo()
+    assert len(reposo) == 1 and 1 <= reposo[0] <= 20
+
+def test_espera_de_reposo_nunca_es_cero(reposo):
+    tiempo_actual = pg.time.get_ticks()
+    ritmo.programar_despertar(tiempo_actual - 1000)
+
+    assert ritmo.calcular_espera_reposo(tiempo_actual) >= 1